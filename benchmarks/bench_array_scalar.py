@@ -0,0 +1,44 @@
+"""
+Validates and serializes large arrays of numbers, the elements are stored in
+a typed array and checked against the element template in bulk.
+
+    python -m benchmarks.bench_array_scalar
+"""
+from __future__ import print_function
+
+import random
+import sys
+import timeit
+
+from prestans import types
+
+
+def main(number=5):
+
+    print("%8s %-8s %16s %16s %14s" % ("elements", "type", "validate (ms)", "serialize (ms)", "storage (kB)"))
+
+    for count in [1000, 100000, 1000000]:
+
+        for label, template, values in [
+            ("integer", types.Integer(minimum=0, maximum=1000), [random.randint(0, 1000) for _ in range(count)]),
+            ("float", types.Float(minimum=0.0), [random.random() for _ in range(count)]),
+            ("boolean", types.Boolean(), [random.random() > 0.5 for _ in range(count)])
+        ]:
+            array = types.Array(element_template=template)
+
+            validate = timeit.timeit(lambda: array.validate(values), number=number)
+
+            validated = array.validate(values)
+            serialize = timeit.timeit(validated.as_serializable, number=number)
+
+            print("%8i %-8s %16.2f %16.2f %14.1f" % (
+                count,
+                label,
+                validate / number * 1e3,
+                serialize / number * 1e3,
+                sys.getsizeof(validated._array_elements) / 1024.0
+            ))
+
+
+if __name__ == "__main__":
+    main()
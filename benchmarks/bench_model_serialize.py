@@ -0,0 +1,81 @@
+"""
+Compares generated Model serializers against the interpreted
+Model.as_serializable on arrays of models.
+
+    python -m benchmarks.bench_model_serialize
+"""
+from __future__ import print_function
+
+import timeit
+
+from prestans import types
+
+
+class Address(types.Model):
+    street = types.String()
+    city = types.String()
+    postcode = types.Integer()
+
+
+class User(types.Model):
+    first_name = types.String()
+    last_name = types.String()
+    email_address = types.String()
+    age = types.Integer()
+    rating = types.Float()
+    active = types.Boolean()
+    created = types.DateTime()
+    address = Address()
+
+
+def make_users(count):
+
+    import datetime
+
+    users = types.Array(element_template=User())
+
+    for index in range(count):
+        users.append(User(
+            first_name="first",
+            last_name="last",
+            email_address="user%i@example.com" % index,
+            age=index % 90,
+            rating=4.5,
+            active=True,
+            created=datetime.datetime(2020, 1, 1),
+            address=Address(street="1 Main Street", city="Sydney", postcode=2000)
+        ))
+
+    return users
+
+
+def main(number=5):
+
+    print("%8s %-10s %18s %18s %8s" % ("models", "filter", "interpreted (ms)", "compiled (ms)", "speedup"))
+
+    for count in [100, 1000, 10000]:
+
+        users = make_users(count)
+
+        partial_filter = User().get_attribute_filter(True)
+        partial_filter.email_address = False
+        partial_filter.address.postcode = False
+
+        for label, attribute_filter, minified in [
+            ("none", None, False),
+            ("partial", partial_filter.as_immutable(), False),
+            ("minified", None, True)
+        ]:
+            types.Model.__compiled_serialization__ = False
+            interpreted = timeit.timeit(lambda: users.as_serializable(attribute_filter, minified), number=number)
+
+            types.Model.__compiled_serialization__ = True
+            compiled = timeit.timeit(lambda: users.as_serializable(attribute_filter, minified), number=number)
+
+            print("%8i %-10s %18.2f %18.2f %7.1fx" % (
+                count, label, interpreted / number * 1e3, compiled / number * 1e3, interpreted / compiled
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compares generated Model validators against the interpreted Model.validate
+on nested payloads of increasing depth.
+
+    python -m benchmarks.bench_model_validate
+"""
+from __future__ import print_function
+
+import timeit
+
+from prestans import types
+
+
+class Leaf(types.Model):
+    name = types.String(max_length=50)
+    code = types.String(format=r"^[A-Z]{3}$")
+    quantity = types.Integer(minimum=0)
+    price = types.Float(minimum=0.0)
+    active = types.Boolean(default=True)
+    note = types.String(required=False)
+
+
+def make_model(depth):
+    """
+    :return: a Model class nesting depth levels of children above Leaf
+    """
+
+    model_class = Leaf
+
+    for level in range(depth):
+        model_class = type("Level%i" % level, (types.Model,), {
+            "title": types.String(),
+            "position": types.Integer(),
+            "child": model_class(),
+            "children": types.Array(element_template=model_class(), required=False)
+        })
+
+    return model_class
+
+
+def make_payload(depth, width):
+
+    payload = {"name": "widget", "code": "ABC", "quantity": 3, "price": 9.95, "note": None}
+
+    for level in range(depth):
+        payload = {
+            "title": "level %i" % level,
+            "position": level,
+            "child": payload,
+            "children": [payload] * width
+        }
+
+    return payload
+
+
+def main(number=20):
+
+    print("%6s %6s %18s %18s %8s" % ("depth", "width", "interpreted (ms)", "compiled (ms)", "speedup"))
+
+    for depth, width in [(1, 10), (2, 10), (3, 5), (4, 3)]:
+
+        template = make_model(depth)()
+        payload = make_payload(depth, width)
+
+        types.Model.__compiled_validation__ = False
+        interpreted = timeit.timeit(lambda: template.validate(payload), number=number)
+
+        types.Model.__compiled_validation__ = True
+        compiled = timeit.timeit(lambda: template.validate(payload), number=number)
+
+        print("%6i %6i %18.2f %18.2f %7.1fx" % (
+            depth, width, interpreted / number * 1e3, compiled / number * 1e3, interpreted / compiled
+        ))
+
+
+if __name__ == "__main__":
+    main()
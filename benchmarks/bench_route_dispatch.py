@@ -0,0 +1,60 @@
+"""
+Compares the RouteTrie dispatcher against a linear scan of the route map. Small
+route maps, the common case, must not be slower than the scan; see RouteTrie.MIN_ROUTES.
+
+    python -m benchmarks.bench_route_dispatch
+"""
+from __future__ import print_function
+
+import timeit
+
+from prestans.rest import RequestRouter
+from prestans.rest import RouteTrie
+
+
+class _Handler(object):
+    pass
+
+
+def linear_match(route_map, path):
+    for regexp, handler_class in route_map:
+        match = regexp.match(path)
+        if match:
+            return regexp, handler_class, match
+    return None
+
+
+def make_routes(count):
+    routes = []
+    for index in range(count // 2):
+        routes.append((r"/api/resource%i" % index, _Handler))
+        routes.append((r"/api/resource%i/([0-9]+)" % index, _Handler))
+    return routes
+
+
+def main(number=2000):
+
+    print("%8s %-10s %14s %14s %8s" % ("routes", "path", "linear (us)", "trie (us)", "speedup"))
+
+    for count in [4, 10, 100, 1000]:
+
+        route_map = RequestRouter.generate_route_map(make_routes(count))
+        route_trie = RouteTrie(route_map)
+
+        paths = {
+            "first": "/api/resource0",
+            "last": "/api/resource%i/42" % (count // 2 - 1),
+            "404": "/api/missing"
+        }
+
+        for label, path in sorted(paths.items()):
+            linear = timeit.timeit(lambda: linear_match(route_map, path), number=number)
+            trie = timeit.timeit(lambda: route_trie.match(path), number=number)
+
+            print("%8i %-10s %14.2f %14.2f %7.1fx" % (
+                count, label, linear / number * 1e6, trie / number * 1e6, linear / trie
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Times validate for each scalar type on valid input, String, Integer, Float
+and Boolean run the validate function compiled from their constraints.
+
+    python -m benchmarks.bench_scalar_validate
+"""
+from __future__ import print_function
+
+import datetime
+import timeit
+
+from prestans import types
+
+
+CASES = [
+    ("String", types.String(), "alice"),
+    ("String format", types.String(format=r"^[a-z]+@[a-z]+\.com$"), "alice@example.com"),
+    ("String choices", types.String(choices=["draft", "review", "published", "archived"]), "archived"),
+    ("String default", types.String(default="draft", max_length=10), None),
+    ("Integer", types.Integer(minimum=0, maximum=100), 42),
+    ("Integer parse", types.Integer(), "42"),
+    ("Integer choices", types.Integer(choices=list(range(20))), 19),
+    ("Float", types.Float(minimum=0.0, maximum=1.0), 0.5),
+    ("Boolean", types.Boolean(), True),
+    ("Date", types.Date(), datetime.date(2020, 1, 1)),
+    ("DateTime", types.DateTime(), datetime.datetime(2020, 1, 1, 10)),
+    ("Time", types.Time(), datetime.time(10))
+]
+
+
+def main(number=200000):
+
+    print("%-16s %12s" % ("type", "ns per call"))
+
+    for label, template, value in CASES:
+        elapsed = timeit.timeit(lambda: template.validate(value), number=number)
+        print("%-16s %12.0f" % (label, elapsed / number * 1e9))
+
+
+if __name__ == "__main__":
+    main()
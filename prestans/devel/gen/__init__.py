@@ -68,7 +68,7 @@ class Inspector(object):
 
             blueprint = type_instance().blueprint()
             for field_name, field_blueprint in iter(blueprint['fields'].items()):
-                field_blueprint['map_name'] = type_instance().attribute_rewrite_map()[field_name]
+                field_blueprint['map_name'] = blueprint['rewrite_map'][field_name]
             blueprints.append(blueprint)
 
         return blueprints
@@ -38,10 +38,13 @@ from prestans import types
 
 class ModelAdapter(object):
     
-    def __init__(self, rest_model_class, persistent_model_class):
+    def __init__(self, rest_model_class, persistent_model_class, trusted=False):
         """
         :param rest_model_class:
         :param persistent_model_class:
+        :param trusted: True to copy attribute values without validating them, see
+        prestans.types.Model.from_trusted
+        :type trusted: bool
         """
 
         if issubclass(rest_model_class, types.Model):
@@ -50,10 +53,15 @@ class ModelAdapter(object):
             raise TypeError("rest_model_class must be sub class of prestans.types.Model")
 
         self._persistent_model_class = persistent_model_class
+        self._trusted = trusted
 
     @property
     def persistent_model_class(self):
         return self._persistent_model_class
+
+    @property
+    def trusted(self):
+        return self._trusted
     
     @property
     def rest_model_class(self):
@@ -69,15 +77,13 @@ class ModelAdapter(object):
 
         rest_model_instance = self.rest_model_class()
 
-        for attribute_key in rest_model_instance.get_attribute_keys():
+        for attribute_key, rest_attr in self.rest_model_class.__model_fields__:
 
             # attribute is not visible don't bother processing
             if isinstance(attribute_filter, (parser.AttributeFilter, parser.AttributeFilterImmutable)) and \
                not attribute_filter.is_attribute_visible(attribute_key):
                 continue
 
-            rest_attr = getattr(self.rest_model_class, attribute_key)
-
             # don't bother processing if the persistent model doesn't have this attribute
             if not hasattr(persistent_object, attribute_key):
 
@@ -101,6 +107,14 @@ class ModelAdapter(object):
             elif isinstance(rest_attr, types.Array):
 
                 persistent_attr_value = getattr(persistent_object, attribute_key)
+
+                if self._trusted and rest_attr.is_scalar:
+                    try:
+                        rest_model_instance._set_trusted(attribute_key, persistent_attr_value)
+                    except exception.ValidationError as exp:
+                        raise exception.InconsistentPersistentDataError(attribute_key, str(exp))
+                    continue
+
                 rest_model_array_handle = getattr(rest_model_instance, attribute_key)
 
                 # iterator uses the .append method exposed by prestans arrays to validate
@@ -155,7 +169,11 @@ class ModelAdapter(object):
                 # otherwise copy the value to the rest model
                 try:
                     persistent_attr_value = getattr(persistent_object, attribute_key)
-                    setattr(rest_model_instance, attribute_key, persistent_attr_value)
+
+                    if self._trusted:
+                        rest_model_instance._set_trusted(attribute_key, persistent_attr_value)
+                    else:
+                        setattr(rest_model_instance, attribute_key, persistent_attr_value)
                 except TypeError as exp:
                     raise TypeError('Attribute %s, %s' % (attribute_key, str(exp)))
                 except exception.ValidationError as exp:
@@ -281,14 +299,17 @@ class AdapterRegistryManager(object):
         self._persistent_map[persistent_class_signature][self.DEFAULT_REST_ADAPTER] = model_adapter
         self._persistent_map[persistent_class_signature][rest_class_signature] = model_adapter
 
-    def register_persistent_rest_pair(self, persistent_model_class, rest_model_class):
+    def register_persistent_rest_pair(self, persistent_model_class, rest_model_class, trusted=False):
         """
         :param persistent_model_class:
         :param rest_model_class:
+        :param trusted: True if values read from persistent_model_class need not be validated
+        :type trusted: bool
         """
         self.register_adapter(ModelAdapter(
             rest_model_class=rest_model_class,
-            persistent_model_class=persistent_model_class
+            persistent_model_class=persistent_model_class,
+            trusted=trusted
         ))
 
     def clear_registered_adapters(self):
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+#
+#  prestans, A WSGI compliant REST micro-framework
+#  http://prestans.org
+#
+#  Copyright (c) 2017, Anomaly Software Pty Ltd.
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#      * Redistributions of source code must retain the above copyright
+#        notice, this list of conditions and the following disclaimer.
+#      * Redistributions in binary form must reproduce the above copyright
+#        notice, this list of conditions and the following disclaimer in the
+#        documentation and/or other materials provided with the distribution.
+#      * Neither the name of Anomaly Software nor the
+#        names of its contributors may be used to endorse or promote products
+#        derived from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+#  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+#  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL ANOMALY SOFTWARE BE LIABLE FOR ANY
+#  DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+#  (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+#  ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+#  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+from bisect import bisect_left
+import threading
+import weakref
+
+__all__ = ['Counter', 'Histogram', 'MetricsRegistry']
+
+
+class _Metric(object):
+    """
+    Values are kept in one shard per thread so that updates never take a lock
+    or contend with other threads; a lock is only taken the first time a thread
+    updates the metric and when the shards are merged for collection.
+
+    The shards of threads that have exited are folded into a single retired
+    shard at those points, so the number of shards follows the live threads.
+    """
+
+    type_name = None
+
+    def __init__(self, name, documentation, label_names):
+
+        self._name = name
+        self._documentation = documentation
+        self._label_names = tuple(label_names)
+
+        self._local = threading.local()
+        self._shards = []
+        self._retired = {}
+        self._lock = threading.Lock()
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def documentation(self):
+        return self._documentation
+
+    @property
+    def label_names(self):
+        return self._label_names
+
+    def _shard(self):
+
+        shard = getattr(self._local, "shard", None)
+
+        if shard is None:
+            shard = self._local.shard = {}
+
+            with self._lock:
+                self._retire_shards()
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+
+        return shard
+
+    def _retire_shards(self):
+        """
+        Folds the shards of threads that have exited into the retired shard,
+        called with the lock held
+        """
+
+        live_shards = []
+        retired = self._retired
+
+        for thread_ref, shard in self._shards:
+            thread = thread_ref()
+
+            if thread is not None and thread.is_alive():
+                live_shards.append((thread_ref, shard))
+                continue
+
+            # the owning thread is gone so the shard can no longer change
+            for label_values, value in shard.items():
+                retired[label_values] = self._merge(retired.get(label_values), value)
+
+        self._shards = live_shards
+
+    def _merge(self, total, value):
+        """
+        :return: a new value combining total, None if absent, with value
+        """
+        raise NotImplementedError
+
+    def _shard_items(self):
+
+        with self._lock:
+            self._retire_shards()
+            shards = [shard for thread_ref, shard in self._shards]
+            shards.append(dict(self._retired))
+
+        for shard in shards:
+            # copied in a single step as the owning thread may be adding labels
+            for item in list(shard.items()):
+                yield item
+
+    def _format_labels(self, label_values, extra=None):
+
+        labels = list(zip(self._label_names, label_values))
+        if extra is not None:
+            labels.append(extra)
+
+        if not labels:
+            return ""
+
+        return "{%s}" % ",".join('%s="%s"' % (
+            name,
+            str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        ) for name, value in labels)
+
+    def exposition(self):
+        """
+        :return: the metric in the Prometheus text exposition format
+        :rtype: str
+        """
+
+        lines = [
+            "# HELP %s %s" % (self._name, self._documentation),
+            "# TYPE %s %s" % (self._name, self.type_name)
+        ]
+        lines.extend(self._samples())
+
+        return "\n".join(lines) + "\n"
+
+    def _samples(self):
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing value per combination of label values
+    """
+
+    type_name = "counter"
+
+    def inc(self, label_values=(), amount=1):
+        """
+        :param label_values: tuple of values in the order of label_names
+        :type label_values: tuple
+        """
+
+        shard = self._shard()
+        shard[label_values] = shard.get(label_values, 0) + amount
+
+    def _merge(self, total, value):
+        return value if total is None else total + value
+
+    def value(self, label_values=()):
+        return sum(value for labels, value in self._shard_items() if labels == label_values)
+
+    def collect(self):
+        """
+        :return: label values mapped to the total of all threads
+        :rtype: dict
+        """
+
+        totals = {}
+        for label_values, value in self._shard_items():
+            totals[label_values] = totals.get(label_values, 0) + value
+
+        return totals
+
+    def _samples(self):
+
+        for label_values, value in sorted(self.collect().items()):
+            yield "%s%s %s" % (self._name, self._format_labels(label_values), _format_value(value))
+
+
+class Histogram(_Metric):
+    """
+    Counts observations into fixed buckets per combination of label values
+    """
+
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, label_names, buckets):
+
+        super(Histogram, self).__init__(name, documentation, label_names)
+
+        self._buckets = tuple(sorted(buckets))
+
+    @property
+    def buckets(self):
+        return self._buckets
+
+    def observe(self, value, label_values=()):
+        """
+        :param value: the observed value, e.g. seconds or bytes
+        :param label_values: tuple of values in the order of label_names
+        :type label_values: tuple
+        """
+
+        shard = self._shard()
+
+        # one count per bucket plus +Inf, followed by the running sum
+        counts = shard.get(label_values)
+        if counts is None:
+            counts = shard[label_values] = [0] * (len(self._buckets) + 2)
+
+        # collect copies the list without a lock, the sum is updated first so a
+        # copy never counts an observation that is missing from the sum
+        counts[-1] += value
+        counts[bisect_left(self._buckets, value)] += 1
+
+    def _merge(self, total, value):
+
+        if total is None:
+            return list(value)
+
+        return [count + other for count, other in zip(total, value)]
+
+    def collect(self):
+        """
+        :return: label values mapped to (cumulative bucket counts, count, sum) of all threads
+        :rtype: dict
+        """
+
+        merged = {}
+        for label_values, counts in self._shard_items():
+            totals = merged.get(label_values)
+            if totals is None:
+                merged[label_values] = list(counts)
+            else:
+                for index, count in enumerate(counts):
+                    totals[index] += count
+
+        collected = {}
+        for label_values, counts in merged.items():
+
+            cumulative = []
+            running = 0
+            for count in counts[:-1]:
+                running += count
+                cumulative.append(running)
+
+            collected[label_values] = (cumulative, running, counts[-1])
+
+        return collected
+
+    def _samples(self):
+
+        upper_bounds = [_format_value(bucket) for bucket in self._buckets] + ["+Inf"]
+
+        for label_values, (cumulative, count, total) in sorted(self.collect().items()):
+
+            for upper_bound, bucket_count in zip(upper_bounds, cumulative):
+                yield "%s_bucket%s %d" % (
+                    self._name,
+                    self._format_labels(label_values, ("le", upper_bound)),
+                    bucket_count
+                )
+
+            labels = self._format_labels(label_values)
+            yield "%s_count%s %d" % (self._name, labels, count)
+            yield "%s_sum%s %s" % (self._name, labels, _format_value(total))
+
+
+def _format_value(value):
+    return repr(float(value))
+
+
+class MetricsRegistry(object):
+    """
+    MetricsRegistry holds the counters and histograms of a process. Pass one to
+    RequestRouter to have it count requests per handler, verb and status, time
+    them and record payload sizes; MetricsHandler serves the registry to a
+    Prometheus scraper.
+
+        metrics = MetricsRegistry()
+
+        api = RequestRouter([
+            (r"/metrics", MetricsHandler),
+            ...
+        ], metrics=metrics)
+    """
+
+    DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name, documentation, label_names=()):
+        """
+        :return: the counter registered under name, created on first use
+        :rtype: Counter
+        """
+        return self._register(Counter, name, documentation, label_names)
+
+    def histogram(self, name, documentation, label_names=(), buckets=DURATION_BUCKETS):
+        """
+        :return: the histogram registered under name, created on first use
+        :rtype: Histogram
+        """
+        return self._register(Histogram, name, documentation, label_names, buckets)
+
+    def _register(self, metric_class, name, documentation, label_names, *args):
+
+        metric = self._metrics.get(name)
+
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = metric_class(name, documentation, label_names, *args)
+
+        if not isinstance(metric, metric_class) or metric.label_names != tuple(label_names):
+            raise ValueError("metric %s is already registered as a %s with labels %s" % (
+                name,
+                metric.type_name,
+                ", ".join(metric.label_names)
+            ))
+
+        return metric
+
+    def get(self, name):
+        """
+        :return: the metric registered under name or None
+        """
+        return self._metrics.get(name)
+
+    def exposition(self):
+        """
+        :return: all metrics in the Prometheus text exposition format
+        :rtype: str
+        """
+
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+
+        return "".join(metric.exposition() for name, metric in metrics)
@@ -3,11 +3,17 @@ __all__ = [
     'VerbConfig',
     'AttributeFilter',
     'AttributeFilterImmutable',
-    'ParameterSet'
+    'ParameterSet',
+    'PaginationParameterSet',
+    'Page',
+    'paginate'
 ]
 
 from prestans.parser.attribute_filter import AttributeFilter
 from prestans.parser.attribute_filter_immutable import AttributeFilterImmutable
 from prestans.parser.config import Config
 from prestans.parser.parameter_set import ParameterSet
+from prestans.parser.pagination import PaginationParameterSet
+from prestans.parser.pagination import Page
+from prestans.parser.pagination import paginate
 from prestans.parser.verb_config import VerbConfig
@@ -8,6 +8,7 @@ class AttributeFilterImmutable(object):
         """
         self._key_map = dict()
         self._visible_keys = set()
+        self._shape = None
 
         self._populate_from_filter(attribute_filter)
 
@@ -26,6 +27,20 @@ class AttributeFilterImmutable(object):
     def keys(self):
         return sorted(self._key_map.keys())
 
+    def _shape_key(self):
+        """
+        :return: hashable description of the visible keys and nested filters, equal
+        for filters that hide the same attributes; computed once as the filter can't change
+        """
+
+        if self._shape is None:
+            self._shape = tuple(sorted(
+                (key, key in self._visible_keys, value._shape_key() if isinstance(value, self.__class__) else value)
+                for key, value in self._key_map.items()
+            ))
+
+        return self._shape
+
     def __contains__(self, key):
         return key in self._key_map
 
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+#  prestans, A WSGI compliant REST micro-framework
+#  http://prestans.org
+#
+#  Copyright (c) 2017, Anomaly Software Pty Ltd.
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#      * Redistributions of source code must retain the above copyright
+#        notice, this list of conditions and the following disclaimer.
+#      * Redistributions in binary form must reproduce the above copyright
+#        notice, this list of conditions and the following disclaimer in the
+#        documentation and/or other materials provided with the distribution.
+#      * Neither the name of Anomaly Software nor the
+#        names of its contributors may be used to endorse or promote products
+#        derived from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+#  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+#  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL ANOMALY SOFTWARE BE LIABLE FOR ANY
+#  DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+#  (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+#  ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+#  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+from prestans.parser.parameter_set import ParameterSet
+from prestans.types import Integer
+
+
+class PaginationParameterSet(ParameterSet):
+    """
+    offset and limit GET parameters for paginate, subclass to change the
+    default or maximum page size or to add parameters of your own
+    """
+
+    offset = Integer(required=False, default=0, minimum=0, description="index of the first element")
+    limit = Integer(required=False, default=100, minimum=1, maximum=1000, description="number of elements")
+
+
+class Page(object):
+    """
+    A window of an Array as returned by paginate along with its paging
+    metadata
+    """
+
+    def __init__(self, elements, offset, limit, total):
+        """
+        :param elements: the elements of the page
+        :type elements: prestans.types.ArrayView
+        :param offset: index of the first element
+        :type offset: int
+        :param limit: the requested number of elements, None for all remaining elements
+        :type limit: int | None
+        :param total: number of elements in the paginated array
+        :type total: int
+        """
+
+        self._elements = elements
+        self._offset = offset
+        self._limit = limit
+        self._total = total
+
+    @property
+    def elements(self):
+        return self._elements
+
+    @property
+    def offset(self):
+        return self._offset
+
+    @property
+    def limit(self):
+        return self._limit
+
+    @property
+    def total(self):
+        return self._total
+
+    @property
+    def next_offset(self):
+        """
+        :return: offset of the following page, None if this is the last page
+        :rtype: int | None
+        """
+
+        next_offset = self._offset + len(self._elements)
+        return next_offset if next_offset < self._total else None
+
+    @property
+    def previous_offset(self):
+        """
+        :return: offset of the preceding page, None if this is the first page
+        :rtype: int | None
+        """
+
+        if self._offset == 0:
+            return None
+
+        if self._limit is None:
+            return 0
+
+        return max(0, min(self._offset, self._total) - self._limit)
+
+
+def paginate(array, parameter_set):
+    """
+    Pages through an Array without copying it, e.g. to serve pages of a
+    cached result:
+
+        page = parser.paginate(cached_users, self.request.parameter_set)
+        self.response.headers["X-Total-Count"] = str(page.total)
+        self.response.body = page.elements
+
+    :param array: the array to paginate
+    :type array: prestans.types.Array
+    :param parameter_set: validated parameter set with offset and limit attributes,
+    e.g. a PaginationParameterSet; None values start at the first element and run
+    to the last respectively
+    :type parameter_set: prestans.parser.ParameterSet
+    :rtype: Page
+    """
+
+    offset = getattr(parameter_set, "offset", None) or 0
+    limit = getattr(parameter_set, "limit", None)
+
+    if offset < 0:
+        raise ValueError("offset must not be negative; %i given" % offset)
+
+    if limit is not None and limit < 0:
+        raise ValueError("limit must not be negative; %i given" % limit)
+
+    stop = None if limit is None else offset + limit
+    return Page(array.view(offset, stop), offset, limit, len(array))
@@ -13,7 +13,8 @@ class VerbConfig(object):
     """
 
     def __init__(self, response_template=None, response_attribute_filter_default_value=False,
-                 parameter_sets=None, body_template=None, request_attribute_filter=None):
+                 parameter_sets=None, body_template=None, request_attribute_filter=None, partial_body=False,
+                 lazy_body=False):
 
         """
         Each handler has a meta attribute called __verb_config__ this must be an instance
@@ -38,6 +39,13 @@ class VerbConfig(object):
         * request_attribute_filter is an attribute filter used to relax or tighten
           rules for the incoming data. This is particularly useful if you want
           to use portions of a model. Particularly useful for UPDATE requests.
+        * partial_body set to True to validate only the attributes present in the
+          body, nested Models included, e.g. for PATCH requests. The parsed body
+          reports the attributes that were supplied through
+          get_supplied_attribute_keys.
+        * lazy_body set to True to validate nested Models and Arrays of the body when
+          the handler first accesses them, validation errors are raised at that
+          point. Call validate_all on the parsed body to validate the remainder.
         """
         from prestans.parser import AttributeFilter
         from prestans.parser import ParameterSet
@@ -92,6 +100,12 @@ class VerbConfig(object):
 
         self._request_attribute_filter = request_attribute_filter
 
+        if partial_body and lazy_body:
+            raise ValueError("partial_body and lazy_body can't be combined")
+
+        self._partial_body = partial_body
+        self._lazy_body = lazy_body
+
     def blueprint(self):
 
         verb_config_blueprint = dict()
@@ -116,6 +130,9 @@ class VerbConfig(object):
         else:
             verb_config_blueprint['request_attribute_filter'] = self._request_attribute_filter
 
+        verb_config_blueprint['partial_body'] = self._partial_body
+        verb_config_blueprint['lazy_body'] = self._lazy_body
+
         return verb_config_blueprint
 
     @property
@@ -141,3 +158,11 @@ class VerbConfig(object):
     @property
     def request_attribute_filter(self):
         return self._request_attribute_filter
+
+    @property
+    def partial_body(self):
+        return self._partial_body
+
+    @property
+    def lazy_body(self):
+        return self._lazy_body
@@ -33,6 +33,7 @@
 from functools import wraps
 
 import prestans.exception
+from prestans.provider import context
 
 
 class Base(object):
@@ -45,7 +46,10 @@ class Base(object):
 
     @property
     def debug(self):
-        """Getter for debug property"""
+        """Getter for debug property, the router's setting while serving a request"""
+        request_context = context.current()
+        if request_context is not None:
+            return request_context.debug
         return self._debug
 
     @debug.setter
@@ -55,7 +59,10 @@ class Base(object):
 
     @property
     def request(self):
-        """Getter for request property"""
+        """Getter for request property, the request being served by this thread or coroutine"""
+        request_context = context.current()
+        if request_context is not None:
+            return request_context.request
         return self._request
 
     @request.setter
@@ -95,7 +102,8 @@ def login_required(http_method_handler):
     auth_context_handler instance provides a message called get_current_user, use this
     to obtain a reference to an authenticated user profile.
 
-    If all goes well, the original handler definition is executed.
+    If all goes well, the original handler definition is executed. The result of the
+    handler is returned so that async def handlers can be awaited by prestans.
     """
 
     @wraps(http_method_handler)
@@ -112,7 +120,7 @@ def login_required(http_method_handler):
             authentication_error.request = self.request
             raise authentication_error
 
-        http_method_handler(self, *args, **kwargs)
+        return http_method_handler(self, *args, **kwargs)
 
     return secure_http_method_handler
 
@@ -150,7 +158,7 @@ def role_required(role_name=None):
                 authorization_error.request = self.request
                 raise authorization_error
 
-            http_method_handler(self, *args, **kwargs)
+            return http_method_handler(self, *args, **kwargs)
 
         return wraps(http_method_handler)(secure_http_method_handler)
 
@@ -180,7 +188,7 @@ def access_required(config=None):
                 authorization_error.request = self.request
                 raise authorization_error
 
-            http_method_handler(self, *args, **kwargs)
+            return http_method_handler(self, *args, **kwargs)
 
         return wraps(http_method_handler)(secure_http_method_handler)
 
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+#  prestans, A WSGI compliant REST micro-framework
+#  http://prestans.org
+#
+#  Copyright (c) 2017, Anomaly Software Pty Ltd.
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#      * Redistributions of source code must retain the above copyright
+#        notice, this list of conditions and the following disclaimer.
+#      * Redistributions in binary form must reproduce the above copyright
+#        notice, this list of conditions and the following disclaimer in the
+#        documentation and/or other materials provided with the distribution.
+#      * Neither the name of Anomaly Software nor the
+#        names of its contributors may be used to endorse or promote products
+#        derived from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+#  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+#  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL ANOMALY SOFTWARE BE LIABLE FOR ANY
+#  DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+#  (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+#  ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+#  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""
+Request scoped state for providers. RequestHandler binds the request being
+served before running a handler so that providers configured once per
+handler class see the correct request without being mutated, this keeps
+them safe to share between threads and coroutines.
+
+Coroutines are only kept apart where contextvars is available (python 3.7+);
+elsewhere the request is bound per thread, which coroutines sharing an event
+loop thread would overwrite for each other. COROUTINE_SAFE tells the two apart
+and ASGIApplication refuses to start without it.
+"""
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+import threading
+
+#: True if requests bound by coroutines on the same thread are kept apart
+COROUTINE_SAFE = contextvars is not None
+
+
+class RequestContext(object):
+
+    __slots__ = ('request', 'debug')
+
+    def __init__(self, request, debug):
+        self.request = request
+        self.debug = debug
+
+
+if contextvars is not None:
+
+    _request_context = contextvars.ContextVar("prestans_request_context", default=None)
+
+    def bind(request, debug):
+        """
+        Binds request and debug to the current thread or coroutine
+
+        :return: token to pass to unbind once the request is served
+        """
+        return _request_context.set(RequestContext(request, debug))
+
+    def unbind(token):
+        _request_context.reset(token)
+
+    def current():
+        """
+        :return: the RequestContext bound for the request being served or None
+        :rtype: RequestContext | None
+        """
+        return _request_context.get()
+
+    def snapshot():
+        """
+        Captures the current context, including the bound request, so work handed
+        to another thread still sees it
+
+        :return: callable taking a function and its arguments that runs it in the captured context
+        """
+        return contextvars.copy_context().run
+
+else:
+
+    _thread_local = threading.local()
+
+    def bind(request, debug):
+        token = getattr(_thread_local, "request_context", None)
+        _thread_local.request_context = RequestContext(request, debug)
+        return token
+
+    def unbind(token):
+        _thread_local.request_context = token
+
+    def current():
+        return getattr(_thread_local, "request_context", None)
+
+    def snapshot():
+        request_context = current()
+
+        def run(function, *args):
+            token = getattr(_thread_local, "request_context", None)
+            _thread_local.request_context = request_context
+
+            try:
+                return function(*args)
+            finally:
+                unbind(token)
+
+        return run
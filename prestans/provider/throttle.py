@@ -31,6 +31,9 @@
 #
 
 
+from prestans.provider import context
+
+
 class Base(object):
 
     def __init__(self):
@@ -38,8 +41,21 @@ class Base(object):
 
     @property
     def debug(self):
+        request_context = context.current()
+        if request_context is not None:
+            return request_context.debug
         return self._debug
 
     @debug.setter
     def debug(self, value):
         self._debug = value
+
+    @property
+    def request(self):
+        """
+        :return: the request being served by this thread or coroutine or None
+        """
+        request_context = context.current()
+        if request_context is not None:
+            return request_context.request
+        return None
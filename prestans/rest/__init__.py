@@ -29,10 +29,21 @@
 #  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 #  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
+import sys
+
+from prestans.rest.phase_timer import PhaseTimer
 from prestans.rest.request import Request
 from prestans.rest.response import Response
 from prestans.rest.dictionary_response import DictionaryResponse
 from prestans.rest.error_response import ErrorResponse
 from prestans.rest.request_handler import RequestHandler
+from prestans.rest.request_profiler import RequestProfiler
 from prestans.rest.blueprint_handler import BlueprintHandler
+from prestans.rest.metrics_handler import MetricsHandler
+from prestans.rest.route_cache import RouteCache
+from prestans.rest.route_trie import RouteTrie
 from prestans.rest.request_router import RequestRouter
+
+# ASGI support relies on async syntax only available to python 3.5+
+if sys.version_info >= (3, 5):
+    from prestans.rest.asgi import ASGIApplication
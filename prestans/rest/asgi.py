@@ -0,0 +1,359 @@
+import asyncio
+import inspect
+import io
+import sys
+
+from prestans import exception
+from prestans.provider import context
+from prestans.rest import ErrorResponse
+
+
+async def run_lifecycle_async(lifecycle):
+    """
+    Drives a handler lifecycle generator on the running event loop, the
+    asynchronous counterpart of prestans.rest.request_handler.run_lifecycle
+
+    :param lifecycle: generator as returned by RequestHandler._run_verb
+    """
+
+    result = None
+    error = None
+
+    while True:
+        try:
+            if error is not None:
+                step = lifecycle.throw(error)
+            else:
+                step = lifecycle.send(result)
+        except StopIteration:
+            return
+
+        result = None
+        error = None
+
+        if inspect.isawaitable(step):
+            try:
+                result = await step
+            except Exception as exp:
+                error = exp
+        else:
+            result = step
+
+
+async def call_handler_async(request_handler, environ, start_response, executor=None):
+    """
+    Asynchronous counterpart of RequestHandler.__call__, awaits async def verb
+    methods and hooks without blocking a thread.
+
+    Parsing the request and serializing the response are CPU bound and run in
+    executor so a large body doesn't hold up the other requests on the loop.
+
+    :param executor: concurrent.futures.Executor, None uses the event loop's default executor
+    """
+
+    loop = asyncio.get_running_loop()
+
+    request_handler.logger.info("handler %s.%s; coroutine execution start" % (
+        request_handler.__module__,
+        request_handler.__class__.__name__
+    ))
+
+    context_token = context.bind(request_handler.request, request_handler.debug)
+
+    try:
+        # the copied context carries the request bound above into the executor
+        error_response = await loop.run_in_executor(
+            executor,
+            context.snapshot(),
+            _prepare_request,
+            request_handler
+        )
+
+        if error_response is None:
+
+            phase_timer = request_handler.request.phase_timer
+            if phase_timer is not None:
+                started = phase_timer.start()
+
+            await run_lifecycle_async(request_handler._run_verb())
+
+            if phase_timer is not None:
+                phase_timer.stop(phase_timer.HANDLER, started)
+
+    except exception.UnimplementedVerbError as exp:
+        request_handler.logger.error(exp)
+        error_response = ErrorResponse(exp, request_handler.response.selected_serializer)
+
+    finally:
+        context.unbind(context_token)
+
+    if error_response is not None:
+        return await loop.run_in_executor(executor, error_response, environ, start_response)
+
+    request_handler.logger.info("handler %s.%s; coroutine execution ends" % (
+        request_handler.__module__,
+        request_handler.__class__.__name__
+    ))
+
+    return await loop.run_in_executor(executor, request_handler.response, environ, start_response)
+
+
+def _prepare_request(request_handler):
+
+    error_response = request_handler._prepare_request()
+
+    # parsed here rather than on first access to parsed_body from the event loop
+    if error_response is None and request_handler.request.body_template is not None:
+        request_handler.request.parse_body()
+
+    return error_response
+
+
+class ASGIApplication(object):
+    """
+    ASGIApplication adapts a RequestRouter to the ASGI 3 interface so a prestans
+    API can be served by an ASGI server.
+
+    The request body is read from the ASGI receive channel; routing, parser
+    configuration, serializers and ErrorResponse behaviour are those of the
+    wrapped RequestRouter. Idle connections only hold a coroutine, the router
+    runs once the body has been received.
+
+    Handlers that declare async def verb methods or hooks are awaited on the
+    event loop with their request parsing and response serialization run in
+    the executor, all other handlers run in the executor entirely. Binding the request
+    for providers of concurrent coroutines requires contextvars, see
+    prestans.provider.context.
+
+        router = RequestRouter(routes, application_name="api")
+        application = ASGIApplication(router)
+    """
+
+    def __init__(self, router, executor=None):
+        """
+        :param router: the prestans router to serve
+        :type router: prestans.rest.RequestRouter
+        :param executor: concurrent.futures.Executor the router runs in, None uses the
+        event loop's default executor
+        :raises RuntimeError: if request context can't be kept per coroutine
+        """
+
+        if not context.COROUTINE_SAFE:
+            raise RuntimeError("%s requires contextvars to bind requests per coroutine" % (
+                self.__class__.__name__
+            ))
+
+        self._router = router
+        self._executor = executor
+
+    @property
+    def router(self):
+        return self._router
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            raise ValueError("%s does not support ASGI scope type %s" % (
+                self.__class__.__name__,
+                scope["type"]
+            ))
+
+        body = await self._read_body(receive)
+
+        # client went away before sending the whole body
+        if body is None:
+            return
+
+        environ = self.build_environ(scope, body)
+
+        status, headers, body_chunks = await self._run_router(environ)
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers
+        })
+
+        if isinstance(body_chunks, (list, tuple)):
+            await send({
+                "type": "http.response.body",
+                "body": b"".join(body_chunks)
+            })
+        else:
+            await self._send_streamed(body_chunks, send)
+
+    async def _send_streamed(self, app_iter, send):
+        """
+        Sends a streamed body one message per chunk, chunks are produced in
+        the executor so serializing them never blocks the event loop
+        """
+
+        loop = asyncio.get_running_loop()
+        chunks = iter(app_iter)
+
+        try:
+            while True:
+                chunk = await loop.run_in_executor(self._executor, next, chunks, None)
+
+                if chunk is None:
+                    break
+
+                if chunk:
+                    await send({
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": True
+                    })
+
+            await send({
+                "type": "http.response.body",
+                "body": b""
+            })
+        finally:
+            close = getattr(app_iter, "close", None)
+            if close is not None:
+                await loop.run_in_executor(self._executor, close)
+
+    async def _lifespan(self, receive, send):
+
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                # warm up the router before accepting requests
+                self._router.compile()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @classmethod
+    async def _read_body(cls, receive):
+
+        body = []
+
+        while True:
+            message = await receive()
+
+            if message["type"] == "http.disconnect":
+                return None
+
+            body.append(message.get("body", b""))
+
+            if not message.get("more_body", False):
+                return b"".join(body)
+
+    async def _run_router(self, environ):
+
+        response_start = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            response_start["status"] = int(status.split(" ", 1)[0])
+            response_start["headers"] = [
+                (name.encode("latin1"), value.encode("latin1")) for name, value in response_headers
+            ]
+
+        router = self._router
+        router.compile()
+
+        dispatch = router.dispatch(environ, start_response)
+
+        if dispatch.is_coroutine:
+            body_chunks = await self._run_coroutine_handler(dispatch, environ)
+        else:
+            loop = asyncio.get_running_loop()
+            body_chunks = await loop.run_in_executor(self._executor, dispatch.run)
+
+        return response_start["status"], response_start["headers"], body_chunks
+
+    async def _run_coroutine_handler(self, dispatch, environ):
+        """
+        Counterpart of RequestDispatch.run for handlers awaited on the event loop
+
+        :type dispatch: prestans.rest.request_router.RequestDispatch
+        """
+
+        try:
+            request_handler = dispatch.create_request_handler()
+            body_chunks = await call_handler_async(
+                request_handler,
+                environ,
+                dispatch.start_response,
+                self._executor
+            )
+
+        except exception.Base as exp:
+            body_chunks = dispatch.error_response(exp)
+
+        except Exception:
+            dispatch.abort()
+            raise
+
+        return dispatch.finish(body_chunks)
+
+    @classmethod
+    def build_environ(cls, scope, body):
+        """
+        Builds a PEP 3333 environ from an ASGI http scope
+
+        :param scope: ASGI http connection scope
+        :type scope: dict
+        :param body: the complete request body
+        :type body: bytes
+        :rtype: dict
+        """
+
+        script_name = scope.get("root_path", "")
+        path_info = scope["path"]
+
+        # the mount point is not part of the path as seen by the router
+        if script_name and path_info.startswith(script_name):
+            path_info = path_info[len(script_name):]
+
+        server = scope.get("server") or ("localhost", 80)
+
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": script_name.encode("utf-8").decode("latin1"),
+            "PATH_INFO": path_info.encode("utf-8").decode("latin1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin1"),
+            "SERVER_NAME": server[0],
+            "SERVER_PORT": str(server[1]),
+            "SERVER_PROTOCOL": "HTTP/%s" % scope.get("http_version", "1.1"),
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False
+        }
+
+        client = scope.get("client")
+        if client:
+            environ["REMOTE_ADDR"] = client[0]
+            environ["REMOTE_PORT"] = str(client[1])
+
+        for name, value in scope.get("headers", []):
+            name = name.decode("latin1").upper().replace("-", "_")
+            value = value.decode("latin1")
+
+            if name == "CONTENT_LENGTH":
+                continue
+            elif name == "CONTENT_TYPE":
+                key = name
+            else:
+                key = "HTTP_" + name
+
+            # repeated headers are folded into a comma separated value
+            if key in environ:
+                value = environ[key] + "," + value
+
+            environ[key] = value
+
+        return environ
@@ -69,6 +69,15 @@ class ErrorResponse(webob.Response):
 
         self.content_length = len(body_as_string)
 
+        # RequestRouter places its MetricsRegistry in the environ when it has one
+        metrics = environ.get("prestans.metrics")
+        if metrics is not None:
+            metrics.counter(
+                "prestans_errors_total",
+                "Error responses per status code and exception",
+                ("status", "exception")
+            ).inc((str(self.status_int), self._exception.__class__.__name__))
+
         start_response(self.status, self.headerlist)
 
         return [body_as_string.encode("utf-8")]
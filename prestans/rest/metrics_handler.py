@@ -0,0 +1,35 @@
+import webob
+
+from prestans.rest import RequestHandler
+
+
+class MetricsHandler(RequestHandler):
+    """
+    Serves the router's MetricsRegistry in the Prometheus text exposition format.
+    Register it on a RequestRouter that was given a registry:
+
+        api = RequestRouter([
+            (r"/metrics", MetricsHandler),
+            ...
+        ], metrics=MetricsRegistry())
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, args, kwargs, request, response, logger, debug, metrics):
+
+        super(MetricsHandler, self).__init__(args, kwargs, request, response, logger, debug)
+        self._metrics = metrics
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    def __call__(self, environ, start_response):
+
+        exposition = self._metrics.exposition().encode("utf-8")
+
+        response = webob.Response(body=exposition)
+        response.headers["Content-Type"] = self.CONTENT_TYPE
+
+        return response(environ, start_response)
@@ -0,0 +1,83 @@
+from prestans.util import clock
+
+
+class PhaseTimer(object):
+    """
+    PhaseTimer records how long each phase of serving a request took. The
+    RequestRouter creates one per request only when phase timing is enabled,
+    every stage checks for None before reading the clock so a disabled timer
+    costs a single attribute lookup.
+
+    Phases are recorded in the order they complete; body is parsed lazily on
+    first access to request.parsed_body and is therefore also counted in the
+    handler phase.
+    """
+
+    ROUTE = "route"
+    REQUEST = "request"
+    PARAMETERS = "parameters"
+    BODY = "body"
+    HANDLER = "handler"
+    SERIALIZE = "serialize"
+    DUMPS = "dumps"
+
+    __slots__ = ('_label', '_phases', '_server_timing')
+
+    def __init__(self, server_timing=False):
+        """
+        :param server_timing: True to have the response report the phases in a Server-Timing header
+        :type server_timing: bool
+        """
+
+        self._label = None
+        self._phases = []
+        self._server_timing = server_timing
+
+    @property
+    def label(self):
+        """
+        :return: module qualified name of the handler class that served the request, None if no route matched
+        :rtype: str | None
+        """
+        return self._label
+
+    @label.setter
+    def label(self, value):
+        self._label = value
+
+    @property
+    def phases(self):
+        """
+        :return: (name, seconds) tuples in the order the phases completed
+        :rtype: list
+        """
+        return self._phases
+
+    @property
+    def server_timing(self):
+        return self._server_timing
+
+    @staticmethod
+    def start():
+        """
+        :return: the clock reading to pass to stop once the phase ends
+        :rtype: float
+        """
+        return clock()
+
+    def stop(self, name, started):
+        self._phases.append((name, clock() - started))
+
+    def duration(self, name):
+        """
+        :return: total seconds spent in the named phase
+        :rtype: float
+        """
+        return sum(seconds for phase, seconds in self._phases if phase == name)
+
+    def as_server_timing(self):
+        """
+        :return: the phases formatted as a Server-Timing header value, durations in milliseconds
+        :rtype: str
+        """
+        return ", ".join("%s;dur=%.3f" % (name, seconds * 1000) for name, seconds in self._phases)
@@ -31,6 +31,10 @@ class Request(webob.Request):
 
         self._body_template = None
         self._parsed_body = None
+        self._partial_body = False
+        self._lazy_body = False
+
+        self._phase_timer = None
 
     @property
     def method(self):
@@ -40,6 +44,18 @@ class Request(webob.Request):
     def logger(self):
         return self._logger
 
+    @property
+    def phase_timer(self):
+        """
+        :return: the PhaseTimer for this request, None unless the router enables phase timing
+        :rtype: prestans.rest.PhaseTimer | None
+        """
+        return self._phase_timer
+
+    @phase_timer.setter
+    def phase_timer(self, value):
+        self._phase_timer = value
+
     @property
     def parsed_body(self):
 
@@ -108,6 +124,36 @@ class Request(webob.Request):
         """
         self._parameter_set = value
 
+    @property
+    def partial_body(self):
+        """
+        :return: True if the body is validated with validate_partial
+        :rtype: bool
+        """
+        return self._partial_body
+
+    @partial_body.setter
+    def partial_body(self, value):
+        """
+        Must be set before the body_template parameter is set
+        """
+        self._partial_body = value
+
+    @property
+    def lazy_body(self):
+        """
+        :return: True if nested collections of the body are validated on first access
+        :rtype: bool
+        """
+        return self._lazy_body
+
+    @lazy_body.setter
+    def lazy_body(self, value):
+        """
+        Must be set before the body_template parameter is set
+        """
+        self._lazy_body = value
+
     @property
     def body_template(self):
         return self._body_template
@@ -144,16 +190,30 @@ class Request(webob.Request):
     def parse_body(self):
 
         if self._parsed_body is None and self._body_template is not None:
+
+            phase_timer = self._phase_timer
+            if phase_timer is not None:
+                started = phase_timer.start()
+
             # parse the body using the deserializer
             unserialized_body = self.selected_deserializer.loads(self.body)
 
+            validate = self._body_template.validate
+            if self._partial_body:
+                validate = self._body_template.validate_partial
+            elif self._lazy_body:
+                validate = self._body_template.validate_lazy
+
             # validate the body using the template and attribute_filter
-            self._parsed_body = self._body_template.validate(
+            self._parsed_body = validate(
                 unserialized_body,
                 self.attribute_filter,
                 self.is_minified
             )
 
+            if phase_timer is not None:
+                phase_timer.stop(phase_timer.BODY, started)
+
     def register_deserializers(self, deserializers):
 
         if not isinstance(deserializers, list):
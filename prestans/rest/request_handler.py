@@ -5,11 +5,167 @@ from prestans.http import STATUS
 from prestans.http import VERB
 from prestans import parser
 from prestans import provider
+from prestans.provider import context
 from prestans.rest import ErrorResponse
 from prestans import types
+from prestans.util import is_coroutine_function
+from prestans.util import isawaitable
+from prestans.util import run_coroutine
+from prestans.util import with_metaclass
 
 
-class RequestHandler(object):
+def run_lifecycle(lifecycle):
+    """
+    Drives a handler lifecycle generator from synchronous code, awaitables
+    yielded by async def handlers are run to completion on a thread local
+    event loop.
+
+    :param lifecycle: generator as returned by RequestHandler._run_verb
+    """
+
+    result = None
+    error = None
+
+    while True:
+        try:
+            if error is not None:
+                step = lifecycle.throw(error)
+            else:
+                step = lifecycle.send(result)
+        except StopIteration:
+            return
+
+        result = None
+        error = None
+
+        if isawaitable(step):
+            try:
+                result = run_coroutine(step)
+            except Exception as exp:
+                error = exp
+        else:
+            result = step
+
+
+#: handler method names for each supported HTTP verb
+VERB_METHODS = dict((verb.lower(), verb) for verb in [
+    VERB.GET,
+    VERB.HEAD,
+    VERB.POST,
+    VERB.PUT,
+    VERB.PATCH,
+    VERB.DELETE,
+    VERB.OPTIONS
+])
+
+
+class VerbDispatch(object):
+    """
+    Everything RequestHandler needs to serve a HTTP verb, resolved once per
+    handler class by RequestHandlerType
+    """
+
+    __slots__ = (
+        'verb',
+        'method',
+        'parser_config',
+        'response_template',
+        'response_attribute_filter_template',
+        'rewrite_template_model',
+        'parameter_sets',
+        'is_coroutine'
+    )
+
+    def __init__(self, handler_class, verb, parser_config):
+        """
+        :param handler_class: the RequestHandler subclass
+        :param verb: HTTP verb as defined in prestans.http.VERB
+        :type verb: str
+        :param parser_config: the handler's parser configuration
+        :type parser_config: prestans.parser.Config
+        """
+
+        self.verb = verb
+        self.method = getattr(handler_class, verb.lower())
+
+        # unbound methods in python 2 are wrapped, store the plain function
+        self.method = getattr(self.method, "__func__", self.method)
+
+        verb_parser_config = parser_config.get_config_for_verb(verb)
+        self.parser_config = verb_parser_config
+
+        self.response_template = None
+        self.response_attribute_filter_template = None
+        self.rewrite_template_model = None
+        self.parameter_sets = ()
+
+        if verb_parser_config is not None:
+
+            self.response_template = verb_parser_config.response_template
+            self.response_attribute_filter_template = verb_parser_config.response_attribute_filter_template
+
+            # minification support for response attribute filters
+            if isinstance(self.response_template, types.Array):
+                self.rewrite_template_model = self.response_template.element_template
+            else:
+                self.rewrite_template_model = self.response_template
+
+            for parameter_set in verb_parser_config.parameter_sets:
+                if not isinstance(parameter_set, parser.ParameterSet):
+                    raise TypeError("%s.%s %s not a subclass of ParameterSet" % (
+                        handler_class.__name__,
+                        verb,
+                        parameter_set.__class__.__name__
+                    ))
+
+            self.parameter_sets = tuple(verb_parser_config.parameter_sets)
+
+        self.is_coroutine = \
+            is_coroutine_function(self.method) or \
+            is_coroutine_function(handler_class.handler_will_run) or \
+            is_coroutine_function(handler_class.handler_did_run) or \
+            is_coroutine_function(handler_class.handler_raised_exception)
+
+
+class RequestHandlerType(type):
+    """
+    Metaclass for RequestHandler, resolves the verb dispatch table of each
+    handler class when it's defined so misconfigured handlers fail at import
+    rather than on their first request.
+    """
+
+    def __init__(cls, name, bases, attributes):
+        super(RequestHandlerType, cls).__init__(name, bases, attributes)
+        cls._compile_verb_dispatch()
+
+    def __setattr__(cls, key, value):
+        super(RequestHandlerType, cls).__setattr__(key, value)
+
+        # keep the dispatch table in step with configuration changes
+        if key in ("__parser_config__", "__provider_config__") or key.lower() in VERB_METHODS:
+            cls._compile_verb_dispatch()
+
+    def _compile_verb_dispatch(cls):
+
+        parser_config = getattr(cls, "__parser_config__", None)
+        provider_config = getattr(cls, "__provider_config__", None)
+
+        if parser_config is None:
+            parser_config = parser.Config()
+        elif not isinstance(parser_config, parser.Config):
+            raise TypeError("%s.__parser_config__ must be an instance of prestans.parser.Config" % cls.__name__)
+
+        if provider_config is not None and not isinstance(provider_config, provider.Config):
+            raise TypeError("%s.__provider_config__ must be an instance of prestans.provider.Config" % cls.__name__)
+
+        verb_dispatch = dict()
+        for verb in VERB_METHODS.values():
+            verb_dispatch[verb] = VerbDispatch(cls, verb, parser_config)
+
+        type.__setattr__(cls, "_verb_dispatch", verb_dispatch)
+
+
+class RequestHandler(with_metaclass(RequestHandlerType, object)):
     """
     RequestHandler is a callable that all API end-points must inherit from.
     end-points are instantiated by RequestRouter as a match for a URL.
@@ -23,10 +179,10 @@ class RequestHandler(object):
 
     def __init__(self, args, kwargs, request, response, logger, debug):
 
+        # handlers may configure authentication per request in their hooks
+        # so each instance gets its own default provider configuration
         if self.__provider_config__ is None:
             self.__provider_config__ = provider.Config()
-        if self.__parser_config__ is None:
-            self.__parser_config__ = parser.Config()
 
         self._args = args
         self._kwargs = kwargs
@@ -141,135 +297,179 @@ class RequestHandler(object):
 
         self.logger.info("handler %s.%s; callable execution start" % (self.__module__, self.__class__.__name__))
 
+        # providers are shared by every request to this handler class
+        context_token = context.bind(self.request, self.debug)
+
         try:
-            # register additional serializers and de-serializers
-            self.request.register_deserializers(self.register_deserializers())
-            self.response.register_serializers(self.register_serializers())
+            error_response = self._prepare_request()
+
+            if error_response is None:
+
+                phase_timer = self.request.phase_timer
+                if phase_timer is not None:
+                    started = phase_timer.start()
+
+                run_lifecycle(self._run_verb())
+
+                if phase_timer is not None:
+                    phase_timer.stop(phase_timer.HANDLER, started)
+
+        except exception.UnimplementedVerbError as exp:
+            self.logger.error(exp)
+            error_response = ErrorResponse(exp, self.response.selected_serializer)
+
+        finally:
+            context.unbind(context_token)
 
-            request_method = self.request.method
+        if error_response is not None:
+            return error_response(environ, start_response)
 
-            # ensure we support the HTTP verb
-            if not VERB.is_supported_verb(self.request.method):
-                unimplemented_verb_error = exception.UnimplementedVerbError(self.request.method)
-                unimplemented_verb_error.request = self.request
-                raise unimplemented_verb_error
+        self.logger.info("handler %s.%s; callable execution ends" % (
+            self.__module__,
+            self.__class__.__name__
+        ))
 
-            #: Setup serializers
-            self._setup_serializers()
+        return self.response(environ, start_response)
 
-            #: Authentication
-            if self.__provider_config__.authentication is not None:
-                self.__provider_config__.authentication.debug = self.debug
-                self.provider_authentication = self.__provider_config__.authentication
-                self.provider_authentication.request = self.request
+    def is_coroutine_handler(self):
+        """
+        :return: True if the verb method for this request or any of the handler
+        hooks are declared with async def
+        :rtype: bool
+        """
 
-            #: Configuration as provided by the API or default of a VerbConfig object
-            verb_parser_config = self.__parser_config__.get_config_for_verb(request_method)
+        return self.is_coroutine_verb(self.request.method)
 
-            #: Dress up the request and response with verb configuration
-            if verb_parser_config is not None and verb_parser_config.response_template is not None:
+    @classmethod
+    def is_coroutine_verb(cls, verb):
+        """
+        :return: True if the method for verb or any of the handler hooks are
+        declared with async def
+        :rtype: bool
+        """
+
+        verb_dispatch = cls._verb_dispatch.get(verb)
 
-                #: Set the response template and attribute filter
-                self.response.template = verb_parser_config.response_template
+        return verb_dispatch is not None and verb_dispatch.is_coroutine
 
-                response_attr_filter_template = verb_parser_config. \
-                    response_attribute_filter_template
+    def _prepare_request(self):
+        """
+        Runs the parsers configured for the requested verb before the handler executes
+
+        :return: an ErrorResponse if a parameter set fails to validate otherwise None
+        :rtype: ErrorResponse | None
+        """
 
-                # minification support for response attribute filters
-                rewrite_template_model = None
-                if self.request.is_minified is True:
+        # register additional serializers and de-serializers
+        self.request.register_deserializers(self.register_deserializers())
+        self.response.register_serializers(self.register_serializers())
 
-                    if isinstance(self.response.template, types.Array):
-                        rewrite_template_model = self.response.template.element_template
-                    else:
-                        rewrite_template_model = self.response.template
+        # ensure we support the HTTP verb
+        verb_dispatch = self._verb_dispatch.get(self.request.method)
+        if verb_dispatch is None:
+            unimplemented_verb_error = exception.UnimplementedVerbError(self.request.method)
+            unimplemented_verb_error.request = self.request
+            raise unimplemented_verb_error
 
-                #: Response attribute filter
-                self.response.attribute_filter = self.request.get_response_attribute_filter(
-                    response_attr_filter_template,
-                    rewrite_template_model
-                )
+        #: Setup serializers
+        self._setup_serializers()
 
-                #: If the header is omitted then we ensure the response has a default template
-                #: at this point we can assume that we are going to sent down a response
-                if self.response.attribute_filter is None:
-                    self.response.attribute_filter = response_attr_filter_template
+        #: Authentication, the provider reads the request bound by __call__
+        self.provider_authentication = self.__provider_config__.authentication
 
-            #: Parameter sets
-            if verb_parser_config is not None and len(verb_parser_config.parameter_sets) > 0:
+        #: Configuration as provided by the API or default of a VerbConfig object
+        verb_parser_config = verb_dispatch.parser_config
 
-                for parameter_set in verb_parser_config.parameter_sets:
+        #: Dress up the request and response with verb configuration
+        if verb_dispatch.response_template is not None:
 
-                    if not isinstance(parameter_set, parser.ParameterSet):
-                        raise TypeError("%s not a subclass of ParameterSet" % parameter_set.__class__.__name__)
+            #: Set the response template and attribute filter
+            self.response.template = verb_dispatch.response_template
 
-                    try:
-                        validated_parameter_set = parameter_set.validate(self.request)
+            response_attr_filter_template = verb_dispatch.response_attribute_filter_template
 
-                        if validated_parameter_set is not None:
-                            self.request.parameter_set = validated_parameter_set
-                            break
+            # minification support for response attribute filters
+            rewrite_template_model = None
+            if self.request.is_minified is True:
+                rewrite_template_model = verb_dispatch.rewrite_template_model
 
-                    except exception.DataValidationException as exp:
-                        self.logger.error(exp)
-                        error_response = ErrorResponse(exp, self.response.selected_serializer)
-                        return error_response(environ, start_response)
+            #: Response attribute filter
+            self.response.attribute_filter = self.request.get_response_attribute_filter(
+                response_attr_filter_template,
+                rewrite_template_model
+            )
 
-            # parse body
-            if not request_method == VERB.GET and verb_parser_config is not None:
-                self.request.attribute_filter = verb_parser_config.request_attribute_filter
-                #: Setting this runs the parser for the body
-                #: Request will determine which serializer to use based on Content-Type
-                self.request.body_template = verb_parser_config.body_template
+            #: If the header is omitted then we ensure the response has a default template
+            #: at this point we can assume that we are going to sent down a response
+            if self.response.attribute_filter is None:
+                self.response.attribute_filter = response_attr_filter_template
 
-            #: Warm up
-            self.handler_will_run()
+        #: Parameter sets
+        phase_timer = self.request.phase_timer
+        if phase_timer is not None and verb_dispatch.parameter_sets:
+            started = phase_timer.start()
+
+        for parameter_set in verb_dispatch.parameter_sets:
 
             try:
-                #:
-                #: See if the handler supports the called method
-                #: prestans sets a sensible HTTP status code
-                #:
-                if request_method == VERB.GET:
-                    self.get(*self._args, **self._kwargs)
-                elif request_method == VERB.HEAD:
-                    self.head(*self._args, **self._kwargs)
-                elif request_method == VERB.POST:
-                    self.post(*self._args, **self._kwargs)
-                elif request_method == VERB.PUT:
-                    self.put(*self._args, **self._kwargs)
-                elif request_method == VERB.PATCH:
-                    self.patch(*self._args, **self._kwargs)
-                elif request_method == VERB.DELETE:
-                    self.delete(*self._args, **self._kwargs)
-                elif request_method == VERB.OPTIONS:
-                    self.options(*self._args, **self._kwargs)
-            except (exception.PermanentRedirect, exception.TemporaryRedirect) as exp:
-                self._redirect(exp.url, exp.http_status)
-            # re-raise all prestans exceptions
-            except exception.Base as exp:
-                if isinstance(exception, exception.HandlerException):
-                    exp.request = self.request
-
-                raise exp
-            # handle any non-prestans exceptions
-            except Exception as exp:
-                self.handler_raised_exception(exp)
-            # always run the tear down method
-            finally:
-                self.handler_did_run()
+                validated_parameter_set = parameter_set.validate(self.request)
 
-            self.logger.info("handler %s.%s; callable execution ends" % (
-                self.__module__,
-                self.__class__.__name__
-            ))
+                if validated_parameter_set is not None:
+                    self.request.parameter_set = validated_parameter_set
+                    break
 
-            return self.response(environ, start_response)
+            except exception.DataValidationException as exp:
+                self.logger.error(exp)
+                return ErrorResponse(exp, self.response.selected_serializer)
 
-        except exception.UnimplementedVerbError as exp:
-            self.logger.error(exp)
-            error_response = ErrorResponse(exp, self.response.selected_serializer)
-            return error_response(environ, start_response)
+        if phase_timer is not None and verb_dispatch.parameter_sets:
+            phase_timer.stop(phase_timer.PARAMETERS, started)
+
+        # parse body
+        if not verb_dispatch.verb == VERB.GET and verb_parser_config is not None:
+            self.request.attribute_filter = verb_parser_config.request_attribute_filter
+            self.request.partial_body = verb_parser_config.partial_body
+            self.request.lazy_body = verb_parser_config.lazy_body
+            #: Setting this runs the parser for the body
+            #: Request will determine which serializer to use based on Content-Type
+            self.request.body_template = verb_parser_config.body_template
+
+        return None
+
+    def _run_verb(self):
+        """
+        Generator that runs the handler hooks and the verb method. Each call is
+        yielded so that the caller can await results of async def methods; the
+        awaited value or raised exception is sent back into the generator.
+
+        Use run_lifecycle to drive it from synchronous code.
+        """
+
+        verb_dispatch = self._verb_dispatch[self.request.method]
+
+        #: Warm up
+        yield self.handler_will_run()
+
+        try:
+            #:
+            #: See if the handler supports the called method
+            #: prestans sets a sensible HTTP status code
+            #:
+            yield verb_dispatch.method(self, *self._args, **self._kwargs)
+        except (exception.PermanentRedirect, exception.TemporaryRedirect) as exp:
+            self._redirect(exp.url, exp.http_status)
+        # re-raise all prestans exceptions
+        except exception.Base as exp:
+            if isinstance(exception, exception.HandlerException):
+                exp.request = self.request
+
+            raise exp
+        # handle any non-prestans exceptions
+        except Exception as exp:
+            yield self.handler_raised_exception(exp)
+        # always run the tear down method
+        finally:
+            yield self.handler_did_run()
 
     def register_serializers(self):
         return []
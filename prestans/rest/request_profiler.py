@@ -0,0 +1,185 @@
+import cProfile
+import marshal
+import os
+import pstats
+import random
+import re
+import threading
+
+from prestans.util import clock
+
+
+class RequestProfiler(object):
+    """
+    RequestProfiler runs a sample of the requests served by a RequestRouter under
+    cProfile and aggregates the statistics per handler class. The aggregated
+    statistics are periodically written to output_directory as one .pstats file
+    per handler, e.g. api.handlers.UserHandler.pstats, that can be opened with
+    pstats or snakeviz.
+
+    A request is sampled if it matches path_pattern, carries the header or is
+    picked at random according to sample_rate. Only one request is profiled at a
+    time; requests arriving while another is being profiled are not sampled.
+
+        api = RequestRouter(routes, profiler=RequestProfiler("/tmp/profiles", sample_rate=0.01))
+
+    Periodic dumps are written by a background thread so the request that
+    triggers one does not wait on the files.
+
+    Under ASGIApplication handlers run in the executor are profiled like any
+    other request; handlers awaited on the event loop are not, their profile
+    would include every coroutine interleaved on the loop thread.
+    """
+
+    def __init__(self, output_directory, sample_rate=0.0, path_pattern=None, header=None, dump_interval=60):
+        """
+        :param output_directory: directory the .pstats files are written to
+        :type output_directory: str
+        :param sample_rate: fraction of requests to profile between 0 and 1
+        :type sample_rate: float
+        :param path_pattern: regular expression, requests whose PATH_INFO matches are profiled
+        :type path_pattern: str | None
+        :param header: name of a request header, requests that send it are profiled
+        :type header: str | None
+        :param dump_interval: minimum seconds between writing the aggregated statistics
+        :type dump_interval: float
+        """
+
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        self._output_directory = output_directory
+        self._sample_rate = sample_rate
+        self._dump_interval = dump_interval
+
+        self._path_pattern = None
+        if path_pattern is not None:
+            self._path_pattern = re.compile(path_pattern)
+
+        # environ key as per PEP 3333
+        self._header_key = None
+        if header is not None:
+            self._header_key = "HTTP_" + header.upper().replace("-", "_")
+
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self._profile_lock = threading.Lock()
+        self._last_dump = clock()
+        self._dump_thread = None
+
+    @property
+    def output_directory(self):
+        return self._output_directory
+
+    @property
+    def sample_rate(self):
+        return self._sample_rate
+
+    @property
+    def stats(self):
+        """
+        :return: handler names mapped to their aggregated pstats.Stats
+        :rtype: dict
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def should_sample(self, environ):
+        """
+        :param environ: the WSGI environ of the request, before any parsing
+        :rtype: bool
+        """
+
+        if self._header_key is not None and self._header_key in environ:
+            return True
+
+        if self._path_pattern is not None and self._path_pattern.match(environ.get("PATH_INFO", "")):
+            return True
+
+        return self._sample_rate > 0 and random.random() < self._sample_rate
+
+    def start(self):
+        """
+        :return: an enabled profile for the request or None if another request is being profiled
+        :rtype: cProfile.Profile | None
+        """
+
+        if not self._profile_lock.acquire(False):
+            return None
+
+        profile = cProfile.Profile()
+
+        try:
+            profile.enable()
+        except ValueError:
+            # another profiling tool is active in this interpreter
+            self._profile_lock.release()
+            return None
+
+        return profile
+
+    def stop(self, profile, request_handler):
+        """
+        Stops profile and adds it to the statistics of the handler class
+
+        :param profile: as returned by start, None is ignored
+        :param request_handler: the handler that served the request, None if routing failed
+        """
+
+        if profile is None:
+            return
+
+        profile.disable()
+        self._profile_lock.release()
+
+        if request_handler is None:
+            handler_name = "unrouted"
+        else:
+            handler_name = "%s.%s" % (request_handler.__module__, request_handler.__class__.__name__)
+
+        with self._stats_lock:
+            stats = self._stats.get(handler_name)
+            if stats is None:
+                self._stats[handler_name] = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+
+            dump_due = clock() - self._last_dump >= self._dump_interval
+
+            # claimed here so that concurrent requests start a single dump
+            if dump_due:
+                self._last_dump = clock()
+
+        if dump_due:
+            dump_thread = threading.Thread(target=self.dump, name="prestans-profiler-dump")
+            dump_thread.daemon = True
+            dump_thread.start()
+            self._dump_thread = dump_thread
+
+    def dump(self):
+        """
+        Writes the aggregated statistics of each handler to output_directory
+
+        :return: paths of the written files
+        :rtype: list
+        """
+
+        if not os.path.isdir(self._output_directory):
+            os.makedirs(self._output_directory)
+
+        # marshalled as pstats.Stats.dump_stats does, files are written without the lock
+        with self._stats_lock:
+            self._last_dump = clock()
+            snapshots = [
+                (handler_name, marshal.dumps(stats.stats)) for handler_name, stats in sorted(self._stats.items())
+            ]
+
+        paths = []
+
+        for handler_name, snapshot in snapshots:
+            path = os.path.join(self._output_directory, "%s.pstats" % handler_name)
+            with open(path, "wb") as stats_file:
+                stats_file.write(snapshot)
+            paths.append(path)
+
+        return paths
@@ -4,12 +4,19 @@ import re
 from prestans import __version__
 from prestans import deserializer
 from prestans import exception
+from prestans.http import VERB
+from prestans.metrics import MetricsRegistry
 from prestans.rest import BlueprintHandler
 from prestans.rest import ErrorResponse
 from prestans.rest import DictionaryResponse
+from prestans.rest import MetricsHandler
+from prestans.rest import PhaseTimer
 from prestans.rest import Request
 from prestans.rest import Response
+from prestans.rest import RouteCache
+from prestans.rest import RouteTrie
 from prestans import serializer
+from prestans.util import clock
 
 
 class RequestRouter(object):
@@ -26,7 +33,8 @@ class RequestRouter(object):
 
     def __init__(self, routes, serializers=None, default_serializer=None, deserializers=None,
                  default_deserializer=None, charset="utf-8", application_name="prestans",
-                 logger=None, debug=False, description=None):
+                 logger=None, debug=False, description=None, route_cache_size=0,
+                 phase_timing_hook=None, server_timing=False, metrics=None, profiler=None):
 
         self._application_name = application_name
         self._debug = debug
@@ -69,6 +77,52 @@ class RequestRouter(object):
         if default_deserializer is None:
             self._default_deserializer = deserializer.JSON()
 
+        # compiled lazily on the first request or explicitly via compile()
+        self._route_map = None
+        self._route_trie = None
+
+        # optional cache of resolved routes; disabled by default as APIs that
+        # use high cardinality ids in the path would only churn through it
+        if route_cache_size:
+            self._route_cache = RouteCache(route_cache_size)
+        else:
+            self._route_cache = None
+
+        # phase timing is off unless a hook or the Server-Timing header asks for it;
+        # the hook is called with the PhaseTimer once the response has been written
+        self._phase_timing_hook = phase_timing_hook
+        self._server_timing = server_timing
+
+        # optional RequestProfiler that runs a sample of requests under cProfile
+        self._profiler = profiler
+
+        # optional MetricsRegistry updated for every request served
+        self._metrics = metrics
+        if metrics is not None:
+            self._requests_total = metrics.counter(
+                "prestans_requests_total",
+                "Requests served per handler, verb and status code",
+                ("handler", "verb", "status")
+            )
+            self._request_duration = metrics.histogram(
+                "prestans_request_duration_seconds",
+                "Time spent serving requests",
+                ("handler", "verb"),
+                MetricsRegistry.DURATION_BUCKETS
+            )
+            self._request_size = metrics.histogram(
+                "prestans_request_size_bytes",
+                "Content-Length of request bodies",
+                ("handler", "verb"),
+                MetricsRegistry.SIZE_BUCKETS
+            )
+            self._response_size = metrics.histogram(
+                "prestans_response_size_bytes",
+                "Content-Length of response bodies",
+                ("handler", "verb"),
+                MetricsRegistry.SIZE_BUCKETS
+            )
+
     @property
     def logger(self):
         return self._logger
@@ -89,7 +143,48 @@ class RequestRouter(object):
     def application_name(self):
         return self._application_name
 
-    def __call__(self, environ, start_response):
+    @property
+    def route_cache_hits(self):
+        if self._route_cache is None:
+            return 0
+        return self._route_cache.hits
+
+    @property
+    def route_cache_misses(self):
+        if self._route_cache is None:
+            return 0
+        return self._route_cache.misses
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    @property
+    def route_map(self):
+        """
+        :return: the compiled route map as (regexp, handler_class) tuples
+        :rtype: tuple
+        """
+        if self._route_map is None:
+            self.compile()
+
+        return self._route_map
+
+    def compile(self):
+        """
+        Validates the registered serializers and deserializers and compiles the
+        route map. This is run once for the lifetime of the router; pre-fork
+        servers can call it before forking so that workers share the result.
+
+        Calling compile more than once has no further effect.
+        """
+
+        if self._route_map is not None:
+            return
 
         # say hello
         self.logger.info("%s exposes %i end-points; prestans %s; charset %s; debug %s" % (
@@ -128,6 +223,138 @@ class RequestRouter(object):
             str(_default_incoming_mime_types).strip("[]'")
         ))
 
+        # initialise the route map; immutable for the lifetime of the router
+        route_map = tuple(self.generate_route_map(self._routes))
+
+        if self._metrics is None:
+            for regexp, handler_class in route_map:
+                if issubclass(handler_class, MetricsHandler):
+                    raise ValueError("%s is registered for %s but the router has no metrics registry" % (
+                        handler_class.__name__,
+                        regexp.pattern
+                    ))
+        self._route_trie = RouteTrie(route_map)
+        self._route_map = route_map
+
+    def _resolve_route(self, path):
+        """
+        :param path: the requested PATH_INFO
+        :type path: str
+        :return: (handler_class, args, kwargs) for the matched route or None
+        :rtype: tuple | None
+        """
+
+        if self._route_cache is not None:
+            cached_route = self._route_cache.get(path)
+            if cached_route is not None:
+                return cached_route
+
+        resolved_route = self._route_trie.match(path)
+
+        if resolved_route is None:
+            return None
+
+        regexp, handler_class, match = resolved_route
+
+        # assemble the args and kwargs
+        args = match.groups()
+        kwargs = {}
+        for key, value in iter(regexp.groupindex.items()):
+            kwargs[key] = args[value - 1]
+
+        if len(kwargs) > 0:
+            args = ()
+
+        if self._route_cache is not None:
+            self._route_cache.put(path, handler_class, args, kwargs)
+
+        return handler_class, args, kwargs
+
+    def __call__(self, environ, start_response):
+
+        if self._route_map is None:
+            self.compile()
+
+        return self.dispatch(environ, start_response).run()
+
+    def dispatch(self, environ, start_response):
+        """
+        Starts serving a request, WSGI and ASGI requests are both served through
+        the returned RequestDispatch
+
+        :rtype: RequestDispatch
+        """
+        return RequestDispatch(self, environ, start_response)
+
+    def _record_metrics(self, environ, request_handler, status, response_headers, started):
+        """
+        Updates the router metrics once a response has been started
+
+        :param request_handler: the handler that served the request, None if routing failed
+        :param status: HTTP status code of the response
+        :type status: int
+        :param response_headers: list of (name, value) header tuples
+        :param started: clock reading taken when the request arrived
+        """
+
+        duration = clock() - started
+
+        if request_handler is None:
+            handler_name = ""
+        else:
+            handler_name = "%s.%s" % (request_handler.__module__, request_handler.__class__.__name__)
+
+        # clients choose the method, keep unknown verbs from growing the label set
+        verb = environ.get("REQUEST_METHOD", "")
+        if not VERB.is_supported_verb(verb):
+            verb = "OTHER"
+
+        labels = (handler_name, verb)
+
+        self._requests_total.inc((handler_name, verb, str(status)))
+        self._request_duration.observe(duration, labels)
+
+        try:
+            self._request_size.observe(int(environ.get("CONTENT_LENGTH") or 0), labels)
+        except ValueError:
+            pass
+
+        for name, value in response_headers:
+            if name.lower() == "content-length":
+                self._response_size.observe(int(value), labels)
+                break
+
+    def _create_phase_timer(self):
+        """
+        :return: a PhaseTimer for the request or None if phase timing is disabled
+        :rtype: prestans.rest.PhaseTimer | None
+        """
+
+        if self._phase_timing_hook is None and not self._server_timing:
+            return None
+
+        return PhaseTimer(server_timing=self._server_timing)
+
+    def _report_phase_timer(self, phase_timer):
+
+        if self._phase_timing_hook is not None:
+            self._phase_timing_hook(phase_timer)
+
+    def _create_request_handler(self, environ, phase_timer=None, route_resolver=None):
+        """
+        Parses the HTTP request and instantiates the handler registered for the
+        requested URL
+
+        :param phase_timer: records the request and route phases, passed on to the request and response
+        :type phase_timer: prestans.rest.PhaseTimer | None
+        :param route_resolver: callable returning the resolved route, None resolves PATH_INFO
+        :raises NoEndpointError: if the URL does not match a registered handler
+        :rtype: prestans.rest.RequestHandler
+        """
+
+        if phase_timer is not None:
+            started = phase_timer.start()
+
         # attempt to parse the HTTP request
         request = Request(
             environ=environ,
@@ -137,76 +364,86 @@ class RequestRouter(object):
             default_deserializer=self._default_deserializer
         )
 
-        # initialise the route map
-        route_map = self.generate_route_map(self._routes)
+        if phase_timer is not None:
+            phase_timer.stop(phase_timer.REQUEST, started)
+            started = phase_timer.start()
 
-        try:
+        # check if the requested URL has a valid registered handler
+        # if absent, can assume to be empty string
+        # https://www.python.org/dev/peps/pep-3333/#environ-variables
+        if route_resolver is None:
+            resolved_route = self._resolve_route(environ.get("PATH_INFO", ""))
+        else:
+            resolved_route = route_resolver()
 
-            # check if the requested URL has a valid registered handler
-            for regexp, handler_class in route_map:
+        if phase_timer is not None:
+            phase_timer.stop(phase_timer.ROUTE, started)
 
-                # if absent, can assume to be empty string
-                # https://www.python.org/dev/peps/pep-3333/#environ-variables
-                match = regexp.match(environ.get("PATH_INFO", ""))
-
-                # if we've found a match; ensure its a handler subclass and return it's callable
-                if match:
-
-                    # assemble the args and kwargs
-                    args = match.groups()
-                    kwargs = {}
-                    for key, value in iter(regexp.groupindex.items()):
-                        kwargs[key] = args[value - 1]
-
-                    if len(kwargs) > 0:
-                        args = ()
-
-                    if issubclass(handler_class, BlueprintHandler):
-
-                        response = DictionaryResponse(
-                            charset=self._charset, logger=self._logger,
-                            serializers=self._serializers,
-                            default_serializer=self._default_deserializer
-                        )
-
-                        request_handler = handler_class(
-                            args=args,
-                            kwargs=kwargs,
-                            request=request,
-                            response=response,
-                            logger=self._logger,
-                            debug=self._debug,
-                            route_map=self._routes
-                        )
-                    else:
-                        response = Response(
-                            charset=self._charset,
-                            logger=self._logger,
-                            serializers=self._serializers,
-                            default_serializer=self._default_deserializer
-                        )
-                        response.minify = request.is_minified
-
-                        request_handler = handler_class(
-                            args=args,
-                            kwargs=kwargs,
-                            request=request,
-                            response=response,
-                            logger=self._logger,
-                            debug=self._debug
-                        )
-
-                    return request_handler(environ, start_response)
-
-            # request does not have a matched handler
+        # request does not have a matched handler
+        if resolved_route is None:
             no_endpoint = exception.NoEndpointError()
             no_endpoint.request = request
             raise no_endpoint
 
-        except exception.Base as exp:
-            self.logger.error(exp)
-            error_response = ErrorResponse(exp, self._default_serializer)
-            return error_response(environ, start_response)
+        # we've found a match; ensure its a handler subclass and return it's callable
+        handler_class, args, kwargs = resolved_route
+
+        if phase_timer is not None:
+            phase_timer.label = "%s.%s" % (handler_class.__module__, handler_class.__name__)
+            request.phase_timer = phase_timer
+
+        if issubclass(handler_class, MetricsHandler):
+
+            return handler_class(
+                args=args,
+                kwargs=kwargs,
+                request=request,
+                response=None,
+                logger=self._logger,
+                debug=self._debug,
+                metrics=self._metrics
+            )
+
+        if issubclass(handler_class, BlueprintHandler):
+
+            response = DictionaryResponse(
+                charset=self._charset, logger=self._logger,
+                serializers=self._serializers,
+                default_serializer=self._default_deserializer
+            )
+
+            return handler_class(
+                args=args,
+                kwargs=kwargs,
+                request=request,
+                response=response,
+                logger=self._logger,
+                debug=self._debug,
+                route_map=self._routes
+            )
+
+        response = Response(
+            charset=self._charset,
+            logger=self._logger,
+            serializers=self._serializers,
+            default_serializer=self._default_deserializer
+        )
+        response.minify = request.is_minified
+        response.phase_timer = phase_timer
+
+        return handler_class(
+            args=args,
+            kwargs=kwargs,
+            request=request,
+            response=response,
+            logger=self._logger,
+            debug=self._debug
+        )
+
+    def _error_response(self, exp, environ, start_response):
+        self.logger.error(exp)
+        error_response = ErrorResponse(exp, self._default_serializer)
+        return error_response(environ, start_response)
 
     @classmethod
     def generate_route_map(cls, routes):
@@ -234,3 +471,206 @@ class RequestRouter(object):
                 parsed_handler_map.append((compiled_regex, handler))
 
         return parsed_handler_map
+
+
+#: marks a RequestDispatch whose route has not been looked up, None means no route matched
+_UNRESOLVED = object()
+
+
+class RequestDispatch(object):
+    """
+    One request served by a RequestRouter. Profiling, phase timing and metrics
+    are applied here so that WSGI and ASGI requests are treated alike; run
+    serves the request in full, ASGIApplication awaits coroutine handlers
+    itself between create_request_handler and finish.
+    """
+
+    def __init__(self, router, environ, start_response):
+        """
+        :param router: the router serving the request
+        :type router: RequestRouter
+        :param environ: the WSGI environ of the request
+        :type environ: dict
+        :param start_response: the WSGI start_response callable
+        """
+
+        self._router = router
+        self._environ = environ
+        self._start_response = start_response
+
+        self._started = clock()
+        self._response_start = {}
+        self._profile = None
+        self._request_handler = None
+        self._resolved_route = _UNRESOLVED
+        self._phase_timer = router._create_phase_timer()
+
+        # lets ErrorResponse count errors raised anywhere in the request
+        if router.metrics is not None:
+            environ["prestans.metrics"] = router.metrics
+
+    @property
+    def request_handler(self):
+        """
+        :return: the handler serving the request, None until created or if routing failed
+        """
+        return self._request_handler
+
+    @property
+    def is_coroutine(self):
+        """
+        :return: True if the request is routed to a handler that declares the
+        method for its verb or any of its hooks with async def
+        :rtype: bool
+        """
+
+        resolved_route = self.resolve_route()
+
+        if resolved_route is None:
+            return False
+
+        return resolved_route[0].is_coroutine_verb(self._environ.get("REQUEST_METHOD", ""))
+
+    def resolve_route(self):
+        """
+        Resolves the route of the request once, later calls return the same result
+
+        :return: (handler_class, args, kwargs) for the matched route or None
+        :rtype: tuple | None
+        """
+
+        if self._resolved_route is _UNRESOLVED:
+            self._resolved_route = self._router._resolve_route(self._environ.get("PATH_INFO", ""))
+
+        return self._resolved_route
+
+    def start_response(self, status, response_headers, exc_info=None):
+        """
+        start_response handed to the handler, records the status and headers for the metrics
+        """
+
+        self._response_start["status"] = status
+        self._response_start["headers"] = response_headers
+        return self._start_response(status, response_headers, exc_info)
+
+    def run(self):
+        """
+        Creates the handler for the request and runs it in the calling thread,
+        prestans exceptions are written out as an ErrorResponse
+
+        :return: the WSGI app_iter
+        """
+
+        profiler = self._router.profiler
+
+        # sampling is decided on the environ alone so unsampled requests pay nothing
+        if profiler is not None and profiler.should_sample(self._environ):
+            self._profile = profiler.start()
+
+        try:
+            request_handler = self.create_request_handler()
+            app_iter = request_handler(self._environ, self.start_response)
+
+        except exception.Base as exp:
+            app_iter = self.error_response(exp)
+
+        except Exception:
+            self.abort()
+            raise
+
+        return self.finish(app_iter)
+
+    def create_request_handler(self):
+        """
+        :raises prestans.exception.Base: if the request can't be parsed or routed
+        :rtype: prestans.rest.RequestHandler
+        """
+
+        self._request_handler = self._router._create_request_handler(
+            self._environ,
+            self._phase_timer,
+            self.resolve_route
+        )
+        return self._request_handler
+
+    def error_response(self, exp):
+        """
+        :return: app_iter of the ErrorResponse for exp
+        """
+        return self._router._error_response(exp, self._environ, self.start_response)
+
+    def finish(self, app_iter):
+        """
+        Ends the request once the handler has returned; a streamed body is
+        only complete once the server closes it, so metrics and phase timings
+        of those are deferred to close
+
+        :return: app_iter
+        """
+
+        if isinstance(app_iter, (list, tuple)):
+            self._complete()
+            return app_iter
+
+        self._stop_profile()
+        return ClosingAppIter(app_iter, self._complete)
+
+    def abort(self):
+        """
+        Ends a request whose handler raised an exception that isn't a prestans exception
+        """
+        self._complete()
+
+    def _stop_profile(self):
+
+        # profiles are bound to the thread that started them
+        if self._profile is not None:
+            self._router.profiler.stop(self._profile, self._request_handler)
+            self._profile = None
+
+    def _complete(self):
+
+        router = self._router
+
+        self._stop_profile()
+
+        if self._phase_timer is not None:
+            router._report_phase_timer(self._phase_timer)
+
+        if router.metrics is not None and "status" in self._response_start:
+            router._record_metrics(
+                self._environ,
+                self._request_handler,
+                int(self._response_start["status"].split(" ", 1)[0]),
+                self._response_start["headers"],
+                self._started
+            )
+
+
+class ClosingAppIter(object):
+    """
+    Wraps a streamed app_iter so the request is completed when the server
+    closes the body, as required of WSGI servers by PEP 3333
+    """
+
+    def __init__(self, app_iter, on_close):
+        self._app_iter = app_iter
+        self._on_close = on_close
+
+    def __iter__(self):
+        return iter(self._app_iter)
+
+    def close(self):
+
+        on_close = self._on_close
+        if on_close is None:
+            return
+
+        self._on_close = None
+
+        try:
+            close = getattr(self._app_iter, "close", None)
+            if close is not None:
+                close()
+        finally:
+            on_close()
@@ -5,8 +5,10 @@ from prestans.http import STATUS
 from prestans.parser import AttributeFilter
 from prestans import serializer
 from prestans.types import Array
+from prestans.types import ArrayView
 from prestans.types import BinaryResponse
 from prestans.types import DataCollection
+from prestans.types import LazyArray
 from prestans.types import Model
 
 
@@ -33,6 +35,7 @@ class Response(webob.Response):
         self._attribute_filter = None
         self._template = None
         self._charset = charset
+        self._phase_timer = None
 
         #:
         #: IETF hash dropped the X- prefix for custom headers
@@ -57,6 +60,18 @@ class Response(webob.Response):
     def logger(self):
         return self._logger
 
+    @property
+    def phase_timer(self):
+        """
+        :return: the PhaseTimer for this request, None unless the router enables phase timing
+        :rtype: prestans.rest.PhaseTimer | None
+        """
+        return self._phase_timer
+
+    @phase_timer.setter
+    def phase_timer(self, value):
+        self._phase_timer = value
+
     @property
     def supported_mime_types(self):
         return [serializer.content_type() for serializer in self._serializers]
@@ -205,8 +220,9 @@ class Response(webob.Response):
             )
             raise TypeError(msg)
 
-        #: Ensure that it matches the return type template
-        if not value.__class__ == self.template.__class__:
+        #: Ensure that it matches the return type template, a LazyArray or ArrayView stand in for an Array
+        if not value.__class__ == self.template.__class__ and \
+           not (isinstance(value, (LazyArray, ArrayView)) and self.template.__class__ is Array):
             msg = "body must of be type %s, given %s" % (
                 self.template.__class__.__name__,
                 value.__class__.__name__
@@ -244,6 +260,13 @@ class Response(webob.Response):
 
         self._serializers = self._serializers + serializers
 
+    def _add_server_timing(self):
+
+        phase_timer = self._phase_timer
+
+        if phase_timer is not None and phase_timer.server_timing:
+            self.headers["Server-Timing"] = phase_timer.as_server_timing()
+
     def __call__(self, environ, start_response):
         """
         Overridden WSGI application interface
@@ -254,6 +277,7 @@ class Response(webob.Response):
 
             self.content_type = None
 
+            self._add_server_timing()
             start_response(self.status, self.headerlist)
 
             if self.template is not None:
@@ -301,13 +325,27 @@ class Response(webob.Response):
                         exp.request = self.request
                         self.logger.warn("%s" % exp)
 
+            if isinstance(self._app_iter, LazyArray):
+                return self._stream(start_response)
+
             # body should be of type DataCollection try; attempt calling
             # as_serializable with available attribute_filter
+            phase_timer = self._phase_timer
+            if phase_timer is not None:
+                started = phase_timer.start()
+
             serializable_body = self._app_iter.as_serializable(self.attribute_filter.as_immutable(), self.minify)
 
+            if phase_timer is not None:
+                phase_timer.stop(phase_timer.SERIALIZE, started)
+                started = phase_timer.start()
+
             #: attempt serializing via registered serializer
             stringified_body = self._selected_serializer.dumps(serializable_body)
 
+            if phase_timer is not None:
+                phase_timer.stop(phase_timer.DUMPS, started)
+
             # if not isinstance(stringified_body, str):
             #     msg = "%s dumps must return a python str not %s" % (
             #         self._selected_serializer.__class__.__name__,
@@ -318,6 +356,7 @@ class Response(webob.Response):
             #: set content_length
             self.content_length = len(stringified_body)
 
+            self._add_server_timing()
             start_response(self.status, self.headerlist)
 
             return [stringified_body.encode("utf-8")]
@@ -357,12 +396,56 @@ class Response(webob.Response):
             #: Write out response
             self.content_length = self._app_iter.content_length
 
+            self._add_server_timing()
             start_response(self.status, self.headerlist)
             return [self._app_iter.contents]
 
         else:
             raise AssertionError("prestans failed to write a binary or textual response")
 
+    def _stream(self, start_response):
+        """
+        Writes a LazyArray body as it is consumed; the length of the body is
+        not known up front so no Content-Length is sent and the server falls
+        back to chunked transfer.
+
+        The response is started before the generator is returned so servers
+        that read the status ahead of the body see it.
+        """
+
+        attribute_filter = self.attribute_filter
+        if attribute_filter is not None:
+            attribute_filter = attribute_filter.as_immutable()
+
+        serializable_chunks = self._app_iter.as_serializable_chunks(attribute_filter, self.minify)
+
+        del self.content_length
+
+        self._add_server_timing()
+        start_response(self.status, self.headerlist)
+
+        return self._stream_chunks(self._selected_serializer.dumps_chunks(serializable_chunks))
+
+    def _stream_chunks(self, stringified_chunks):
+
+        phase_timer = self._phase_timer
+
+        while True:
+            if phase_timer is not None:
+                started = phase_timer.start()
+
+            # chunks are serialized as they are pulled, the time is booked
+            # against the serialize phase reported once the body is closed
+            stringified_chunk = next(stringified_chunks, None)
+
+            if phase_timer is not None:
+                phase_timer.stop(phase_timer.SERIALIZE, started)
+
+            if stringified_chunk is None:
+                return
+
+            yield stringified_chunk.encode("utf-8")
+
     def __str__(self):
         #: Overridden so webob's __str__ skips serializing the body
         super(Response, self).__str__(skip_body=True)
\ No newline at end of file
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+import threading
+
+
+class RouteCache(object):
+    """
+    RouteCache is a bounded least recently used map of PATH_INFO to the
+    resolved (handler_class, args, kwargs) tuple. It's used by RequestRouter
+    to skip route matching for frequently requested concrete paths.
+
+    Only resolved routes should be stored, unmatched paths would allow
+    clients to evict useful entries.
+    """
+
+    def __init__(self, max_size):
+        """
+        :param max_size: maximum number of paths held by the cache
+        :type max_size: int
+        """
+
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def get(self, path):
+        """
+        :param path: the requested PATH_INFO
+        :type path: str
+        :return: the cached (handler_class, args, kwargs) tuple or None
+        :rtype: tuple | None
+        """
+
+        with self._lock:
+            entry = self._entries.pop(path, None)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            # re-insert to mark as most recently used
+            self._entries[path] = entry
+            self._hits += 1
+
+        handler_class, args, kwargs = entry
+
+        # handlers receive their own copy of the kwargs
+        return handler_class, args, dict(kwargs)
+
+    def put(self, path, handler_class, args, kwargs):
+
+        with self._lock:
+            self._entries.pop(path, None)
+            self._entries[path] = (handler_class, args, dict(kwargs))
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,189 @@
+class RouteTrie(object):
+    """
+    RouteTrie indexes compiled routes by the literal prefix of their regular
+    expressions. Resolving a path walks the trie once and only evaluates the
+    regular expressions of routes whose literal prefix matches the path.
+
+    Routes are tried in the order they were registered so the first matching
+    route wins, same as a linear scan of the route map.
+
+    Walking the trie costs a dictionary lookup per character of the path, for
+    route maps shorter than min_routes a linear scan is faster and is used instead.
+    """
+
+    #: route maps with fewer routes are scanned linearly, see bench_route_dispatch
+    MIN_ROUTES = 16
+
+    #: characters that end the literal portion of a regular expression
+    META_CHARACTERS = frozenset(".^$*+?{}[]|()")
+
+    #: characters that make the preceding literal optional
+    OPTIONAL_QUANTIFIERS = frozenset("*?{")
+
+    def __init__(self, route_map, min_routes=MIN_ROUTES):
+        """
+        :param route_map: compiled (regexp, handler_class) tuples as generated by
+        RequestRouter.generate_route_map
+        :type route_map: list | tuple
+        :param min_routes: smallest route map that is indexed, shorter ones are scanned linearly
+        :type min_routes: int
+        """
+
+        self._route_map = tuple(route_map)
+        self._root = None
+
+        if len(self._route_map) < min_routes:
+            return
+
+        self._root = ({}, [])
+
+        for index, (regexp, handler_class) in enumerate(self._route_map):
+            self._insert(self.literal_prefix(regexp.pattern), index)
+
+    def __len__(self):
+        return len(self._route_map)
+
+    def _insert(self, prefix, index):
+
+        children, route_indexes = self._root
+
+        for character in prefix:
+            node = children.get(character)
+
+            if node is None:
+                node = ({}, [])
+                children[character] = node
+
+            children, route_indexes = node
+
+        route_indexes.append(index)
+
+    @classmethod
+    def literal_prefix(cls, pattern):
+        """
+        Returns the literal string every path matching pattern must start with,
+        the result is conservative and may be shorter than the true prefix.
+
+        :param pattern: regular expression anchored with ^
+        :type pattern: str
+        :return: literal prefix of the pattern
+        :rtype: str
+        """
+
+        if cls._has_top_level_alternation(pattern):
+            return ""
+
+        if pattern.startswith("^"):
+            pattern = pattern[1:]
+
+        prefix = []
+        index = 0
+
+        while index < len(pattern):
+
+            character = pattern[index]
+
+            if character == "\\":
+                # escaped alphanumerics are character classes or anchors e.g \d \b
+                if index + 1 >= len(pattern) or pattern[index + 1].isalnum():
+                    break
+                character = pattern[index + 1]
+                index += 2
+            elif character in cls.META_CHARACTERS:
+                break
+            else:
+                index += 1
+
+            # a quantifier can make the preceding character optional
+            if index < len(pattern) and pattern[index] in cls.OPTIONAL_QUANTIFIERS:
+                break
+
+            prefix.append(character)
+
+            if index < len(pattern) and pattern[index] == "+":
+                break
+
+        return "".join(prefix)
+
+    @classmethod
+    def _has_top_level_alternation(cls, pattern):
+
+        depth = 0
+        in_class = False
+        index = 0
+
+        while index < len(pattern):
+            character = pattern[index]
+
+            if character == "\\":
+                index += 2
+                continue
+
+            if in_class:
+                if character == "]":
+                    in_class = False
+            elif character == "[":
+                in_class = True
+            elif character == "(":
+                depth += 1
+            elif character == ")":
+                depth -= 1
+            elif character == "|" and depth == 0:
+                return True
+
+            index += 1
+
+        return False
+
+    def candidates(self, path):
+        """
+        :param path: the requested PATH_INFO
+        :type path: str
+        :return: indexes of routes whose literal prefix matches path, in registration order
+        :rtype: list
+        """
+
+        if self._root is None:
+            return list(range(len(self._route_map)))
+
+        children, route_indexes = self._root
+        matched_indexes = list(route_indexes)
+
+        for character in path:
+            node = children.get(character)
+
+            if node is None:
+                break
+
+            children, route_indexes = node
+            matched_indexes.extend(route_indexes)
+
+        matched_indexes.sort()
+        return matched_indexes
+
+    def match(self, path):
+        """
+        :param path: the requested PATH_INFO
+        :type path: str
+        :return: (regexp, handler_class, match) for the first matching route or None
+        :rtype: tuple | None
+        """
+
+        if self._root is None:
+            for regexp, handler_class in self._route_map:
+                match = regexp.match(path)
+
+                if match:
+                    return regexp, handler_class, match
+
+            return None
+
+        for index in self.candidates(path):
+
+            regexp, handler_class = self._route_map[index]
+            match = regexp.match(path)
+
+            if match:
+                return regexp, handler_class, match
+
+        return None
@@ -42,6 +42,22 @@ class Base(object):
     def dumps(self, serializable_object):
         raise NotImplementedError
 
+    def dumps_chunks(self, serializable_chunks):
+        """
+        Serializes a list given as a sequence of chunks, e.g. a streamed
+        prestans.types.LazyArray; serializers that can't write a list piece by
+        piece dump it in full
+
+        :param serializable_chunks: iterable of lists of serializable elements
+        :return: generator of serialized strings
+        """
+        serializable_object = []
+
+        for chunk in serializable_chunks:
+            serializable_object.extend(chunk)
+
+        yield self.dumps(serializable_object)
+
     def handler_body_type(self):
         raise NotImplementedError
 
@@ -59,6 +75,28 @@ class JSON(Base):
         except Exception as exp:
             raise exception.SerializationFailedError("JSON: %s" % exp)
 
+    def dumps_chunks(self, serializable_chunks):
+
+        import json
+        encoder = json.JSONEncoder(ensure_ascii=False, sort_keys=True)
+
+        yield "["
+
+        separator = ""
+        for chunk in serializable_chunks:
+
+            if not chunk:
+                continue
+
+            try:
+                yield separator + ", ".join([encoder.encode(element) for element in chunk])
+            except Exception as exp:
+                raise exception.SerializationFailedError("JSON: %s" % exp)
+
+            separator = ", "
+
+        yield "]"
+
     def handler_body_type(self):
         return DataCollection
 
@@ -29,6 +29,7 @@
 #  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 #  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
+from prestans.types.base import CompiledDataType
 from prestans.types.base import DataCollection
 from prestans.types.base import DataStructure
 from prestans.types.base import DataType
@@ -43,6 +44,8 @@ from prestans.types.datetime_prestans import DateTime
 from prestans.types.time_prestans import Time
 
 from prestans.types.array import Array
+from prestans.types.array import ArrayView
+from prestans.types.lazy_array import LazyArray
 from prestans.types.model import Model
 from prestans.types.data_url_file import DataURLFile
 
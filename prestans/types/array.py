@@ -29,6 +29,9 @@
 #  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 #  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
+import array
+import copy
+
 from prestans import exception
 from prestans.types import DataCollection
 from prestans.types import DataStructure
@@ -43,6 +46,95 @@ from prestans.types import Date
 from prestans.types import DateTime
 from prestans.types import Time
 
+from prestans.util import integer_types
+
+
+try:
+    array.array("q")
+    _INTEGER_TYPECODE = "q"
+except ValueError:
+    _INTEGER_TYPECODE = "l"
+
+
+class _BooleanArray(array.array):
+    """
+    Booleans stored one byte each, read back as bool
+    """
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(map(bool, array.array.__getitem__(self, index)))
+
+        return bool(array.array.__getitem__(self, index))
+
+    def tolist(self):
+        return list(map(bool, array.array.__iter__(self)))
+
+
+#: element templates whose values are stored in a typed array, mapped to the
+#: storage factory and the python types it holds without conversion
+_TYPED_STORAGE = {
+    Boolean: (lambda values=(): _BooleanArray("B", values), frozenset([bool])),
+    Float: (lambda values=(): array.array("d", values), frozenset((float,) + integer_types)),
+    Integer: (lambda values=(): array.array(_INTEGER_TYPECODE, values), frozenset(integer_types))
+}
+
+
+def _new_elements(element_template, values=()):
+    """
+    Storage for the elements of an Array, a typed array for elements that are
+    Booleans, Floats or Integers and a list for everything else; values of
+    other types or too large for a typed array are kept in a list as well
+    """
+
+    typed_storage = _TYPED_STORAGE.get(element_template.__class__)
+
+    if typed_storage is not None and set(map(type, values)) <= typed_storage[1]:
+        try:
+            return typed_storage[0](values)
+        except OverflowError:
+            pass
+
+    return list(values)
+
+
+def _validate_batch(element_template, values):
+    """
+    Checks a list of scalars against the element template in bulk
+
+    :return: typed storage holding the values, None when the values need to be
+    validated one by one, e.g. to parse strings or to raise the error of the
+    first invalid element
+    """
+
+    typed_storage = _TYPED_STORAGE.get(element_template.__class__)
+
+    if typed_storage is None:
+        return None
+
+    if values and not set(map(type, values)) <= typed_storage[1]:
+        return None
+
+    minimum = getattr(element_template, "_minimum", None)
+    if values and minimum is not None and min(values) < minimum:
+        return None
+
+    maximum = getattr(element_template, "_maximum", None)
+    if values and maximum is not None and max(values) > maximum:
+        return None
+
+    choices = getattr(element_template, "_choices", None)
+    if choices is not None and not set(values).issubset(choices):
+        return None
+
+    try:
+        return typed_storage[0](values)
+    except OverflowError:
+        return None
+
 
 class Array(DataCollection):
 
@@ -77,7 +169,7 @@ class Array(DataCollection):
         self._max_length = max_length
         self._description = description
 
-        self._array_elements = list()
+        self._array_elements = _new_elements(element_template)
 
     def __len__(self):
         return len(self._array_elements)
@@ -91,11 +183,29 @@ class Array(DataCollection):
             yield element
 
     def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._array_elements[index])
+
         return self._array_elements[index]
 
     def __contains__(self, item):
         return item in self._array_elements
 
+    def view(self, start=None, stop=None):
+        """
+        Read only window onto the elements from start up to stop, sharing the
+        storage of this array; elements are neither copied nor validated again
+
+        :param start: index of the first element, negative indices count from the end
+        :type start: int | None
+        :param stop: index after the last element
+        :type stop: int | None
+        :rtype: ArrayView
+        """
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return ArrayView(self, start, max(start, stop))
+
     @property
     def max_length(self):
         return self._max_length
@@ -127,6 +237,7 @@ class Array(DataCollection):
     @element_template.setter
     def element_template(self, value):
         self._element_template = value
+        self._array_elements = _new_elements(value, self._array_elements)
 
     def blueprint(self):
 
@@ -146,6 +257,49 @@ class Array(DataCollection):
     def remove(self, value):
         self._array_elements.remove(value)
 
+    def _copy_template(self):
+        """
+        Shallow copy sharing the element template, elements that are collections
+        are copied in turn
+
+        :rtype: Array
+        """
+
+        copied = copy.copy(self)
+
+        if isinstance(self._array_elements, list):
+            copied._array_elements = [
+                element._copy_template() if isinstance(element, DataCollection) else element
+                for element in self._array_elements
+            ]
+        else:
+            copied._array_elements = _new_elements(self._element_template, self._array_elements)
+
+        return copied
+
+    def _from_trusted(self, value):
+        """
+        Array holding the elements of a list without validating them, elements
+        of collections may be given as python data as well
+
+        :rtype: Array
+        """
+
+        element_template = self._element_template
+        element_class = element_template.__class__
+
+        trusted = self._copy_template()
+
+        if isinstance(element_template, DataCollection):
+            trusted._array_elements = [
+                element if element.__class__ is element_class else element_template._from_trusted(element)
+                for element in value
+            ]
+        else:
+            trusted._array_elements = _new_elements(element_template, value)
+
+        return trusted
+
     def validate(self, value, attribute_filter=None, minified=False):
         """
         :param value:
@@ -157,6 +311,45 @@ class Array(DataCollection):
         :return:
         """
 
+        return self._validate_elements(value, attribute_filter, minified, "validate")
+
+    def validate_partial(self, value, attribute_filter=None, minified=False):
+        """
+        Validates the array in full, elements that are Models are validated with
+        Model.validate_partial, e.g. for a PATCH request updating many resources
+
+        :param value:
+        :type value: list | None
+        :param attribute_filter:
+        :type attribute_filter: prestans.parser.AttributeFilter
+        :param minified:
+        :type minified: bool
+        :return:
+        """
+
+        return self._validate_elements(value, attribute_filter, minified, "validate_partial")
+
+    def validate_lazy(self, value, attribute_filter=None, minified=False):
+        """
+        Validates each element, elements that are Models are validated with
+        Model.validate_lazy so their nested collections are validated on access
+
+        :param value:
+        :type value: list | None
+        :param attribute_filter:
+        :type attribute_filter: prestans.parser.AttributeFilter
+        :param minified:
+        :type minified: bool
+        :return:
+        """
+
+        return self._validate_elements(value, attribute_filter, minified, "validate_lazy")
+
+    def _validate_elements(self, value, attribute_filter, minified, validate_method):
+        """
+        :param validate_method: name of the method collection elements are validated with
+        """
+
         if not self._required and value is None:
             return None
         elif self._required and value is None:
@@ -171,21 +364,23 @@ class Array(DataCollection):
         if not isinstance(value, (list, tuple)):
             raise TypeError(value)
 
-        for array_element in value:
+        # every element validates to one element, reject input of the wrong size up front
+        if self._min_length is not None and len(value) < self._min_length:
+            raise exception.LessThanMinimumError(value, self._min_length)
 
-            if isinstance(self._element_template, DataCollection):
-                validated_array_element = self._element_template.validate(array_element, attribute_filter, minified)
-            else:
-                validated_array_element = self._element_template.validate(array_element)
+        if self._max_length is not None and len(value) > self._max_length:
+            raise exception.MoreThanMaximumError(value, self._max_length)
 
-            _validated_value.append(validated_array_element)
+        elements = _validate_batch(self._element_template, value)
 
-        if self._min_length is not None and len(_validated_value) < self._min_length:
-            raise exception.LessThanMinimumError(value, self._min_length)
+        if elements is None:
+            validate_element = self._element_validator(validate_method, attribute_filter, minified)
+            elements = [validate_element(element) for element in value]
 
-        if self._max_length is not None and len(_validated_value) > self._max_length:
-            raise exception.MoreThanMaximumError(value, self._max_length)
+            if self._element_template.__class__ in _TYPED_STORAGE:
+                elements = _new_elements(self._element_template, elements)
 
+        _validated_value._array_elements = elements
         return _validated_value
 
     def append(self, value):
@@ -196,26 +391,116 @@ class Array(DataCollection):
                 self.append(element)
             return
 
-        # check for basic types supported by array
-        if isinstance(self._element_template, Boolean) or \
-           isinstance(self._element_template, Float) or \
-           isinstance(self._element_template, Integer) or \
-           isinstance(self._element_template, String):
-            value = self._element_template.__class__().validate(value)
-        elif isinstance(self._element_template, Date) or \
-             isinstance(self._element_template, DateTime) or \
-             isinstance(self._element_template, Time):
-            value = self._element_template.__class__().validate(value)
-        elif not isinstance(value, self._element_template.__class__):
+        self._append_validated(self._element_validator()(value))
+
+    def extend(self, values):
+        """
+        Validates a list of elements as a batch and appends them, elements are
+        validated as they would be by append.
+
+        Raises MoreThanMaximumError before any element is validated if the
+        array would grow beyond max_length.
+
+        :param values:
+        :type values: list | tuple
+        """
+
+        if not isinstance(values, (list, tuple)):
+            raise TypeError(values)
+
+        if self._max_length is not None and len(self._array_elements) + len(values) > self._max_length:
+            raise exception.MoreThanMaximumError(values, self._max_length)
+
+        elements = _validate_batch(self._element_template, values)
+
+        if elements is None:
+            validate_element = self._element_validator()
+            elements = [validate_element(element) for element in values]
+
+        self._extend_validated(elements)
+
+    def _element_validator(self, validate_method=None, attribute_filter=None, minified=False):
+        """
+        Resolves the function elements are validated with once per batch
+
+        :param validate_method: name of the method elements that are collections are
+        validated with; None only accepts instances of the element template's class
+        """
+
+        element_template = self._element_template
+
+        # basic types supported by array, honouring the constraints of the template
+        if isinstance(element_template, Boolean) or \
+           isinstance(element_template, Float) or \
+           isinstance(element_template, Integer) or \
+           isinstance(element_template, String):
+            return element_template.validate
+        elif isinstance(element_template, Date) or \
+             isinstance(element_template, DateTime) or \
+             isinstance(element_template, Time):
+            return element_template.validate
+        elif validate_method is None:
+            return self._check_element_class
+        elif isinstance(element_template, DataCollection):
+            validate = getattr(element_template, validate_method)
+            return lambda element: validate(element, attribute_filter, minified)
+        else:
+            return element_template.validate
+
+    def _check_element_class(self, value):
+
+        if not isinstance(value, self._element_template.__class__):
             msg = "prestans array elements must be of type %s; given %s" % (
                 self._element_template.__class__.__name__, value.__class__.__name__
             )
             raise TypeError(msg)
 
-        self._array_elements.append(value)
+        return value
+
+    def _append_validated(self, value):
+        """
+        Appends an element that has already been validated, typed storage is
+        converted to a list when the value does not fit it
+        """
+
+        elements = self._array_elements
+
+        if elements.__class__ is not list:
+            if value.__class__ in _TYPED_STORAGE[self._element_template.__class__][1]:
+                try:
+                    elements.append(value)
+                    return
+                except OverflowError:
+                    pass
+
+            elements = self._array_elements = list(elements)
+
+        elements.append(value)
+
+    def _extend_validated(self, values):
+        """
+        Appends elements that have already been validated, see _append_validated
+        """
+
+        elements = self._array_elements
+
+        if elements.__class__ is not list:
+            typed = values if values.__class__ is elements.__class__ else _new_elements(self._element_template, values)
+
+            if typed.__class__ is elements.__class__:
+                elements.extend(typed)
+                return
+
+            elements = self._array_elements = list(elements)
+
+        elements.extend(values)
 
     def as_serializable(self, attribute_filter=None, minified=False):
 
+        # typed storage only ever holds scalars
+        if self._array_elements.__class__ is not list:
+            return self._array_elements.tolist()
+
         _result_array = list()
 
         # convert filter to immutable if it isn't already
@@ -223,6 +508,23 @@ class Array(DataCollection):
         if isinstance(attribute_filter, AttributeFilter):
             attribute_filter = attribute_filter.as_immutable()
 
+        # serialize model elements with the function generated for the element class
+        from prestans.types import Model
+        from prestans.types import model_compiler
+
+        element_class = self._element_template.__class__
+        if isinstance(self._element_template, Model) and element_class.__compiled_serialization__ and \
+           model_compiler.uses_model_serializer(element_class):
+
+            serializer = model_compiler.serializer_for(self._element_template, minified is True, attribute_filter)
+
+            if serializer is not None:
+                return [
+                    serializer(array_element, attribute_filter, minified) if array_element.__class__ is element_class
+                    else array_element.as_serializable(attribute_filter, minified)
+                    for array_element in self._array_elements
+                ]
+
         for array_element in self._array_elements:
 
             if isinstance(self._element_template, DataCollection):
@@ -258,3 +560,103 @@ class Array(DataCollection):
             attribute_filter = default_value
 
         return attribute_filter
+
+
+class ArrayView(Array):
+    """
+    Read only window onto the elements of an Array, see Array.view; the view
+    follows the array it was taken from, elements removed from the array
+    shrink the window
+    """
+
+    def __init__(self, array, start, stop):
+        """
+        :param array: the array the elements are read from
+        :type array: Array
+        :param start: index of the first element
+        :type start: int
+        :param stop: index after the last element
+        :type stop: int
+        """
+
+        self._element_template = array._element_template
+        self._required = array._required
+        self._min_length = array._min_length
+        self._max_length = array._max_length
+        self._description = array._description
+
+        self._array = array
+        self._start = start
+        self._stop = stop
+
+    @property
+    def _array_elements(self):
+        return self._array._array_elements
+
+    def _range(self):
+        return range(self._start, min(self._stop, len(self._array._array_elements)))
+
+    @property
+    def start(self):
+        return self._start
+
+    @property
+    def stop(self):
+        return self._start + len(self)
+
+    def __len__(self):
+        return len(self._range())
+
+    def __iter__(self):
+        elements = self._array._array_elements
+
+        for index in self._range():
+            yield elements[index]
+
+    def __getitem__(self, index):
+        elements = self._array._array_elements
+
+        if isinstance(index, slice):
+            return [elements[element_index] for element_index in self._range()[index]]
+
+        return elements[self._range()[index]]
+
+    def __contains__(self, item):
+        return any(element == item for element in self)
+
+    def view(self, start=None, stop=None):
+        window = self._range()[start:stop]
+        return ArrayView(self._array, window.start, max(window.start, window.stop))
+
+    def _materialize(self):
+        """
+        Array holding the elements of the window, only the references to the
+        elements are copied
+
+        :rtype: Array
+        """
+
+        window = self._range()
+
+        materialized = copy.copy(self._array)
+        materialized._array_elements = self._array._array_elements[window.start:window.stop]
+
+        return materialized
+
+    def _copy_template(self):
+        return self._materialize()._copy_template()
+
+    def _validate_elements(self, value, attribute_filter, minified, validate_method):
+        raise TypeError("%s can not validate input, use an Array template" % self.__class__.__name__)
+
+    def as_serializable(self, attribute_filter=None, minified=False):
+        return self._materialize().as_serializable(attribute_filter, minified)
+
+    def append(self, value):
+        raise TypeError("%s is read only" % self.__class__.__name__)
+
+    def extend(self, values):
+        raise TypeError("%s is read only" % self.__class__.__name__)
+
+    def remove(self, value):
+        raise TypeError("%s is read only" % self.__class__.__name__)
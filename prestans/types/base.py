@@ -29,10 +29,13 @@
 #  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 #  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
+import copy
 
 
 class DataType(object):
 
+    __slots__ = ()
+
     def blueprint(self):
         raise NotImplementedError
 
@@ -40,6 +43,68 @@ class DataType(object):
         raise NotImplementedError
 
 
+class CompiledDataType(DataType):
+    """
+    DataType that compiles its constraints into a validate function the first
+    time a value is validated, subclasses implement _compile_validator.
+
+    Unless a subclass overrides validate the function is stored on the instance
+    in place of the validate method; it is discarded whenever an attribute of
+    the instance changes, e.g. when an Array forces its element template to be
+    required.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+
+        instance_dict = self.__dict__
+        instance_dict.pop("_validator", None)
+        instance_dict.pop("validate", None)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_validator", None)
+        state.pop("validate", None)
+        return state
+
+    def validate(self, value):
+
+        instance_dict = self.__dict__
+        validator = instance_dict.get("_validator")
+
+        if validator is None:
+            validator = instance_dict["_validator"] = self._compile_validator()
+
+            if type(self).validate is CompiledDataType.validate:
+                instance_dict["validate"] = validator
+
+        return validator(value)
+
+    def _compile_validator(self):
+        """
+        :return: function validating a value against the current constraints, it must
+        not refer to self so that copies of the instance can share it
+        """
+        raise NotImplementedError
+
+
+def _frozen_choices(choices):
+    """
+    :return: choices as a frozenset for constant time membership tests, as given
+    if its elements aren't hashable
+    """
+
+    if choices is None:
+        return None
+
+    try:
+        return frozenset(choices)
+    except TypeError:
+        return choices
+
+
 class DataStructure(DataType):
     """
     Wrappers on Python types generally represented as structures e.g DateTime
@@ -51,6 +116,8 @@ class DataStructure(DataType):
     E.g DateTime serializes itself as a ISO string
     """
 
+    __slots__ = ()
+
     def blueprint(self):
         raise NotImplementedError
 
@@ -63,12 +130,28 @@ class DataStructure(DataType):
 
 class DataCollection(DataType):
 
+    __slots__ = ()
+
     def blueprint(self):
         raise NotImplementedError
 
     def validate(self, value, attribute_filter=None, minified=False):
         raise NotImplementedError
 
+    def validate_partial(self, value, attribute_filter=None, minified=False):
+        """
+        Validates the parts of value that are present, collections that can't be
+        partially updated validate value in full
+        """
+        return self.validate(value, attribute_filter, minified)
+
+    def validate_lazy(self, value, attribute_filter=None, minified=False):
+        """
+        Validates value leaving nested collections to be validated on first
+        access, collections that can't do so validate value in full
+        """
+        return self.validate(value, attribute_filter, minified)
+
     def as_serializable(self, attribute_filter=None):
         raise NotImplementedError
 
@@ -80,3 +163,16 @@ class DataCollection(DataType):
 
     def get_attribute_filter(self, default_value=False):
         raise NotImplementedError
+
+    def _copy_template(self):
+        """
+        :return: a new value for an attribute this collection is the template of
+        """
+        return copy.deepcopy(self)
+
+    def _from_trusted(self, value):
+        """
+        :return: a value of this collection built from known valid python data, see
+        Model.from_trusted
+        """
+        return self.validate(value)
@@ -35,6 +35,7 @@ from datetime import datetime
 
 from prestans import exception
 from prestans.types import DataStructure
+from prestans.util import string_types
 
 
 class Date(DataStructure):
@@ -104,8 +105,6 @@ class Date(DataStructure):
             else:
                 value = self._default
 
-        from prestans.util import string_types
-
         if isinstance(value, date_type):
             _validated_value = value
         elif isinstance(value, string_types):
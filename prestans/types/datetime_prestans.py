@@ -34,6 +34,7 @@ from datetime import datetime
 
 from prestans import exception
 from prestans.types import DataStructure
+from prestans.util import string_types
 
 
 class DateTime(DataStructure):
@@ -123,8 +124,6 @@ class DateTime(DataStructure):
             else:
                 value = self._default
 
-        from prestans.util import string_types
-
         if isinstance(value, datetime_type):
             _validated_value = value
         elif isinstance(value, string_types):
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+#  prestans, A WSGI compliant REST micro-framework
+#  http://prestans.org
+#
+#  Copyright (c) 2017, Anomaly Software Pty Ltd.
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#      * Redistributions of source code must retain the above copyright
+#        notice, this list of conditions and the following disclaimer.
+#      * Redistributions in binary form must reproduce the above copyright
+#        notice, this list of conditions and the following disclaimer in the
+#        documentation and/or other materials provided with the distribution.
+#      * Neither the name of Anomaly Software nor the
+#        names of its contributors may be used to endorse or promote products
+#        derived from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+#  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+#  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL ANOMALY SOFTWARE BE LIABLE FOR ANY
+#  DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+#  (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+#  ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+#  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+import itertools
+
+from prestans import exception
+from prestans.types import DataCollection
+from prestans.types.array import Array
+from prestans.types.array import _new_elements
+
+
+class LazyArray(Array):
+    """
+    Array wrapping an iterator or generator, elements are validated and
+    serialized as they are consumed so a response can be streamed without
+    holding every element in memory, e.g. for a SQLAlchemy yield_per query:
+
+        query = session.query(User).yield_per(500)
+        self.response.body = types.LazyArray(
+            (adapters.adapt_persistent_instance(user, rest.models.User) for user in query),
+            element_template=rest.models.User()
+        )
+
+    A LazyArray can be consumed once and has no length; max_length is checked
+    as elements are consumed, min_length once the iterator is exhausted.
+    """
+
+    def __init__(self, elements, required=True, element_template=None,
+                 min_length=None, max_length=None, description=None, chunk_size=100):
+        """
+        :param elements: iterable of elements, instances of the element template's
+        class are used as is and everything else is validated
+        :param chunk_size: number of elements serialized at a time
+        :type chunk_size: int
+        """
+
+        super(LazyArray, self).__init__(
+            required=required,
+            element_template=element_template,
+            min_length=min_length,
+            max_length=max_length,
+            description=description
+        )
+
+        self._elements = iter(elements)
+        self._chunk_size = chunk_size
+
+    @property
+    def chunk_size(self):
+        return self._chunk_size
+
+    def __len__(self):
+        raise TypeError("%s has no length until it has been consumed" % self.__class__.__name__)
+
+    def __iter__(self):
+        for chunk in self._iter_chunks():
+            for element in chunk:
+                yield element
+
+    def __getitem__(self, index):
+        raise TypeError("%s does not support indexing" % self.__class__.__name__)
+
+    def __contains__(self, item):
+        raise TypeError("%s does not support membership tests" % self.__class__.__name__)
+
+    def _iter_chunks(self):
+        """
+        Consumes the wrapped iterator chunk_size elements at a time
+
+        :return: generator of lists of validated elements
+        """
+
+        element_template = self._element_template
+        element_class = element_template.__class__
+        validate_element = self._element_validator("validate")
+
+        if isinstance(element_template, DataCollection):
+            validate = validate_element
+
+            def validate_element(element):
+                return element if element.__class__ is element_class else validate(element)
+
+        consumed = 0
+
+        while True:
+            chunk = [validate_element(element) for element in itertools.islice(self._elements, self._chunk_size)]
+            consumed += len(chunk)
+
+            if self._max_length is not None and consumed > self._max_length:
+                raise exception.MoreThanMaximumError(consumed, self._max_length)
+
+            if not chunk:
+                break
+
+            yield chunk
+
+        if self._min_length is not None and consumed < self._min_length:
+            raise exception.LessThanMinimumError(consumed, self._min_length)
+
+    def as_serializable_chunks(self, attribute_filter=None, minified=False):
+        """
+        Consumes the array, serializing chunk_size elements at a time
+
+        :return: generator of lists of serialized elements
+        """
+
+        # each chunk is serialized as an Array so elements are serialized the same way
+        chunk_array = Array(element_template=self._element_template)
+
+        for chunk in self._iter_chunks():
+            chunk_array._array_elements = _new_elements(self._element_template, chunk)
+            yield chunk_array.as_serializable(attribute_filter, minified)
+
+    def as_serializable(self, attribute_filter=None, minified=False):
+
+        serializable = []
+
+        for chunk in self.as_serializable_chunks(attribute_filter, minified):
+            serializable.extend(chunk)
+
+        return serializable
+
+    def _validate_elements(self, value, attribute_filter, minified, validate_method):
+        raise TypeError("%s can not validate input, use an Array template" % self.__class__.__name__)
+
+    def append(self, value):
+        raise TypeError("%s does not support append" % self.__class__.__name__)
+
+    def extend(self, values):
+        raise TypeError("%s does not support extend" % self.__class__.__name__)
@@ -34,12 +34,177 @@ import inspect
 import string
 
 from prestans import exception
+from prestans.types import Boolean
 from prestans.types import DataCollection
 from prestans.types import DataStructure
 from prestans.types import DataType
+from prestans.types import Float
+from prestans.types import Integer
+from prestans.types import String
+from prestans.types import model_compiler
+from prestans.util import frozen_dict
+from prestans.util import with_metaclass
 
 
-class Model(DataCollection):
+#: per instance state of every Model, attribute values are kept in _attributes
+_MODEL_SLOTS = ("_required", "_description", "_attributes", "_supplied")
+
+
+class ModelType(type):
+    """
+    Metaclass for Model, builds the table of attribute templates once per class
+    so instances don't walk the class with inspect.getmembers.
+
+    __model_members__ holds the (name, member) tuples Model.getmembers returns,
+    __model_fields__ only those that are DataType instances, both in alphabetical
+    order, and __model_field_names__ the names of the fields for membership
+    tests. They are rebuilt if an attribute of the class or one of its bases is
+    replaced after the class is created.
+
+    The minification rewrite maps and the default attribute values are built
+    the first time they are asked for and shared by all instances until the
+    fields change.
+
+    Classes that set __compact_storage__, or inherit it, are given empty
+    __slots__ so their instances carry no __dict__.
+    """
+
+    def __new__(mcs, name, bases, attributes):
+
+        compact = attributes.get("__compact_storage__")
+        if compact is None:
+            compact = any(getattr(base, "__compact_storage__", False) for base in bases)
+
+        if compact and "__slots__" not in attributes:
+            attributes = dict(attributes)
+            attributes["__slots__"] = ()
+
+        cls = super(ModelType, mcs).__new__(mcs, name, bases, attributes)
+
+        if compact and cls.__dictoffset__:
+            raise TypeError("%s uses compact storage but a base class has no __slots__" % name)
+
+        return cls
+
+    def __init__(cls, name, bases, attributes):
+        super(ModelType, cls).__init__(name, bases, attributes)
+        cls._compile_fields()
+
+    def __setattr__(cls, key, value):
+        super(ModelType, cls).__setattr__(key, value)
+
+        if not key.startswith("__"):
+            cls._recompile_fields()
+        elif key in ("__compiled_validation__", "__compiled_serialization__"):
+            model_compiler.clear()
+
+    def __delattr__(cls, key):
+        super(ModelType, cls).__delattr__(key)
+
+        if not key.startswith("__"):
+            cls._recompile_fields()
+
+    def _compile_fields(cls):
+
+        members = tuple(
+            (name, member) for name, member in inspect.getmembers(cls)
+            if not name.startswith("__") and not inspect.isfunction(member) and not inspect.ismethod(member) and
+            not inspect.ismemberdescriptor(member)
+        )
+        fields = tuple((name, member) for name, member in members if isinstance(member, DataType))
+
+        type.__setattr__(cls, "__model_members__", members)
+        type.__setattr__(cls, "__model_fields__", fields)
+        type.__setattr__(cls, "__model_templates__", dict(fields))
+        type.__setattr__(cls, "__model_field_names__", frozenset(name for name, member in fields))
+        type.__setattr__(cls, "__model_defaults__", None)
+
+        # Model._copy_template can only copy the state it knows about directly
+        type.__setattr__(cls, "__model_extra_slots__", any(
+            klass.__dict__.get("__slots__", ()) not in ((), _MODEL_SLOTS)
+            for klass in cls.__mro__ if isinstance(klass, ModelType)
+        ))
+        type.__setattr__(cls, "__model_rewrite_maps__", None)
+
+    def _compile_rewrite_maps(cls):
+
+        tokens = set()
+        for attribute_name, type_instance in cls.__model_fields__:
+            tokens.update(attribute_name.split('_'))
+
+        # sort alphabetically for the algorithm to work
+        tokens = sorted(tokens)
+        token_rewrite_map = dict(zip(tokens, cls.generate_minified_keys(len(tokens))))
+
+        rewrite_map = dict()
+        for attribute_name, type_instance in cls.__model_fields__:
+            rewrite_map[attribute_name] = "_".join(
+                token_rewrite_map[token] for token in attribute_name.split('_')
+            )
+
+        rewrite_maps = (
+            frozen_dict(token_rewrite_map),
+            frozen_dict(rewrite_map),
+            frozen_dict(dict((value, key) for key, value in rewrite_map.items()))
+        )
+
+        type.__setattr__(cls, "__model_rewrite_maps__", rewrite_maps)
+        return rewrite_maps
+
+    def _compile_defaults(cls):
+
+        constants = dict()
+        variables = list()
+
+        for attribute_name, type_instance in cls.__model_fields__:
+
+            # date and time defaults depend on the clock, custom types may keep state
+            if not isinstance(type_instance, DataCollection) and \
+               type_instance.__class__ not in (Boolean, Float, Integer, String):
+                variables.append((attribute_name, type_instance))
+                continue
+
+            try:
+                constants[attribute_name] = type_instance.validate(None)
+            except exception.RequiredAttributeError:
+                constants[attribute_name] = None
+            # raised again each time an instance is created
+            except exception.DataValidationException:
+                variables.append((attribute_name, type_instance))
+
+        defaults = (constants, tuple(variables))
+
+        type.__setattr__(cls, "__model_defaults__", defaults)
+        return defaults
+
+    def _recompile_fields(cls):
+
+        cls._compile_fields()
+        model_compiler.clear()
+
+        for subclass in cls.__subclasses__():
+            subclass._recompile_fields()
+
+
+class Model(with_metaclass(ModelType, DataCollection)):
+
+    __slots__ = _MODEL_SLOTS
+
+    #: validate with a function generated for the class, set to False on a
+    #: subclass or on Model itself to use the interpreted implementation
+    __compiled_validation__ = True
+
+    #: serialize with functions generated per class, minified flag and attribute
+    #: filter shape, set to False to use the interpreted implementation
+    __compiled_serialization__ = True
+
+    #: set to True in a subclass body so instances are created without a __dict__,
+    #: inherited by subclasses; instances then can't hold attributes other than fields
+    __compact_storage__ = False
+
+    #: run values given to from_trusted through the usual validation, set to True
+    #: while debugging to find data that doesn't match its Model
+    __validate_trusted__ = False
 
     def __init__(self, required=True, description=None, **kwargs):
         """
@@ -57,7 +222,6 @@ class Model(DataCollection):
         self._required = required
         self._description = description
 
-        self._templates = {}
         self._attributes = {}
         self._create_instance_attributes(kwargs)
 
@@ -66,21 +230,10 @@ class Model(DataCollection):
         :return: list of members as name, type tuples
         :rtype: list
         """
-        return filter(
-            lambda m: not m[0].startswith("__") and not inspect.isfunction(m[1]) and not inspect.ismethod(m[1]),
-            inspect.getmembers(self.__class__)
-        )
+        return list(self.__model_members__)
 
     def attribute_count(self):
-
-        attribute_count = 0
-
-        for attribute_name, type_instance in self.getmembers():
-
-            if isinstance(type_instance, DataType):
-                attribute_count += 1
-
-        return attribute_count
+        return len(self.__model_fields__)
 
     def blueprint(self):
 
@@ -96,7 +249,7 @@ class Model(DataCollection):
         blueprint['constraints'] = constraints
 
         fields = dict()
-        for attribute_name, type_instance in self.getmembers():
+        for attribute_name, type_instance in self.__model_members__:
 
             if not isinstance(type_instance, DataType):
                 raise TypeError("%s must be of a DataType subclass" % attribute_name)
@@ -104,41 +257,40 @@ class Model(DataCollection):
             fields[attribute_name] = type_instance.blueprint()
 
         blueprint['fields'] = fields
+        blueprint['rewrite_map'] = dict(self.attribute_rewrite_map())
         return blueprint
 
     def __getattribute__(self, key):
-        value = object.__getattribute__(self, key)
 
         if key[0:1] == "_":
-            return value
-
-        attributes = self.__dict__["_attributes"]
-        templates = self.__dict__["_templates"]
+            return object.__getattribute__(self, key)
 
-        if value is not None and key not in templates:
-            return value
+        validator = type(self).__model_templates__.get(key)
+        if validator is None:
+            return object.__getattribute__(self, key)
 
-        validator = templates.get(key)
         # grab the value from local attribute dictionary for prestans types
-        if validator is not None:
-            value = attributes.get(key)
+        attributes = object.__getattribute__(self, "_attributes")
+        value = attributes.get(key)
 
         # if attribute is a data collection and no value found we need to copy the template
-        if isinstance(validator, DataCollection) and value is None:
-            copied = copy.deepcopy(validator)
+        if value is None:
+            if isinstance(validator, DataCollection):
+                value = attributes[key] = validator._copy_template()
 
-            self._attributes[key] = copied
-            value = copied
+        # input of validate_lazy is validated on first access
+        elif value.__class__ is _LazyValue:
+            value = attributes[key] = value.validate()
 
         return value
 
     def __setattr__(self, key, value):
 
         if key[0:1] == "_":
-            self.__dict__[key] = value
+            object.__setattr__(self, key, value)
             return
 
-        validator = self._templates.get(key)
+        validator = self.__model_templates__.get(key)
         if validator is None:
             raise KeyError("No key named: %s in instance of type: %s" % (key, self.__class__.__name__))
 
@@ -157,29 +309,111 @@ class Model(DataCollection):
                 blueprint=validator.blueprint()
             )
 
+    @classmethod
+    def from_trusted(cls, values=None, **kwargs):
+        """
+        Creates an instance from values that are known to be valid, e.g. read back
+        from your own data store, without validating each attribute.
+
+        Nested Models may be given as instances or dictionaries and Arrays as
+        Array instances or lists. Values are stored as given so they must already
+        be of the python type the attribute template would produce.
+
+            person = Person.from_trusted({"first_name": row.first_name, "age": row.age})
+
+        :param values: attribute values keyed by attribute name
+        :type values: dict
+        :param kwargs: attribute values as named parameters
+        :raises KeyError: for names that aren't attributes of the Model
+        :rtype: Model
+        """
+
+        instance = cls()
+
+        if values:
+            for attribute_name, value in values.items():
+                instance._set_trusted(attribute_name, value)
+
+        for attribute_name, value in kwargs.items():
+            instance._set_trusted(attribute_name, value)
+
+        return instance
+
+    def _set_trusted(self, key, value):
+
+        model_class = type(self)
+
+        if model_class.__validate_trusted__:
+            setattr(self, key, value)
+            return
+
+        template = model_class.__model_templates__.get(key)
+        if template is None:
+            raise KeyError("No key named: %s in instance of type: %s" % (key, model_class.__name__))
+
+        if value is not None and isinstance(template, DataCollection) and value.__class__ is not template.__class__:
+            value = template._from_trusted(value)
+
+        object.__getattribute__(self, "_attributes")[key] = value
+
+    def _from_trusted(self, value):
+        return self.__class__.from_trusted(value)
+
     def _create_instance_attributes(self, arguments):
         """
-        Copies class level attribute templates and makes instance placeholders
+        Makes instance placeholders for the class level attribute templates
 
-        This step is required for direct uses of Model classes. This creates a
-        copy of attribute_names ignores methods and private variables.
-        DataCollection types are deep copied to ignore memory reference conflicts.
+        This step is required for direct uses of Model classes. Templates are
+        shared by all instances of the class, DataCollection attributes are
+        copied from their template when first accessed.
 
-        DataType instances are initialized to None or default value.
+        DataType instances are initialized to None or default value, defaults that
+        can't change are computed once per class.
         """
-        for attribute_name, type_instance in self.getmembers():
-            if isinstance(type_instance, DataType):
-                self._templates[attribute_name] = type_instance
+        constants, variables = self.__model_defaults__ or self.__class__._compile_defaults()
 
-                value = None
-                if attribute_name in arguments:
-                    value = arguments[attribute_name]
+        attributes = self._attributes
+        attributes.update(constants)
 
+        for attribute_name, type_instance in variables:
+            if attribute_name not in arguments:
                 try:
-                    self._attributes[attribute_name] = type_instance.validate(value)
+                    attributes[attribute_name] = type_instance.validate(None)
                 # we can safely ignore required warnings during initialization
                 except exception.RequiredAttributeError:
-                    self._attributes[attribute_name] = None
+                    attributes[attribute_name] = None
+
+        if not arguments:
+            return
+
+        for attribute_name, type_instance in self.__model_fields__:
+            if attribute_name in arguments:
+                try:
+                    attributes[attribute_name] = type_instance.validate(arguments[attribute_name])
+                except exception.RequiredAttributeError:
+                    attributes[attribute_name] = None
+
+    def _copy_template(self):
+        """
+        Creates the value of an unset attribute this instance is the template of,
+        a shallow copy that shares templates with this instance.
+
+        :rtype: Model
+        """
+
+        if self.__model_extra_slots__:
+            copied = copy.copy(self)
+        else:
+            copied = object.__new__(self.__class__)
+            object.__setattr__(copied, "_required", self._required)
+            object.__setattr__(copied, "_description", self._description)
+
+            state = getattr(self, "__dict__", None)
+            if state:
+                copied.__dict__.update(state)
+
+        object.__setattr__(copied, "_attributes", _copy_values(self._attributes))
+        return copied
 
     def get_attribute_keys(self):
         """
@@ -189,21 +423,14 @@ class Model(DataCollection):
         attribute names in a prestans model
         """
 
-        _attribute_keys = list()
-
-        for attribute_name, type_instance in self.getmembers():
-
-            if isinstance(type_instance, DataType):
-                _attribute_keys.append(attribute_name)
-
-        return _attribute_keys
+        return [attribute_name for attribute_name, type_instance in self.__model_fields__]
 
     def get_attribute_filter(self, default_value=False):
         from prestans.parser import AttributeFilter
 
         attribute_filter = AttributeFilter()
 
-        for attribute_name, type_instance in self.getmembers():
+        for attribute_name, type_instance in self.__model_members__:
 
             if isinstance(type_instance, DataCollection):
                 setattr(attribute_filter, attribute_name, type_instance.get_attribute_filter(default_value))
@@ -237,6 +464,11 @@ class Model(DataCollection):
             """
             return None
 
+        if self.__compiled_validation__:
+            validator = model_compiler.validator_for(self, minified is True)
+            if validator is not None:
+                return validator(self, value, attribute_filter, minified)
+
         _model_instance = self.__class__()
 
         rewrite_map = self.attribute_rewrite_map()
@@ -244,7 +476,7 @@ class Model(DataCollection):
         from prestans.parser import AttributeFilter
         from prestans.parser import AttributeFilterImmutable
 
-        for attribute_name, type_instance in self.getmembers():
+        for attribute_name, type_instance in self.__model_members__:
             if not isinstance(type_instance, DataType):
                 raise TypeError("%s must be a DataType subclass" % attribute_name)
 
@@ -291,99 +523,260 @@ class Model(DataCollection):
 
         return _model_instance
 
-    def attribute_rewrite_map(self):
+    def validate_partial(self, value, attribute_filter=None, minified=False):
         """
-        Example: long_name -> a_b
+        Validates only the attributes present in value, e.g. the body of a PATCH
+        request. Nested Models are validated partially as well, Arrays are
+        replaced as a whole and validated in full.
 
-        :return: the rewrite map
-        :rtype: dict
+        Attributes that were not supplied keep their defaults, use
+        get_supplied_attribute_keys on the result to find the ones that were.
+
+        :param value: serializable input to validate
+        :type value: dict | None
+        :param attribute_filter:
+        :type: prestans.parser.AttributeFilter | None
+        :param minified: whether or not the input is minified
+        :type minified: bool
+        :return: the validated model
+        :rtype: Model
         """
 
-        rewrite_map = dict()
-        token_rewrite_map = self.generate_attribute_token_rewrite_map()
+        if self._required and (value is None or not isinstance(value, dict)):
+            raise exception.RequiredAttributeError()
+
+        if not self._required and not value:
+            return None
+
+        from prestans.parser import AttributeFilter
+        from prestans.parser import AttributeFilterImmutable
 
-        for attribute_name, type_instance in self.getmembers():
+        _model_instance = self.__class__()
 
-            if isinstance(type_instance, DataType):
-                attribute_tokens = attribute_name.split('_')
+        attributes = _model_instance._attributes
+        templates = self.__model_templates__
+        reverse_map = self.attribute_rewrite_reverse_map() if minified is True else None
+        has_filter = isinstance(attribute_filter, (AttributeFilter, AttributeFilterImmutable))
 
-                rewritten_attribute_name = ''
-                for token in attribute_tokens:
-                    rewritten_attribute_name += token_rewrite_map[token] + "_"
-                # remove the trailing underscore
-                rewritten_attribute_name = rewritten_attribute_name[:-1]
+        supplied = set()
 
-                rewrite_map[attribute_name] = rewritten_attribute_name
+        for input_value_key, validation_input in value.items():
 
-        return rewrite_map
+            attribute_name = input_value_key
+            if reverse_map is not None:
+                attribute_name = reverse_map.get(input_value_key)
 
-    def attribute_rewrite_reverse_map(self):
+            # unknown keys are ignored like they are by validate
+            type_instance = templates.get(attribute_name)
+            if type_instance is None:
+                continue
+
+            if has_filter and not attribute_filter.is_attribute_visible(attribute_name):
+                continue
+
+            try:
+                if isinstance(type_instance, DataCollection):
+                    sub_attribute_filter = None
+                    if attribute_filter and attribute_name in attribute_filter:
+                        sub_attribute_filter = getattr(attribute_filter, attribute_name)
+
+                    if isinstance(type_instance, Model):
+                        validated_object = type_instance.validate_partial(
+                            validation_input,
+                            sub_attribute_filter,
+                            minified
+                        )
+                    else:
+                        validated_object = type_instance.validate(
+                            validation_input,
+                            sub_attribute_filter,
+                            minified
+                        )
+                else:
+                    validated_object = type_instance.validate(validation_input)
+
+                attributes[attribute_name] = validated_object
+                supplied.add(attribute_name)
+
+            except exception.DataValidationException as exp:
+                raise exception.ValidationError(
+                    message=str(exp),
+                    attribute_name=attribute_name,
+                    value=validation_input,
+                    blueprint=type_instance.blueprint()
+                )
+
+        _model_instance._supplied = frozenset(supplied)
+        return _model_instance
+
+    def validate_lazy(self, value, attribute_filter=None, minified=False):
         """
-        Example: a_b -> long_name
+        Validates the attributes that aren't collections straight away, nested
+        Models and Arrays are validated when they are first accessed and raise
+        ValidationError at that point. Handlers that only look at a few attributes
+        of a large body don't pay for validating the rest of it.
 
-        :return: the reverse rewrite map
-        :rtype: dict
+        Call validate_all on the result to validate everything that is left.
+
+        :param value: serializable input to validate
+        :type value: dict | None
+        :param attribute_filter:
+        :type: prestans.parser.AttributeFilter | None
+        :param minified: whether or not the input is minified
+        :type minified: bool
+        :return: the validated model
+        :rtype: Model
         """
 
-        rewrite_map = dict()
+        if self._required and (value is None or not isinstance(value, dict)):
+            raise exception.RequiredAttributeError()
 
-        token_rewrite_map = self.generate_attribute_token_rewrite_map()
+        if not self._required and not value:
+            return None
 
-        for attribute_name, type_instance in self.getmembers():
+        from prestans.parser import AttributeFilter
+        from prestans.parser import AttributeFilterImmutable
 
-            if isinstance(type_instance, DataType):
+        _model_instance = self.__class__()
 
-                attribute_tokens = attribute_name.split('_')
-                rewritten_attribute_name = ''
-                for token in attribute_tokens:
-                    rewritten_attribute_name += token_rewrite_map[token] + "_"
-                # remove the trailing underscore
-                rewritten_attribute_name = rewritten_attribute_name[:-1]
+        attributes = _model_instance._attributes
+        rewrite_map = self.attribute_rewrite_map()
+        has_filter = isinstance(attribute_filter, (AttributeFilter, AttributeFilterImmutable))
 
-                rewrite_map[rewritten_attribute_name] = attribute_name
+        for attribute_name, type_instance in self.__model_members__:
+            if not isinstance(type_instance, DataType):
+                raise TypeError("%s must be a DataType subclass" % attribute_name)
 
-        return rewrite_map
+            if has_filter and not attribute_filter.is_attribute_visible(attribute_name):
+                attributes[attribute_name] = None
+                continue
 
-    def __contains__(self, attribute_name):
+            input_value_key = attribute_name
+            if minified is True:
+                input_value_key = rewrite_map[attribute_name]
+
+            validation_input = value.get(input_value_key)
+
+            # missing collections are cheap to validate and required ones fail early
+            if isinstance(type_instance, DataCollection) and validation_input is not None:
+                sub_attribute_filter = None
+                if attribute_filter and attribute_name in attribute_filter:
+                    sub_attribute_filter = getattr(attribute_filter, attribute_name)
+
+                attributes[attribute_name] = _LazyValue(
+                    attribute_name,
+                    type_instance,
+                    validation_input,
+                    sub_attribute_filter,
+                    minified
+                )
+                continue
+
+            try:
+                attributes[attribute_name] = type_instance.validate(validation_input)
+            except exception.DataValidationException as exp:
+                raise exception.ValidationError(
+                    message=str(exp),
+                    attribute_name=attribute_name,
+                    value=validation_input,
+                    blueprint=type_instance.blueprint()
+                )
+
+        return _model_instance
 
-        has_key = attribute_name in self.__class__.__dict__
+    def validate_all(self):
+        """
+        Validates the attributes validate_lazy deferred, including those of nested
+        Models and Models held in Arrays
+
+        :raises prestans.exception.ValidationError: for the first invalid attribute
+        :return: this instance
+        :rtype: Model
+        """
 
-        if not has_key:
+        from prestans.types import Array
 
-            base_classes = list()
-            base_classes += list(self.__class__.__bases__)
+        attributes = self._attributes
 
-            while not has_key and base_classes:
+        for attribute_name, type_instance in self.__model_fields__:
+            value = attributes.get(attribute_name)
 
-                # take a base class from the list
-                base_class = base_classes.pop()
+            if value.__class__ is _LazyValue:
+                value = attributes[attribute_name] = value.validate()
 
-                # we found it clear the list
-                if attribute_name in base_class.__dict__:
-                    has_key = True
-                    base_classes = list()
-                # add any more base classes from this class
-                else:
-                    base_classes += list(base_class.__bases__)
+            if isinstance(value, Model):
+                value.validate_all()
+            elif isinstance(value, Array):
+                for element in value:
+                    if isinstance(element, Model):
+                        element.validate_all()
 
-        return has_key
+        return self
 
-    def generate_attribute_token_rewrite_map(self):
+    def get_supplied_attribute_keys(self):
+        """
+        :return: sorted names of the attributes present in the input validate_partial
+        built this instance from, None for instances that weren't validated partially
+        :rtype: list | None
+        """
+
+        supplied = getattr(self, "_supplied", None)
+        if supplied is None:
+            return None
+
+        return sorted(supplied)
+
+    def attribute_rewrite_map(self):
+        """
+        Example: long_name -> a_b
+
+        The map is built once per class and shared, treat it as read only
 
-        rewrite_tokens = self.generate_attribute_tokens()
-        minified_tokens = self.generate_minified_keys(len(rewrite_tokens))
+        :return: the rewrite map
+        :rtype: dict
+        """
+
+        rewrite_maps = self.__model_rewrite_maps__ or self.__class__._compile_rewrite_maps()
+        return rewrite_maps[1]
+
+    def attribute_rewrite_reverse_map(self):
+        """
+        Example: a_b -> long_name
 
-        return dict(zip(rewrite_tokens, minified_tokens))
+        The map is built once per class and shared, treat it as read only
+
+        :return: the reverse rewrite map
+        :rtype: dict
+        """
+
+        rewrite_maps = self.__model_rewrite_maps__ or self.__class__._compile_rewrite_maps()
+        return rewrite_maps[2]
+
+    def __contains__(self, attribute_name):
+        return attribute_name in type(self).__model_field_names__
+
+    @classmethod
+    def has_field(cls, attribute_name):
+        """
+        :param attribute_name: name to look for, inherited attributes included
+        :type attribute_name: str
+        :return: True if attribute_name is an attribute of the Model
+        :rtype: bool
+        """
+        return attribute_name in cls.__model_field_names__
+
+    def generate_attribute_token_rewrite_map(self):
+
+        rewrite_maps = self.__model_rewrite_maps__ or self.__class__._compile_rewrite_maps()
+        return rewrite_maps[0]
 
     def generate_attribute_tokens(self):
 
         rewrite_tokens = list()
 
         # create a list of tokens
-        for attribute_name, type_instance in self.getmembers():
-
-            if isinstance(type_instance, DataType):
-                rewrite_tokens = rewrite_tokens + attribute_name.split('_')
+        for attribute_name, type_instance in self.__model_fields__:
+            rewrite_tokens = rewrite_tokens + attribute_name.split('_')
 
         # remove duplicated; sort alphabetically for the algorithm to work
         rewrite_tokens = list(set(rewrite_tokens))
@@ -448,15 +841,20 @@ class Model(DataCollection):
         from prestans.parser import AttributeFilterImmutable
         from prestans.types import Array
 
-        model_dictionary = dict()
-
-        rewrite_map = self.attribute_rewrite_map()
-
         # convert filter to immutable if it isn't already
         if isinstance(attribute_filter, AttributeFilter):
             attribute_filter = attribute_filter.as_immutable()
 
-        for attribute_name, type_instance in self.getmembers():
+        if self.__compiled_serialization__:
+            serializer = model_compiler.serializer_for(self, minified is True, attribute_filter)
+            if serializer is not None:
+                return serializer(self, attribute_filter, minified)
+
+        model_dictionary = dict()
+
+        rewrite_map = self.attribute_rewrite_map()
+
+        for attribute_name, type_instance in self.__model_members__:
 
             if isinstance(attribute_filter, (AttributeFilter, AttributeFilterImmutable)) and \
                not attribute_filter.is_attribute_visible(attribute_name):
@@ -491,3 +889,63 @@ class Model(DataCollection):
                 model_dictionary[serialized_attribute_name] = self._attributes[attribute_name]
 
         return model_dictionary
+
+
+def _copy_values(attributes):
+    """
+    Copies an attribute dictionary, collections a template was given a value for
+    are copied in turn so instances never share them
+    """
+
+    copied = dict(attributes)
+
+    for attribute_name, value in attributes.items():
+        if isinstance(value, DataCollection):
+            copied[attribute_name] = value._copy_template()
+
+    return copied
+
+
+class _LazyValue(object):
+    """
+    Input for a collection attribute held by a Model returned from validate_lazy
+    """
+
+    __slots__ = ("attribute_name", "template", "value", "attribute_filter", "minified", "validated")
+
+    def __init__(self, attribute_name, template, value, attribute_filter, minified):
+        self.attribute_name = attribute_name
+        self.template = template
+        self.value = value
+        self.attribute_filter = attribute_filter
+        self.minified = minified
+        self.validated = None
+
+    def validate(self):
+
+        if self.validated is not None:
+            return self.validated
+
+        template = self.template
+
+        try:
+            validated = template.validate_lazy(self.value, self.attribute_filter, self.minified)
+        except exception.DataValidationException as exp:
+            raise exception.ValidationError(
+                message=str(exp),
+                attribute_name=self.attribute_name,
+                value=self.value,
+                blueprint=template.blueprint()
+            )
+
+        self.validated = validated
+        return validated
+
+    def as_serializable(self, attribute_filter=None, minified=False):
+        # reached when a Model is serialized without accessing the attribute first
+        validated = self.validate()
+
+        if validated is None:
+            return None
+
+        return validated.as_serializable(attribute_filter, minified)
@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+#
+#  prestans, A WSGI compliant REST micro-framework
+#  http://prestans.org
+#
+#  Copyright (c) 2017, Anomaly Software Pty Ltd.
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#      * Redistributions of source code must retain the above copyright
+#        notice, this list of conditions and the following disclaimer.
+#      * Redistributions in binary form must reproduce the above copyright
+#        notice, this list of conditions and the following disclaimer in the
+#        documentation and/or other materials provided with the distribution.
+#      * Neither the name of Anomaly Software nor the
+#        names of its contributors may be used to endorse or promote products
+#        derived from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+#  ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+#  WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL ANOMALY SOFTWARE BE LIABLE FOR ANY
+#  DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+#  (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+#  LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+#  ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+#  (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#  SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""
+Generates specialised validate and as_serializable functions for Model classes.
+
+Validators are the interpreted Model.validate unrolled for the fields of one
+class; scalar attributes are validated by the function their type compiled
+from its constraints and nested Models by calling their generated function
+directly. They are cached per (Model class, minified).
+
+Serializers are straight line versions of Model.as_serializable for one class,
+minified flag and attribute filter shape; invisible attributes produce no code
+and nested Models, including the elements of arrays, are serialized by calling
+their generated function directly.
+
+Generated functions are discarded whenever a Model class is changed, templates
+are assumed not to be modified once the class is defined.
+"""
+
+import threading
+
+from prestans import exception
+from prestans.types import DataCollection
+from prestans.types import DataType
+
+_validators = {}
+_serializers = {}
+_lock = threading.Lock()
+
+#: attribute filters are chosen by clients, past this many serializers
+#: further shapes use the interpreted implementation
+MAX_SERIALIZERS = 4096
+
+
+def clear():
+    """
+    Discards all generated functions, called by ModelType when a class changes
+    """
+
+    with _lock:
+        _validators.clear()
+        _serializers.clear()
+
+
+def validator_for(template, minified):
+    """
+    :param template: instance of the Model subclass to validate
+    :type template: prestans.types.Model
+    :param minified: True if the input uses minified keys
+    :type minified: bool
+    :return: the generated validate function or None if the class can't be compiled
+    """
+
+    key = (template.__class__, minified)
+
+    try:
+        return _validators[key]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _validators:
+            _ValidatorCompiler(template, minified, set()).compile()
+
+        return _validators[key]
+
+
+def serializer_for(template, minified, attribute_filter):
+    """
+    :param template: instance of the Model subclass to serialize
+    :type template: prestans.types.Model
+    :param minified: True if the output uses minified keys
+    :type minified: bool
+    :param attribute_filter: the filter as passed to as_serializable
+    :type attribute_filter: prestans.parser.AttributeFilterImmutable | None
+    :return: the generated as_serializable function or None if the class can't be compiled
+    """
+
+    key = (template.__class__, minified, _filter_shape(attribute_filter))
+
+    try:
+        return _serializers[key]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _serializers:
+            if len(_serializers) >= MAX_SERIALIZERS:
+                return None
+
+            _SerializerCompiler(template, minified, attribute_filter, set()).compile()
+
+        return _serializers[key]
+
+
+def _filter_shape(attribute_filter):
+    """
+    :return: hashable description of the visibility an attribute filter
+    applies, None for values that don't filter
+    """
+
+    from prestans.parser import AttributeFilterImmutable
+
+    if not isinstance(attribute_filter, AttributeFilterImmutable):
+        return None
+
+    return attribute_filter._shape_key()
+
+
+def uses_model_serializer(model_class):
+    """
+    :return: True unless model_class overrides Model.as_serializable
+    :rtype: bool
+    """
+
+    from prestans.types.model import Model
+
+    return _plain_function(model_class.as_serializable) is _plain_function(Model.as_serializable)
+
+
+class _CodeWriter(object):
+
+    def __init__(self):
+        self._lines = []
+        self._indent = 0
+
+    def line(self, code):
+        self._lines.append("    " * self._indent + code)
+
+    def indent(self):
+        self._indent += 1
+
+    def dedent(self):
+        self._indent -= 1
+
+    def source(self):
+        return "\n".join(self._lines) + "\n"
+
+
+class _ValidatorCompiler(object):
+
+    def __init__(self, template, minified, compiling):
+        """
+        :param compiling: (class, minified) keys being compiled further up the stack,
+        self referencing models fall back to calling validate for the recursive field
+        """
+
+        model_class = template.__class__
+
+        self._template = template
+        self._model_class = model_class
+        self._minified = minified
+        self._compiling = compiling
+
+        self._namespace = {
+            "DataValidationException": exception.DataValidationException,
+            "ValidationError": exception.ValidationError,
+            "RequiredAttributeError": exception.RequiredAttributeError,
+            "model_class": model_class,
+            "new_instance": object.__new__
+        }
+
+    def _constant(self, prefix, index, value):
+        name = "%s_%d" % (prefix, index)
+        self._namespace[name] = value
+        return name
+
+    def compile(self):
+
+        from prestans.parser import AttributeFilter
+        from prestans.parser import AttributeFilterImmutable
+        from prestans.types.model import Model
+
+        key = (self._model_class, self._minified)
+        members = self._model_class.__model_members__
+
+        # the interpreted path raises TypeError for these
+        if any(not isinstance(member, DataType) for name, member in members):
+            _validators[key] = None
+            return
+
+        self._compiling.add(key)
+
+        rewrite_map = {}
+        if self._minified:
+            rewrite_map = self._template.attribute_rewrite_map()
+
+        self._namespace["filter_types"] = (AttributeFilter, AttributeFilterImmutable)
+
+        writer = _CodeWriter()
+        writer.line("def validate(template, value, attribute_filter, minified):")
+        writer.indent()
+
+        writer.line("if template._required and (value is None or not isinstance(value, dict)):")
+        writer.line("    raise RequiredAttributeError()")
+        writer.line("if not template._required and not value:")
+        writer.line("    return None")
+
+        # instances are assembled directly unless the class customises __init__
+        if _plain_function(self._model_class.__init__) is _plain_function(Model.__init__):
+            self._namespace["set_required"] = Model._required.__set__
+            self._namespace["set_description"] = Model._description.__set__
+            self._namespace["set_attributes"] = Model._attributes.__set__
+
+            writer.line("instance = new_instance(model_class)")
+            writer.line("set_required(instance, True)")
+            writer.line("set_description(instance, None)")
+            writer.line("attributes = {}")
+            writer.line("set_attributes(instance, attributes)")
+        else:
+            writer.line("instance = model_class()")
+            writer.line("attributes = instance._attributes")
+
+        writer.line("has_filter = isinstance(attribute_filter, filter_types)")
+
+        for index, (attribute_name, type_instance) in enumerate(members):
+            self._write_attribute(writer, index, attribute_name, rewrite_map.get(attribute_name, attribute_name),
+                                  type_instance)
+
+        writer.line("return instance")
+
+        code = compile(writer.source(), "<prestans validator %s>" % self._model_class.__name__, "exec")
+        exec(code, self._namespace)
+
+        self._compiling.discard(key)
+        _validators[key] = self._namespace["validate"]
+
+    def _write_attribute(self, writer, index, attribute_name, input_key, type_instance):
+
+        template = self._constant("template", index, type_instance)
+
+        writer.line("# %s" % attribute_name)
+        writer.line("if has_filter and not attribute_filter.is_attribute_visible(%r):" % attribute_name)
+        writer.line("    attributes[%r] = None" % attribute_name)
+        writer.line("else:")
+        writer.indent()
+
+        writer.line("validation_input = value[%r] if %r in value else None" % (input_key, input_key))
+        writer.line("try:")
+        writer.indent()
+
+        if isinstance(type_instance, DataCollection):
+            writer.line("sub_attribute_filter = None")
+            writer.line("if attribute_filter and %r in attribute_filter:" % attribute_name)
+            writer.line("    sub_attribute_filter = getattr(attribute_filter, %r)" % attribute_name)
+
+            nested_validator = self._nested_validator(type_instance)
+            if nested_validator is not None:
+                validator = self._constant("validator", index, nested_validator)
+                writer.line("attributes[%r] = %s(%s, validation_input, sub_attribute_filter, minified)" % (
+                    attribute_name, validator, template
+                ))
+            else:
+                writer.line("attributes[%r] = %s.validate(validation_input, sub_attribute_filter, minified)" % (
+                    attribute_name, template
+                ))
+
+        else:
+            # scalar types compile their own constraints, see CompiledDataType
+            writer.line("attributes[%r] = %s.validate(validation_input)" % (attribute_name, template))
+
+        writer.dedent()
+        writer.line("except DataValidationException as exp:")
+        writer.line("    raise ValidationError(")
+        writer.line("        message=str(exp),")
+        writer.line("        attribute_name=%r," % attribute_name)
+        writer.line("        value=validation_input,")
+        writer.line("        blueprint=%s.blueprint()" % template)
+        writer.line("    )")
+
+        writer.dedent()
+
+    def _nested_validator(self, type_instance):
+        """
+        :return: the generated function for a nested Model or None to call its validate method
+        """
+
+        from prestans.types.model import Model
+
+        nested_class = type_instance.__class__
+
+        if not isinstance(type_instance, Model) or not nested_class.__compiled_validation__:
+            return None
+
+        # a subclass that overrides validate must have it called
+        if _plain_function(nested_class.validate) is not _plain_function(Model.validate):
+            return None
+
+        key = (nested_class, self._minified)
+
+        if key in self._compiling:
+            return None
+
+        if key not in _validators:
+            _ValidatorCompiler(type_instance, self._minified, self._compiling).compile()
+
+        return _validators[key]
+
+
+class _SerializerCompiler(object):
+
+    def __init__(self, template, minified, attribute_filter, compiling):
+        """
+        :param compiling: keys being compiled further up the stack, self referencing
+        models fall back to calling as_serializable for the recursive field
+        """
+
+        self._template = template
+        self._model_class = template.__class__
+        self._minified = minified
+        self._attribute_filter = attribute_filter
+        self._shape = _filter_shape(attribute_filter)
+        self._compiling = compiling
+
+        self._namespace = {}
+
+    def _constant(self, prefix, index, value):
+        name = "%s_%d" % (prefix, index)
+        self._namespace[name] = value
+        return name
+
+    def compile(self):
+
+        from prestans.types import Array
+        from prestans.types import DataStructure
+
+        key = (self._model_class, self._minified, self._shape)
+        members = self._model_class.__model_members__
+
+        # the interpreted path serializes these as None or fails on the rewrite map
+        if any(not isinstance(member, DataType) for name, member in members):
+            _serializers[key] = None
+            return
+
+        self._compiling.add(key)
+
+        rewrite_map = {}
+        if self._minified:
+            rewrite_map = self._template.attribute_rewrite_map()
+
+        attribute_filter = self._attribute_filter
+        self._namespace["Array"] = Array
+
+        writer = _CodeWriter()
+        writer.line("def as_serializable(instance, attribute_filter, minified):")
+        writer.indent()
+        writer.line("attributes = instance._attributes")
+        writer.line("model_dictionary = {}")
+
+        for index, (attribute_name, type_instance) in enumerate(members):
+
+            if self._shape is not None and not attribute_filter.is_attribute_visible(attribute_name):
+                continue
+
+            output_key = rewrite_map.get(attribute_name, attribute_name)
+
+            # sub filter handed to nested collections
+            sub_attribute_filter = None
+            sub_attribute_filter_code = "None"
+            if self._shape is not None and attribute_name in attribute_filter:
+                sub_attribute_filter = getattr(attribute_filter, attribute_name)
+                sub_attribute_filter_code = "getattr(attribute_filter, %r)" % attribute_name
+
+            if isinstance(type_instance, DataCollection):
+                writer.line("value = attributes.get(%r)" % attribute_name)
+                writer.line("if value is None:")
+                writer.line("    model_dictionary[%r] = %s" % (
+                    output_key, "[]" if isinstance(type_instance, Array) else "None"
+                ))
+
+                if isinstance(type_instance, Array):
+                    element_template = type_instance.element_template
+                    element_serializer = self._nested_serializer(element_template, sub_attribute_filter)
+
+                    if element_serializer is not None:
+                        element_class = self._constant("element_class", index, element_template.__class__)
+                        serializer = self._constant("serializer", index, element_serializer)
+                        writer.line("elif value.__class__ is Array and value._element_template.__class__ is %s:" %
+                                    element_class)
+                        writer.line("    model_dictionary[%r] = [" % output_key)
+                        writer.line("        %s(element, %s, minified) if element.__class__ is %s else" % (
+                            serializer, sub_attribute_filter_code, element_class
+                        ))
+                        writer.line("        element.as_serializable(%s, minified)" % sub_attribute_filter_code)
+                        writer.line("        for element in value._array_elements")
+                        writer.line("    ]")
+                else:
+                    nested_serializer = self._nested_serializer(type_instance, sub_attribute_filter)
+
+                    if nested_serializer is not None:
+                        nested_class = self._constant("nested_class", index, type_instance.__class__)
+                        serializer = self._constant("serializer", index, nested_serializer)
+                        writer.line("elif value.__class__ is %s:" % nested_class)
+                        writer.line("    model_dictionary[%r] = %s(value, %s, minified)" % (
+                            output_key, serializer, sub_attribute_filter_code
+                        ))
+
+                writer.line("else:")
+                writer.line("    model_dictionary[%r] = value.as_serializable(%s, minified)" % (
+                    output_key, sub_attribute_filter_code
+                ))
+
+            elif isinstance(type_instance, DataStructure):
+                template = self._constant("template", index, type_instance)
+                writer.line("value = attributes.get(%r)" % attribute_name)
+                writer.line("model_dictionary[%r] = None if value is None else %s.as_serializable(value)" % (
+                    output_key, template
+                ))
+
+            else:
+                writer.line("model_dictionary[%r] = attributes.get(%r)" % (output_key, attribute_name))
+
+        writer.line("return model_dictionary")
+
+        code = compile(writer.source(), "<prestans serializer %s>" % self._model_class.__name__, "exec")
+        exec(code, self._namespace)
+
+        self._compiling.discard(key)
+        _serializers[key] = self._namespace["as_serializable"]
+
+    def _nested_serializer(self, type_instance, sub_attribute_filter):
+        """
+        :return: the generated function for a nested Model or None to call its as_serializable method
+        """
+
+        from prestans.types.model import Model
+
+        nested_class = type_instance.__class__
+
+        if not isinstance(type_instance, Model) or not nested_class.__compiled_serialization__:
+            return None
+
+        if not uses_model_serializer(nested_class):
+            return None
+
+        key = (nested_class, self._minified, _filter_shape(sub_attribute_filter))
+
+        if key in self._compiling:
+            return None
+
+        if key not in _serializers:
+            if len(_serializers) >= MAX_SERIALIZERS:
+                return None
+
+            _SerializerCompiler(type_instance, self._minified, sub_attribute_filter, self._compiling).compile()
+
+        return _serializers[key]
+
+
+def _plain_function(method):
+    # unbound methods in python 2 wrap the function
+    return getattr(method, "__func__", method)
@@ -34,6 +34,7 @@ from datetime import time
 
 from prestans import exception
 from prestans.types import DataStructure
+from prestans.util import string_types
 
 
 class Time(DataStructure):
@@ -91,8 +92,6 @@ class Time(DataStructure):
         return blueprint
 
     def validate(self, value):
-        from prestans.util import string_types
-
         _validated_value = None
 
         # no need to do any validation if None, not required and default provided
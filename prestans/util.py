@@ -10,3 +10,81 @@ if sys.version_info < (3,):
     string_types = (str, unicode)
 else:
     string_types = (str,)
+
+
+# perf_counter is monotonic and high resolution, absent on python 2
+if sys.version_info >= (3, 3):
+    from time import perf_counter as clock
+else:
+    from time import time as clock
+
+
+# read only view of a dict, python 2 has no public equivalent and shares the dict
+if sys.version_info >= (3, 3):
+    from types import MappingProxyType as frozen_dict
+else:
+    frozen_dict = dict
+
+
+def with_metaclass(metaclass, *bases):
+    """
+    Creates a base class with a metaclass in a way that works with both
+    python 2 and python 3 class syntax
+
+        class Handler(with_metaclass(HandlerType, object)):
+            pass
+    """
+
+    class TemporaryMetaclass(type):
+
+        def __new__(cls, name, this_bases, attributes):
+            return metaclass(name, bases, attributes)
+
+    return type.__new__(TemporaryMetaclass, "temporary_class", (), {})
+
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    import inspect
+    import threading
+
+    _event_loops = threading.local()
+
+    def isawaitable(value):
+        return inspect.isawaitable(value)
+
+    def is_coroutine_function(function):
+        """
+        :return: True if function, or the function it wraps, is declared with async def
+        :rtype: bool
+        """
+        function = getattr(function, "__func__", function)
+
+        while function is not None:
+            if inspect.iscoroutinefunction(function):
+                return True
+            function = getattr(function, "__wrapped__", None)
+
+        return False
+
+    def run_coroutine(coroutine):
+        """
+        Drives an awaitable to completion from synchronous code using an event
+        loop private to the calling thread, used when serving async handlers over WSGI
+        """
+        event_loop = getattr(_event_loops, "event_loop", None)
+
+        if event_loop is None or event_loop.is_closed():
+            event_loop = asyncio.new_event_loop()
+            _event_loops.event_loop = event_loop
+
+        return event_loop.run_until_complete(coroutine)
+else:
+    def isawaitable(value):
+        return False
+
+    def is_coroutine_function(function):
+        return False
+
+    def run_coroutine(coroutine):
+        raise TypeError("coroutines require python 3.5 or later")
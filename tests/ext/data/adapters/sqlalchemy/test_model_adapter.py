@@ -231,3 +231,44 @@ class ModelAdapterUnitTest(unittest.TestCase):
         person.short_string = "a longer string"
 
         self.assertRaises(exception.InconsistentPersistentDataError, model_adapter.adapt_persistent_to_rest, person)
+
+
+class TrustedModelAdapterUnitTest(unittest.TestCase):
+
+    def setUp(self):
+        adapters.registry.register_persistent_rest_pair(Address, AddressREST, trusted=True)
+
+    def tearDown(self):
+        adapters.registry.clear_registered_adapters()
+        types.Model.__validate_trusted__ = False
+
+    def test_values_copied_without_validation(self):
+        model_adapter = adapters.ModelAdapter(rest_model_class=PersonREST, persistent_model_class=Person, trusted=True)
+        self.assertTrue(model_adapter.trusted)
+
+        person = PersonWithBasicArrays()
+        person.short_string = "a longer string"
+        person.integers.extend([1, 2])
+
+        person_rest = model_adapter.adapt_persistent_to_rest(person)
+        self.assertEqual(person_rest.short_string, "a longer string")
+        self.assertEqual(person_rest.first_name, "first_name")
+        self.assertEqual(person_rest.integers.as_serializable(), [1, 2])
+
+    def test_nested_models(self):
+        model_adapter = adapters.ModelAdapter(rest_model_class=PersonREST, persistent_model_class=Person, trusted=True)
+
+        person = PersonWithAddress()
+        person.address.short_string = "a longer string"
+
+        person_rest = model_adapter.adapt_persistent_to_rest(person)
+        self.assertEqual(person_rest.address.short_string, "a longer string")
+
+    def test_debug_mode_raises_inconsistent_data(self):
+        types.Model.__validate_trusted__ = True
+        model_adapter = adapters.ModelAdapter(rest_model_class=PersonREST, persistent_model_class=Person, trusted=True)
+
+        person = Person()
+        person.short_string = "a longer string"
+
+        self.assertRaises(exception.InconsistentPersistentDataError, model_adapter.adapt_persistent_to_rest, person)
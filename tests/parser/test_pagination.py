@@ -0,0 +1,73 @@
+import unittest
+
+from webob import Request
+
+from prestans import exception
+from prestans import parser
+from prestans import types
+
+
+class _Parameters(object):
+
+    def __init__(self, offset=None, limit=None):
+        self.offset = offset
+        self.limit = limit
+
+
+def _numbers(count):
+    array = types.Array(element_template=types.Integer())
+    array.extend(list(range(count)))
+    return array
+
+
+class PaginationParameterSetUnitTest(unittest.TestCase):
+
+    def test_defaults(self):
+        parameter_set = parser.PaginationParameterSet().validate(Request.blank("/"))
+        self.assertEqual(parameter_set.offset, 0)
+        self.assertEqual(parameter_set.limit, 100)
+
+    def test_validate(self):
+        parameter_set = parser.PaginationParameterSet().validate(Request.blank("/?offset=20&limit=10"))
+        self.assertEqual(parameter_set.offset, 20)
+        self.assertEqual(parameter_set.limit, 10)
+
+        self.assertRaises(
+            exception.ValidationError,
+            parser.PaginationParameterSet().validate,
+            Request.blank("/?limit=0")
+        )
+
+
+class PaginateUnitTest(unittest.TestCase):
+
+    def test_first_page(self):
+        page = parser.paginate(_numbers(25), _Parameters(0, 10))
+        self.assertEqual(page.elements.as_serializable(), list(range(10)))
+        self.assertEqual(page.offset, 0)
+        self.assertEqual(page.limit, 10)
+        self.assertEqual(page.total, 25)
+        self.assertEqual(page.next_offset, 10)
+        self.assertIsNone(page.previous_offset)
+
+    def test_last_page(self):
+        page = parser.paginate(_numbers(25), _Parameters(20, 10))
+        self.assertEqual(page.elements.as_serializable(), [20, 21, 22, 23, 24])
+        self.assertIsNone(page.next_offset)
+        self.assertEqual(page.previous_offset, 10)
+
+    def test_beyond_last_page(self):
+        page = parser.paginate(_numbers(25), _Parameters(40, 10))
+        self.assertEqual(len(page.elements), 0)
+        self.assertIsNone(page.next_offset)
+        self.assertEqual(page.previous_offset, 15)
+
+    def test_no_limit(self):
+        page = parser.paginate(_numbers(5), _Parameters(2))
+        self.assertEqual(list(page.elements), [2, 3, 4])
+        self.assertIsNone(page.next_offset)
+        self.assertEqual(page.previous_offset, 0)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, parser.paginate, _numbers(5), _Parameters(-1, 10))
+        self.assertRaises(ValueError, parser.paginate, _numbers(5), _Parameters(0, -1))
@@ -69,6 +69,8 @@ class VerbConfigTest(unittest.TestCase):
         self.assertEqual(blueprint["parameter_sets"], [])
         self.assertIsNone(blueprint["body_template"])
         self.assertIsNone(blueprint["request_attribute_filter"])
+        self.assertFalse(blueprint["partial_body"])
+        self.assertFalse(blueprint["lazy_body"])
 
     def test_blueprint(self):
 
@@ -122,6 +124,17 @@ class VerbConfigTest(unittest.TestCase):
     def test_request_attribute_filter(self):
         pass
 
+    def test_partial_body(self):
+        self.assertFalse(VerbConfig().partial_body)
+        self.assertTrue(VerbConfig(partial_body=True).partial_body)
+        self.assertTrue(VerbConfig(partial_body=True).blueprint()["partial_body"])
+
+    def test_lazy_body(self):
+        self.assertFalse(VerbConfig().lazy_body)
+        self.assertTrue(VerbConfig(lazy_body=True).lazy_body)
+        self.assertTrue(VerbConfig(lazy_body=True).blueprint()["lazy_body"])
+        self.assertRaises(ValueError, VerbConfig, partial_body=True, lazy_body=True)
+
     def test_boolean_array(self):
         boolean_array = types.Array(element_template=types.Boolean())
         verb_config = VerbConfig(response_template=boolean_array)
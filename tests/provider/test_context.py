@@ -0,0 +1,55 @@
+import threading
+import unittest
+
+from prestans.provider import auth
+from prestans.provider import cache
+from prestans.provider import context
+from prestans.provider import throttle
+
+
+class RequestContextUnitTest(unittest.TestCase):
+
+    def test_bind_and_unbind(self):
+        self.assertIsNone(context.current())
+
+        token = context.bind("request", True)
+        self.assertEqual(context.current().request, "request")
+        self.assertEqual(context.current().debug, True)
+
+        context.unbind(token)
+        self.assertIsNone(context.current())
+
+    def test_nested_bind(self):
+        outer = context.bind("outer", False)
+        inner = context.bind("inner", True)
+        self.assertEqual(context.current().request, "inner")
+
+        context.unbind(inner)
+        self.assertEqual(context.current().request, "outer")
+
+        context.unbind(outer)
+        self.assertIsNone(context.current())
+
+    def test_not_visible_to_other_threads(self):
+        token = context.bind("request", True)
+        seen = []
+
+        thread = threading.Thread(target=lambda: seen.append(context.current()))
+        thread.start()
+        thread.join()
+
+        context.unbind(token)
+        self.assertEqual(seen, [None])
+
+    def test_providers_read_bound_request(self):
+        providers = [auth.Base(), cache.Base(), throttle.Base()]
+
+        token = context.bind("request", True)
+        for provider in providers:
+            self.assertEqual(provider.request, "request")
+            self.assertEqual(provider.debug, True)
+        context.unbind(token)
+
+        for provider in providers:
+            self.assertIsNone(provider.request)
+            self.assertEqual(provider.debug, False)
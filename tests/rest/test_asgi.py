@@ -0,0 +1,266 @@
+import asyncio
+import json
+import tempfile
+import unittest
+
+from mock import patch
+
+from prestans.http import STATUS
+from prestans.metrics import MetricsRegistry
+from prestans import parser
+from prestans import rest
+from prestans import types
+
+
+class MyModel(types.Model):
+    id = types.Integer()
+    name = types.String(required=False)
+
+
+class _ModelHandler(rest.RequestHandler):
+    __parser_config__ = parser.Config(
+        GET=parser.VerbConfig(
+            response_template=MyModel(),
+            response_attribute_filter_default_value=True
+        ),
+        POST=parser.VerbConfig(
+            body_template=MyModel(),
+            response_template=MyModel(),
+            response_attribute_filter_default_value=True
+        )
+    )
+
+    def get(self, id):
+        model = MyModel()
+        model.id = id
+        self.response.body = model
+
+    def post(self, id):
+        model = MyModel()
+        model.id = id
+        model.name = self.request.parsed_body.name
+        self.response.status = STATUS.CREATED
+        self.response.body = model
+
+
+class _StreamHandler(rest.RequestHandler):
+    __parser_config__ = parser.Config(
+        GET=parser.VerbConfig(
+            response_template=types.Array(element_template=MyModel()),
+            response_attribute_filter_default_value=True
+        )
+    )
+
+    def get(self):
+        models = ({"id": index} for index in range(250))
+        self.response.body = types.LazyArray(models, element_template=MyModel(), chunk_size=50)
+
+
+def _router():
+    return rest.RequestRouter([
+        (r"/model/([0-9]+)", _ModelHandler),
+        (r"/models", _StreamHandler)
+    ], application_name="asgi-test")
+
+
+def _scope(method, path, headers=None, root_path="", query_string=b""):
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "root_path": root_path,
+        "query_string": query_string,
+        "headers": headers or [],
+        "server": ("testserver", 8000),
+        "client": ("127.0.0.1", 5000)
+    }
+
+
+def _call(application, scope, body_chunks=(b"",)):
+
+    received = [{
+        "type": "http.request",
+        "body": chunk,
+        "more_body": index < len(body_chunks) - 1
+    } for index, chunk in enumerate(body_chunks)]
+    sent = []
+
+    async def receive():
+        return received.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(application(scope, receive, send))
+    return sent
+
+
+class ASGIApplicationTest(unittest.TestCase):
+
+    def test_requires_coroutine_safe_context(self):
+        with patch("prestans.provider.context.COROUTINE_SAFE", False):
+            self.assertRaises(RuntimeError, rest.ASGIApplication, _router())
+
+    def test_get(self):
+        sent = _call(rest.ASGIApplication(_router()), _scope("GET", "/model/123"))
+
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(sent[0]["type"], "http.response.start")
+        self.assertEqual(sent[0]["status"], STATUS.OK)
+        self.assertIn((b"Content-Type", b"application/json; charset=UTF-8"), sent[0]["headers"])
+
+        self.assertEqual(sent[1]["type"], "http.response.body")
+        self.assertEqual(json.loads(sent[1]["body"].decode("utf-8")), {"id": 123, "name": None})
+
+    def test_post_body_read_from_receive_channel(self):
+        sent = _call(
+            rest.ASGIApplication(_router()),
+            _scope("POST", "/model/1", headers=[(b"content-type", b"application/json")]),
+            body_chunks=(b'{"id": 1, ', b'"name": "prestans"}')
+        )
+
+        self.assertEqual(sent[0]["status"], STATUS.CREATED)
+        self.assertEqual(json.loads(sent[1]["body"].decode("utf-8")), {"id": 1, "name": "prestans"})
+
+    def test_error_response(self):
+        sent = _call(rest.ASGIApplication(_router()), _scope("GET", "/missing"))
+
+        self.assertEqual(sent[0]["status"], STATUS.NOT_FOUND)
+        self.assertEqual(json.loads(sent[1]["body"].decode("utf-8"))["code"], STATUS.NOT_FOUND)
+
+    def test_disconnect_before_body(self):
+        sent = []
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(rest.ASGIApplication(_router())(_scope("POST", "/model/1"), receive, send))
+        self.assertEqual(sent, [])
+
+    def test_lifespan(self):
+        router = _router()
+        received = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return received.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(rest.ASGIApplication(router)({"type": "lifespan"}, receive, send))
+
+        self.assertEqual(sent, [{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}])
+        self.assertIsNotNone(router._route_map)
+
+    def test_unsupported_scope(self):
+        async def receive():
+            return {}
+
+        async def send(message):
+            pass
+
+        application = rest.ASGIApplication(_router())
+        self.assertRaises(ValueError, asyncio.run, application({"type": "websocket"}, receive, send))
+
+
+class ASGIRouterDispatch(unittest.TestCase):
+
+    def test_metrics_recorded(self):
+        metrics = MetricsRegistry()
+        router = rest.RequestRouter([
+            (r"/model/([0-9]+)", _ModelHandler)
+        ], application_name="asgi-test", metrics=metrics)
+
+        _call(rest.ASGIApplication(router), _scope("GET", "/model/1"))
+        _call(rest.ASGIApplication(router), _scope("GET", "/missing"))
+
+        requests_total = metrics.get("prestans_requests_total")
+        self.assertEqual(requests_total.value(("%s._ModelHandler" % __name__, "GET", "200")), 1)
+        self.assertEqual(requests_total.value(("", "GET", "404")), 1)
+
+    def test_route_resolved_once(self):
+        router = rest.RequestRouter([
+            (r"/model/([0-9]+)", _ModelHandler)
+        ], application_name="asgi-test", route_cache_size=10)
+
+        for path in ("/model/1", "/model/1", "/model/2", "/missing"):
+            _call(rest.ASGIApplication(router), _scope("GET", path))
+
+        self.assertEqual(router.route_cache_hits, 1)
+        self.assertEqual(router.route_cache_misses, 3)
+
+    def test_sync_handler_profiled(self):
+        profiler = rest.RequestProfiler(tempfile.mkdtemp(), sample_rate=1, dump_interval=3600)
+        router = rest.RequestRouter([
+            (r"/model/([0-9]+)", _ModelHandler)
+        ], application_name="asgi-test", profiler=profiler)
+
+        _call(rest.ASGIApplication(router), _scope("GET", "/model/1"))
+        self.assertIn("%s._ModelHandler" % __name__, profiler.stats)
+
+
+class ASGIStreamedResponse(unittest.TestCase):
+
+    def test_lazy_array_streamed(self):
+        sent = _call(rest.ASGIApplication(_router()), _scope("GET", "/models"))
+
+        self.assertEqual(sent[0]["type"], "http.response.start")
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertNotIn(b"content-length", dict(sent[0]["headers"]))
+
+        for message in sent[1:-1]:
+            self.assertEqual(message["type"], "http.response.body")
+            self.assertTrue(message["more_body"])
+
+        self.assertGreater(len(sent), 3)
+        self.assertFalse(sent[-1].get("more_body", False))
+
+        models = json.loads(b"".join(message["body"] for message in sent[1:]).decode("utf-8"))
+        self.assertEqual(len(models), 250)
+        self.assertEqual(models[249]["id"], 249)
+
+    def test_streamed_metrics_recorded(self):
+        metrics = MetricsRegistry()
+        router = rest.RequestRouter([
+            (r"/models", _StreamHandler)
+        ], application_name="asgi-test", metrics=metrics)
+
+        _call(rest.ASGIApplication(router), _scope("GET", "/models"))
+
+        requests_total = metrics.get("prestans_requests_total")
+        self.assertEqual(requests_total.value(("%s._StreamHandler" % __name__, "GET", "200")), 1)
+
+
+class ASGIBuildEnviron(unittest.TestCase):
+
+    def test_build_environ(self):
+        environ = rest.ASGIApplication.build_environ(_scope(
+            "GET", "/api/model/1",
+            headers=[
+                (b"content-type", b"application/json"),
+                (b"accept", b"application/json"),
+                (b"x-custom", b"a"),
+                (b"x-custom", b"b")
+            ],
+            root_path="/api",
+            query_string=b"a=1"
+        ), b"body")
+
+        self.assertEqual(environ["REQUEST_METHOD"], "GET")
+        self.assertEqual(environ["SCRIPT_NAME"], "/api")
+        self.assertEqual(environ["PATH_INFO"], "/model/1")
+        self.assertEqual(environ["QUERY_STRING"], "a=1")
+        self.assertEqual(environ["SERVER_NAME"], "testserver")
+        self.assertEqual(environ["SERVER_PORT"], "8000")
+        self.assertEqual(environ["REMOTE_ADDR"], "127.0.0.1")
+        self.assertEqual(environ["CONTENT_TYPE"], "application/json")
+        self.assertEqual(environ["CONTENT_LENGTH"], "4")
+        self.assertEqual(environ["HTTP_ACCEPT"], "application/json")
+        self.assertEqual(environ["HTTP_X_CUSTOM"], "a,b")
+        self.assertEqual(environ["wsgi.input"].read(), b"body")
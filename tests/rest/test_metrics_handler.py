@@ -0,0 +1,92 @@
+import unittest
+
+from prestans import exception
+from prestans.http import STATUS
+from prestans.metrics import MetricsRegistry
+from prestans import parser
+from prestans import rest
+from prestans import types
+
+
+class MyModel(types.Model):
+    id = types.Integer()
+
+
+class _ModelHandler(rest.RequestHandler):
+    __parser_config__ = parser.Config(
+        GET=parser.VerbConfig(
+            response_template=MyModel(),
+            response_attribute_filter_default_value=True
+        )
+    )
+
+    def get(self):
+        model = MyModel()
+        model.id = 1
+        self.response.body = model
+
+    def delete(self):
+        raise exception.Forbidden()
+
+
+class RouterMetrics(unittest.TestCase):
+
+    def setUp(self):
+        from webtest import TestApp
+
+        self.metrics = MetricsRegistry()
+        self.app = TestApp(app=rest.RequestRouter([
+            (r"/model", _ModelHandler),
+            (r"/metrics", rest.MetricsHandler)
+        ], application_name="metrics-test", metrics=self.metrics))
+
+        self.handler_name = "%s._ModelHandler" % __name__
+
+    def test_requests_counted(self):
+        self.app.get("/model")
+        self.app.get("/model")
+        self.app.delete("/model", expect_errors=True)
+        self.app.get("/missing", expect_errors=True)
+
+        requests_total = self.metrics.get("prestans_requests_total")
+        self.assertEqual(requests_total.value((self.handler_name, "GET", "200")), 2)
+        self.assertEqual(requests_total.value((self.handler_name, "DELETE", "403")), 1)
+        self.assertEqual(requests_total.value(("", "GET", "404")), 1)
+
+    def test_durations_and_sizes(self):
+        response = self.app.get("/model")
+
+        cumulative, count, total = self.metrics.get("prestans_request_duration_seconds").collect()[
+            (self.handler_name, "GET")
+        ]
+        self.assertEqual(count, 1)
+
+        cumulative, count, total = self.metrics.get("prestans_response_size_bytes").collect()[
+            (self.handler_name, "GET")
+        ]
+        self.assertEqual(count, 1)
+        self.assertEqual(total, len(response.body))
+
+    def test_errors_counted_by_error_response(self):
+        self.app.delete("/model", expect_errors=True)
+        self.app.get("/missing", expect_errors=True)
+
+        errors_total = self.metrics.get("prestans_errors_total")
+        self.assertEqual(errors_total.value(("403", "Forbidden")), 1)
+        self.assertEqual(errors_total.value(("404", "NoEndpointError")), 1)
+
+    def test_scrape(self):
+        self.app.get("/model")
+        response = self.app.get("/metrics")
+
+        self.assertEqual(response.status_int, STATUS.OK)
+        self.assertEqual(response.headers["Content-Type"], rest.MetricsHandler.CONTENT_TYPE)
+        self.assertIn(
+            'prestans_requests_total{handler="%s",verb="GET",status="200"} 1.0' % self.handler_name,
+            response.text
+        )
+        self.assertIn("# TYPE prestans_request_duration_seconds histogram", response.text)
+
+    def test_metrics_handler_requires_registry(self):
+        router = rest.RequestRouter([(r"/metrics", rest.MetricsHandler)])
+        self.assertRaises(ValueError, router.compile)
@@ -0,0 +1,109 @@
+import unittest
+
+from prestans.http import STATUS
+from prestans import parser
+from prestans import rest
+from prestans import types
+
+
+class MyModel(types.Model):
+    id = types.Integer()
+    name = types.String(required=False)
+
+
+class MyParameterSet(parser.ParameterSet):
+    name = types.String(required=False)
+
+
+class _TimedHandler(rest.RequestHandler):
+    __parser_config__ = parser.Config(
+        GET=parser.VerbConfig(
+            response_template=MyModel(),
+            response_attribute_filter_default_value=True,
+            parameter_sets=[MyParameterSet()]
+        ),
+        POST=parser.VerbConfig(
+            body_template=MyModel(),
+            response_template=MyModel(),
+            response_attribute_filter_default_value=True
+        )
+    )
+
+    def get(self):
+        model = MyModel()
+        model.id = 1
+        self.response.body = model
+
+    def post(self):
+        self.response.status = STATUS.CREATED
+        self.response.body = self.request.parsed_body
+
+
+class PhaseTimerUnitTest(unittest.TestCase):
+
+    def test_defaults(self):
+        phase_timer = rest.PhaseTimer()
+        self.assertIsNone(phase_timer.label)
+        self.assertEqual(phase_timer.phases, [])
+        self.assertFalse(phase_timer.server_timing)
+        self.assertTrue(rest.PhaseTimer(server_timing=True).server_timing)
+
+    def test_stop(self):
+        phase_timer = rest.PhaseTimer()
+
+        started = phase_timer.start()
+        phase_timer.stop(phase_timer.ROUTE, started)
+        phase_timer.stop(phase_timer.HANDLER, started)
+        phase_timer.stop(phase_timer.HANDLER, started)
+
+        self.assertEqual([name for name, seconds in phase_timer.phases], ["route", "handler", "handler"])
+        self.assertTrue(phase_timer.duration(phase_timer.ROUTE) >= 0)
+        self.assertEqual(phase_timer.duration(phase_timer.DUMPS), 0)
+
+    def test_as_server_timing(self):
+        phase_timer = rest.PhaseTimer()
+        phase_timer.phases.append(("route", 0.0015))
+        phase_timer.phases.append(("handler", 0.25))
+
+        self.assertEqual(phase_timer.as_server_timing(), "route;dur=1.500, handler;dur=250.000")
+
+
+class RouterPhaseTiming(unittest.TestCase):
+
+    def _app(self, **kwargs):
+        from webtest import TestApp
+
+        return TestApp(app=rest.RequestRouter([
+            (r"/timed", _TimedHandler)
+        ], application_name="timing-test", **kwargs))
+
+    def test_disabled_by_default(self):
+        response = self._app().get("/timed")
+        self.assertNotIn("Server-Timing", response.headers)
+
+    def test_server_timing_header(self):
+        response = self._app(server_timing=True).get("/timed")
+
+        phases = [entry.split(";")[0] for entry in response.headers["Server-Timing"].split(", ")]
+        self.assertEqual(phases, ["request", "route", "parameters", "handler", "serialize", "dumps"])
+
+    def test_hook(self):
+        timers = []
+        self._app(phase_timing_hook=timers.append).post_json("/timed", {"id": 2})
+
+        self.assertEqual(len(timers), 1)
+        self.assertEqual(timers[0].label, "%s._TimedHandler" % __name__)
+        self.assertEqual(
+            [name for name, seconds in timers[0].phases],
+            ["request", "route", "body", "handler", "serialize", "dumps"]
+        )
+        self.assertFalse(timers[0].server_timing)
+
+    def test_hook_called_for_error_response(self):
+        timers = []
+        response = self._app(phase_timing_hook=timers.append).get("/missing", expect_errors=True)
+
+        self.assertEqual(response.status_int, STATUS.NOT_FOUND)
+        self.assertEqual(len(timers), 1)
+        self.assertIsNone(timers[0].label)
+        self.assertEqual([name for name, seconds in timers[0].phases], ["request", "route"])
@@ -160,6 +160,59 @@ class RESTRequestParsedBody(unittest.TestCase):
         self.assertEqual(request.parsed_body.first_name, "John")
         self.assertEqual(request.parsed_body.last_name, "Smith")
 
+    def test_get_partial_body(self):
+        request = Request(
+            environ={
+                "REQUEST_METHOD": VERB.PATCH,
+                "CONTENT_TYPE": "application/json"
+            },
+            charset="utf-8",
+            logger=logging.getLogger(),
+            deserializers=[JSON()],
+            default_deserializer=JSON()
+        )
+
+        class Person(types.Model):
+            first_name = types.String()
+            last_name = types.String()
+
+        self.assertFalse(request.partial_body)
+
+        request.body = b'{"last_name": "Smith"}'
+        request.partial_body = True
+        request.body_template = Person()
+        self.assertTrue(request.partial_body)
+        self.assertEqual(request.parsed_body.last_name, "Smith")
+        self.assertEqual(request.parsed_body.get_supplied_attribute_keys(), ["last_name"])
+
+    def test_get_lazy_body(self):
+        request = Request(
+            environ={
+                "REQUEST_METHOD": VERB.POST,
+                "CONTENT_TYPE": "application/json"
+            },
+            charset="utf-8",
+            logger=logging.getLogger(),
+            deserializers=[JSON()],
+            default_deserializer=JSON()
+        )
+
+        class Address(types.Model):
+            street = types.String(max_length=5)
+
+        class Person(types.Model):
+            name = types.String()
+            address = Address()
+
+        self.assertFalse(request.lazy_body)
+
+        request.body = b'{"name": "John", "address": {"street": "a long street"}}'
+        request.lazy_body = True
+        request.body_template = Person()
+        self.assertTrue(request.lazy_body)
+        self.assertEqual(request.parsed_body.name, "John")
+        self.assertRaises(exception.ValidationError, getattr, request.parsed_body, "address")
+
 
 class RESTRequestSupportedMimeTypes(unittest.TestCase):
     def test_supported_mime_types(self):
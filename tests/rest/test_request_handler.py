@@ -1,5 +1,19 @@
 import unittest
 
+from prestans.http import VERB
+from prestans import parser
+from prestans import provider
+from prestans.rest import RequestHandler
+from prestans import types
+
+
+class MyModel(types.Model):
+    id = types.Integer()
+
+
+class MyParameterSet(parser.ParameterSet):
+    offset = types.Integer(required=False)
+
 
 class RequestHandlerInit(unittest.TestCase):
 
@@ -17,3 +31,97 @@ class RequestHandlerCall(unittest.TestCase):
 
     def test_(self):
         pass
+
+
+class RequestHandlerVerbDispatch(unittest.TestCase):
+
+    def test_dispatch_table_resolved_at_class_definition(self):
+
+        class Handler(RequestHandler):
+            __parser_config__ = parser.Config(
+                GET=parser.VerbConfig(
+                    response_template=types.Array(element_template=MyModel()),
+                    response_attribute_filter_default_value=True,
+                    parameter_sets=[MyParameterSet()]
+                )
+            )
+
+            def get(self):
+                pass
+
+        verb_dispatch = Handler._verb_dispatch
+        self.assertEqual(
+            sorted(verb_dispatch.keys()),
+            sorted([VERB.GET, VERB.HEAD, VERB.POST, VERB.PUT, VERB.PATCH, VERB.DELETE, VERB.OPTIONS])
+        )
+
+        get_dispatch = verb_dispatch[VERB.GET]
+        self.assertEqual(get_dispatch.verb, VERB.GET)
+        self.assertIs(get_dispatch.method, Handler.__dict__["get"])
+        self.assertIs(get_dispatch.parser_config, Handler.__parser_config__.get)
+        self.assertIsInstance(get_dispatch.rewrite_template_model, MyModel)
+        self.assertEqual(len(get_dispatch.parameter_sets), 1)
+        self.assertFalse(get_dispatch.is_coroutine)
+
+        post_dispatch = verb_dispatch[VERB.POST]
+        self.assertIsNone(post_dispatch.parser_config)
+        self.assertIsNone(post_dispatch.response_template)
+        self.assertEqual(post_dispatch.parameter_sets, ())
+
+    def test_subclass_inherits_verb_methods(self):
+
+        class Handler(RequestHandler):
+            def get(self):
+                pass
+
+        class SubHandler(Handler):
+            pass
+
+        self.assertIs(SubHandler._verb_dispatch[VERB.GET].method, Handler.__dict__["get"])
+
+    def test_invalid_parser_config_fails_at_definition(self):
+
+        def define_handler():
+            class Handler(RequestHandler):
+                __parser_config__ = parser.VerbConfig()
+
+        self.assertRaises(TypeError, define_handler)
+
+    def test_invalid_provider_config_fails_at_definition(self):
+
+        def define_handler():
+            class Handler(RequestHandler):
+                __provider_config__ = object()
+
+        self.assertRaises(TypeError, define_handler)
+
+    def test_invalid_parameter_set_fails_at_definition(self):
+        verb_config = parser.VerbConfig(response_template=MyModel())
+        verb_config.parameter_sets.append("offset")
+
+        def define_handler():
+            class Handler(RequestHandler):
+                __parser_config__ = parser.Config(GET=verb_config)
+
+        self.assertRaises(TypeError, define_handler)
+
+    def test_reassigning_config_recompiles(self):
+
+        class Handler(RequestHandler):
+            pass
+
+        self.assertIsNone(Handler._verb_dispatch[VERB.GET].response_template)
+
+        Handler.__parser_config__ = parser.Config(GET=parser.VerbConfig(response_template=MyModel()))
+        self.assertIsInstance(Handler._verb_dispatch[VERB.GET].response_template, MyModel)
+
+    def test_default_provider_config_per_instance(self):
+
+        class Handler(RequestHandler):
+            pass
+
+        first = Handler(args=(), kwargs={}, request=None, response=None, logger=None, debug=False)
+        second = Handler(args=(), kwargs={}, request=None, response=None, logger=None, debug=False)
+
+        self.assertIsInstance(first.__provider_config__, provider.Config)
+        self.assertIsNot(first.__provider_config__, second.__provider_config__)
@@ -0,0 +1,232 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+
+from prestans import exception
+from prestans.http import STATUS
+from prestans import parser
+from prestans import provider
+from prestans.provider.auth import Base
+from prestans.provider.auth import login_required
+from prestans.provider.auth import role_required
+from prestans import rest
+from prestans import types
+from prestans.util import is_coroutine_function
+
+
+class MyModel(types.Model):
+    id = types.Integer()
+    thread = types.String(required=False)
+
+
+class SlowModel(MyModel):
+
+    def validate(self, value, attribute_filter=None, minified=False):
+        time.sleep(0.2)
+        return super(SlowModel, self).validate(value, attribute_filter, minified)
+
+
+class AuthProvider(Base):
+
+    def is_authenticated_user(self):
+        return self.request.headers.get("Authorization") is not None
+
+    def current_user_has_role(self, role_name):
+        return self.request.headers.get("Authorization") == role_name
+
+
+class _AsyncHandler(rest.RequestHandler):
+    __parser_config__ = parser.Config(
+        GET=parser.VerbConfig(
+            response_template=MyModel(),
+            response_attribute_filter_default_value=True
+        )
+    )
+
+    events = []
+
+    async def handler_will_run(self):
+        await asyncio.sleep(0)
+        self.events.append("will_run")
+
+    async def handler_did_run(self):
+        await asyncio.sleep(0)
+        self.events.append("did_run")
+
+    async def get(self, id):
+        await asyncio.sleep(0)
+        self.events.append("get")
+
+        model = MyModel()
+        model.id = id
+        model.thread = threading.current_thread().name
+        self.response.body = model
+
+
+class _AsyncFailingHandler(rest.RequestHandler):
+
+    async def get(self):
+        await asyncio.sleep(0)
+        raise exception.BadRequest("async bad request")
+
+    async def delete(self):
+        await asyncio.sleep(0)
+        raise ValueError("unexpected")
+
+
+class _AsyncSlowBodyHandler(rest.RequestHandler):
+    __parser_config__ = parser.Config(
+        POST=parser.VerbConfig(
+            body_template=SlowModel()
+        )
+    )
+
+    events = []
+
+    async def post(self):
+        await asyncio.sleep(0)
+        self.events.append(self.request.parsed_body.id)
+        self.response.status = STATUS.NO_CONTENT
+
+
+class _AsyncAuthHandler(rest.RequestHandler):
+    __provider_config__ = provider.Config(authentication=AuthProvider())
+
+    @login_required
+    async def get(self):
+        await asyncio.sleep(0)
+        self.response.status = STATUS.NO_CONTENT
+
+    @role_required("Admin")
+    async def delete(self):
+        await asyncio.sleep(0)
+        self.response.status = STATUS.NO_CONTENT
+
+
+def _router():
+    return rest.RequestRouter([
+        (r"/model/([0-9]+)", _AsyncHandler),
+        (r"/failing", _AsyncFailingHandler),
+        (r"/auth", _AsyncAuthHandler),
+        (r"/slow", _AsyncSlowBodyHandler)
+    ], application_name="async-test")
+
+
+class AsyncHandlerWSGI(unittest.TestCase):
+
+    def setUp(self):
+        from webtest import TestApp
+        self.app = TestApp(app=_router())
+        _AsyncHandler.events = []
+
+    def test_async_verb_and_hooks(self):
+        response = self.app.get("/model/42")
+        self.assertEqual(response.status_int, STATUS.OK)
+        self.assertEqual(response.json["id"], 42)
+        self.assertEqual(_AsyncHandler.events, ["will_run", "get", "did_run"])
+
+    def test_async_prestans_exception(self):
+        response = self.app.get("/failing", expect_errors=True)
+        self.assertEqual(response.status_int, STATUS.BAD_REQUEST)
+        self.assertEqual(response.json["message"], "async bad request")
+
+    def test_async_unhandled_exception(self):
+        response = self.app.delete("/failing", expect_errors=True)
+        self.assertEqual(response.status_int, STATUS.SERVICE_UNAVAILABLE)
+
+    def test_login_required(self):
+        response = self.app.get("/auth", expect_errors=True)
+        self.assertEqual(response.status_int, STATUS.UNAUTHORIZED)
+
+        response = self.app.get("/auth", headers={"Authorization": "User"})
+        self.assertEqual(response.status_int, STATUS.NO_CONTENT)
+
+    def test_role_required(self):
+        response = self.app.delete("/auth", headers={"Authorization": "User"}, expect_errors=True)
+        self.assertEqual(response.status_int, STATUS.FORBIDDEN)
+
+        response = self.app.delete("/auth", headers={"Authorization": "Admin"})
+        self.assertEqual(response.status_int, STATUS.NO_CONTENT)
+
+
+class AsyncHandlerASGI(unittest.TestCase):
+
+    def _get(self, path):
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "headers": [],
+            "server": ("testserver", 80)
+        }
+
+        asyncio.run(rest.ASGIApplication(_router())(scope, receive, send))
+        return sent
+
+    def test_runs_on_event_loop_thread(self):
+        _AsyncHandler.events = []
+        sent = self._get("/model/7")
+
+        self.assertEqual(sent[0]["status"], STATUS.OK)
+
+        body = json.loads(sent[1]["body"].decode("utf-8"))
+        self.assertEqual(body["id"], 7)
+        self.assertEqual(body["thread"], threading.current_thread().name)
+        self.assertEqual(_AsyncHandler.events, ["will_run", "get", "did_run"])
+
+    def test_async_prestans_exception(self):
+        sent = self._get("/failing")
+        self.assertEqual(sent[0]["status"], STATUS.BAD_REQUEST)
+
+    def test_body_parse_does_not_block_loop(self):
+        _AsyncSlowBodyHandler.events = []
+        application = rest.ASGIApplication(_router())
+        finished = []
+
+        async def request(method, path, body):
+
+            async def receive():
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    finished.append((path, message["status"]))
+
+            await application({
+                "type": "http",
+                "method": method,
+                "path": path,
+                "headers": [(b"content-type", b"application/json")],
+                "server": ("testserver", 80)
+            }, receive, send)
+
+        async def requests():
+            slow = asyncio.ensure_future(request("POST", "/slow", b'{"id": 1}'))
+
+            # lets the slow request start parsing its body
+            await asyncio.sleep(0.05)
+            await request("GET", "/model/1", b"")
+            await slow
+
+        asyncio.run(requests())
+
+        self.assertEqual(finished, [("/model/1", STATUS.OK), ("/slow", STATUS.NO_CONTENT)])
+        self.assertEqual(_AsyncSlowBodyHandler.events, [1])
+
+
+class IsCoroutineHandler(unittest.TestCase):
+
+    def test_decorated_handler_detected(self):
+        self.assertTrue(is_coroutine_function(_AsyncAuthHandler.get))
+        self.assertTrue(is_coroutine_function(_AsyncAuthHandler.delete))
+        self.assertFalse(is_coroutine_function(rest.RequestHandler.get))
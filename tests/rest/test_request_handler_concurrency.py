@@ -0,0 +1,98 @@
+import threading
+import time
+import unittest
+
+from prestans.http import STATUS
+from prestans import parser
+from prestans import provider
+from prestans.provider.auth import Base
+from prestans.provider.auth import login_required
+from prestans import rest
+from prestans import types
+
+
+class EchoModel(types.Model):
+    path_user = types.String()
+    header_user = types.String()
+
+
+class AuthProvider(Base):
+
+    def is_authenticated_user(self):
+        return self.request.headers.get("X-User") is not None
+
+    def current_user_has_role(self, role_name):
+        return False
+
+
+class _EchoHandler(rest.RequestHandler):
+    __parser_config__ = parser.Config(
+        GET=parser.VerbConfig(
+            response_template=EchoModel(),
+            response_attribute_filter_default_value=True
+        )
+    )
+
+    # shared by every request to this handler class
+    __provider_config__ = provider.Config(authentication=AuthProvider())
+
+    @login_required
+    def get(self, user):
+        # give other threads a chance to start a request in between
+        time.sleep(0.001)
+
+        model = EchoModel()
+        model.path_user = user
+        model.header_user = self.provider_authentication.request.headers["X-User"]
+        self.response.body = model
+
+
+class RequestHandlerConcurrency(unittest.TestCase):
+
+    THREADS = 16
+    REQUESTS_PER_THREAD = 25
+
+    def test_shared_provider_sees_own_request(self):
+        from webtest import TestApp
+
+        app = TestApp(app=rest.RequestRouter([
+            (r"/echo/([a-z0-9]+)", _EchoHandler)
+        ], application_name="concurrency-test"))
+
+        barrier = threading.Barrier(self.THREADS)
+        mismatches = []
+        errors = []
+
+        def worker(index):
+            barrier.wait()
+
+            for request_number in range(self.REQUESTS_PER_THREAD):
+                user = "user%dr%d" % (index, request_number)
+
+                try:
+                    response = app.get("/echo/" + user, headers={"X-User": user})
+                except Exception as exp:
+                    errors.append(exp)
+                    continue
+
+                if response.status_int != STATUS.OK or response.json["header_user"] != user:
+                    mismatches.append((user, response.status_int, response.body))
+
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(mismatches, [])
+
+    def test_provider_unbound_after_request(self):
+        from webtest import TestApp
+
+        app = TestApp(app=rest.RequestRouter([
+            (r"/echo/([a-z0-9]+)", _EchoHandler)
+        ], application_name="concurrency-test"))
+
+        app.get("/echo/user", headers={"X-User": "user"})
+        self.assertIsNone(_EchoHandler.__provider_config__.authentication.request)
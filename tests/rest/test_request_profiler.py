@@ -0,0 +1,88 @@
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+
+from prestans.http import STATUS
+from prestans import rest
+
+
+class _ProfiledHandler(rest.RequestHandler):
+
+    def get(self):
+        sum(range(100))
+        self.response.status = STATUS.NO_CONTENT
+
+
+class RequestProfilerUnitTest(unittest.TestCase):
+
+    def test_invalid_sample_rate(self):
+        self.assertRaises(ValueError, rest.RequestProfiler, "profiles", sample_rate=1.5)
+        self.assertRaises(ValueError, rest.RequestProfiler, "profiles", sample_rate=-0.1)
+
+    def test_should_sample(self):
+        self.assertFalse(rest.RequestProfiler("profiles").should_sample({"PATH_INFO": "/a"}))
+        self.assertTrue(rest.RequestProfiler("profiles", sample_rate=1).should_sample({"PATH_INFO": "/a"}))
+
+        by_path = rest.RequestProfiler("profiles", path_pattern=r"/slow")
+        self.assertTrue(by_path.should_sample({"PATH_INFO": "/slow/1"}))
+        self.assertFalse(by_path.should_sample({"PATH_INFO": "/fast"}))
+
+        by_header = rest.RequestProfiler("profiles", header="X-Profile")
+        self.assertTrue(by_header.should_sample({"PATH_INFO": "/a", "HTTP_X_PROFILE": "1"}))
+        self.assertFalse(by_header.should_sample({"PATH_INFO": "/a"}))
+
+    def test_one_profile_at_a_time(self):
+        profiler = rest.RequestProfiler("profiles")
+
+        profile = profiler.start()
+        self.assertIsNotNone(profile)
+        self.assertIsNone(profiler.start())
+
+        profiler.stop(profile, None)
+        profiler.stop(profiler.start(), None)
+
+        self.assertEqual(list(profiler.stats.keys()), ["unrouted"])
+
+
+class RouterProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.output_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_directory)
+
+    def _app(self, profiler):
+        from webtest import TestApp
+
+        return TestApp(app=rest.RequestRouter([
+            (r"/profiled", _ProfiledHandler)
+        ], application_name="profiler-test", profiler=profiler))
+
+    def test_stats_aggregated_per_handler(self):
+        profiler = rest.RequestProfiler(self.output_directory, header="X-Profile", dump_interval=3600)
+        app = self._app(profiler)
+
+        app.get("/profiled")
+        self.assertEqual(profiler.stats, {})
+
+        app.get("/profiled", headers={"X-Profile": "1"})
+        app.get("/profiled", headers={"X-Profile": "1"})
+
+        handler_name = "%s._ProfiledHandler" % __name__
+        self.assertEqual(list(profiler.stats.keys()), [handler_name])
+        self.assertEqual(os.listdir(self.output_directory), [])
+
+        paths = profiler.dump()
+        self.assertEqual(paths, [os.path.join(self.output_directory, "%s.pstats" % handler_name)])
+        self.assertTrue(os.path.isfile(paths[0]))
+        self.assertGreater(pstats.Stats(paths[0]).total_calls, 0)
+
+    def test_periodic_dump(self):
+        profiler = rest.RequestProfiler(self.output_directory, sample_rate=1, dump_interval=0)
+        self._app(profiler).get("/profiled")
+        profiler._dump_thread.join()
+
+        self.assertEqual(os.listdir(self.output_directory), ["%s._ProfiledHandler.pstats" % __name__])
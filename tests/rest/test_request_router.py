@@ -55,6 +55,10 @@ class _UserHandler(rest.RequestHandler):
         self.response.body = model
 
 
+class _NotASerializer(object):
+    pass
+
+
 class MockStartResponse:
     @classmethod
     def __call__(cls, status, response_headers, exc_info=None):
@@ -178,3 +182,103 @@ class RequestRouterTestCase(unittest.TestCase):
             route=match,
             assertion=assertion
         )
+
+
+class RequestRouterCompile(unittest.TestCase):
+
+    def test_route_map_compiled_once(self):
+        router = rest.RequestRouter([
+            (r"/some/path/([0-9]+)", _UserHandler)
+        ], application_name="test-router")
+
+        route_map = router.route_map
+        self.assertIsInstance(route_map, tuple)
+        self.assertEqual(len(route_map), 1)
+
+        regexp, handler_class = route_map[0]
+        self.assertEqual(regexp.pattern, r"^/some/path/([0-9]+)$")
+        self.assertEqual(handler_class, _UserHandler)
+
+        router(environ={
+            "REQUEST_METHOD": VERB.GET,
+            "PATH_INFO": "/some/path/123",
+            "wsgi.url_scheme": "http",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "1234"
+        }, start_response=MockStartResponse.__call__)
+
+        self.assertIs(router.route_map, route_map)
+
+    def test_compile_is_idempotent(self):
+        router = rest.RequestRouter([
+            (r"/some/path/([0-9]+)", _UserHandler)
+        ], application_name="test-router")
+
+        router.compile()
+        route_map = router.route_map
+        router.compile()
+        self.assertIs(router.route_map, route_map)
+
+    def test_compile_rejects_invalid_serializer(self):
+        router = rest.RequestRouter([], serializers=[_NotASerializer()], application_name="test-router")
+        self.assertRaises(TypeError, router.compile)
+
+    def test_compile_rejects_invalid_deserializer(self):
+        router = rest.RequestRouter([], deserializers=[_NotASerializer()], application_name="test-router")
+        self.assertRaises(TypeError, router.compile)
+
+    def test_compile_rejects_mixed_groups(self):
+        router = rest.RequestRouter([
+            (r"/some/(?P<name>[a-z]+)/([0-9]+)", _UserHandler)
+        ], application_name="test-router")
+        self.assertRaises(ValueError, router.compile)
+
+
+class RequestRouterRouteCache(unittest.TestCase):
+
+    environ = {
+        "REQUEST_METHOD": VERB.GET,
+        "PATH_INFO": "/some/path/123",
+        "wsgi.url_scheme": "http",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "1234"
+    }
+
+    def test_disabled_by_default(self):
+        router = rest.RequestRouter([
+            (r"/some/path/([0-9]+)", _UserHandler)
+        ], application_name="test-router")
+
+        router(environ=dict(self.environ), start_response=MockStartResponse.__call__)
+        router(environ=dict(self.environ), start_response=MockStartResponse.__call__)
+
+        self.assertEqual(router.route_cache_hits, 0)
+        self.assertEqual(router.route_cache_misses, 0)
+
+    def test_hits_and_misses(self):
+        from prestans.deserializer import JSON
+
+        router = rest.RequestRouter([
+            (r"/some/path/([0-9]+)", _UserHandler)
+        ], application_name="test-router", route_cache_size=10)
+
+        for _ in range(3):
+            response = router(environ=dict(self.environ), start_response=MockStartResponse.__call__)
+            self.assertEqual(JSON().loads(response[0])["id"], 123)
+
+        self.assertEqual(router.route_cache_misses, 1)
+        self.assertEqual(router.route_cache_hits, 2)
+
+    def test_unmatched_paths_not_cached(self):
+        router = rest.RequestRouter([
+            (r"/some/path/([0-9]+)", _UserHandler)
+        ], application_name="test-router", route_cache_size=10)
+
+        environ = dict(self.environ)
+        environ["PATH_INFO"] = "/missing"
+
+        router(environ=dict(environ), start_response=MockStartResponse.__call__)
+        router(environ=dict(environ), start_response=MockStartResponse.__call__)
+
+        self.assertEqual(router.route_cache_misses, 2)
+        self.assertEqual(router.route_cache_hits, 0)
@@ -1,9 +1,17 @@
+import json
 import logging
 import unittest
 
+from webob import Request
+
+from prestans.metrics import MetricsRegistry
+from prestans import parser
+from prestans.rest import RequestHandler
+from prestans.rest import RequestRouter
 from prestans.rest import Response
 from prestans.serializer import JSON
 from prestans.serializer import XMLPlist
+from prestans import types
 
 
 class ResponseInit(unittest.TestCase):
@@ -92,4 +100,109 @@ class ResponseMinify(unittest.TestCase):
             default_serializer=None
         )
         response.minify = True
-        self.assertTrue(response.minify)
\ No newline at end of file
+        self.assertTrue(response.minify)
+
+
+class StreamedUser(types.Model):
+    name = types.String()
+
+
+class _StreamHandler(RequestHandler):
+    __parser_config__ = parser.Config(
+        GET=parser.VerbConfig(
+            response_template=types.Array(element_template=StreamedUser()),
+            response_attribute_filter_default_value=True
+        )
+    )
+
+    def get(self):
+        def users():
+            for index in range(250):
+                if index % 2:
+                    yield StreamedUser(name="user%i" % index)
+                else:
+                    yield {"name": "user%i" % index}
+
+        self.response.body = types.LazyArray(users(), element_template=StreamedUser())
+
+
+class ResponseLazyArray(unittest.TestCase):
+
+    def test_body_accepts_lazy_array(self):
+        response = Response(
+            charset="utf=8",
+            logger=logging.basicConfig(),
+            serializers=[JSON()],
+            default_serializer=None
+        )
+        response.template = types.Array(element_template=StreamedUser())
+        response.body = types.LazyArray([], element_template=StreamedUser())
+
+        self.assertRaises(TypeError, setattr, response, "body", types.LazyArray([], element_template=types.String()))
+
+    def test_body_accepts_array_view(self):
+        response = Response(
+            charset="utf=8",
+            logger=logging.basicConfig(),
+            serializers=[JSON()],
+            default_serializer=None
+        )
+        response.template = types.Array(element_template=StreamedUser())
+        response.body = types.Array(element_template=StreamedUser()).view(0, 10)
+
+    def test_streamed_without_content_length(self):
+        router = RequestRouter([
+            (r"/users", _StreamHandler)
+        ], application_name="stream-test")
+
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started["status"] = status
+            started["headers"] = dict(headers)
+
+        chunks = list(router(Request.blank("/users").environ, start_response))
+
+        self.assertEqual(started["status"], "200 OK")
+        self.assertNotIn("Content-Length", started["headers"])
+        self.assertGreater(len(chunks), 2)
+
+        users = json.loads(b"".join(chunks).decode("utf-8"))
+        self.assertEqual(len(users), 250)
+        self.assertEqual(users[0], {"name": "user0"})
+        self.assertEqual(users[249], {"name": "user249"})
+
+    def test_streamed_response_started_before_iteration(self):
+        router = RequestRouter([
+            (r"/users", _StreamHandler)
+        ], application_name="stream-test")
+
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started["status"] = status
+
+        app_iter = router(Request.blank("/users").environ, start_response)
+
+        self.assertEqual(started["status"], "200 OK")
+        self.assertEqual(len(json.loads(b"".join(app_iter).decode("utf-8"))), 250)
+
+    def test_streamed_metrics_recorded_on_close(self):
+        metrics = MetricsRegistry()
+        router = RequestRouter([
+            (r"/users", _StreamHandler)
+        ], application_name="stream-test", metrics=metrics)
+
+        def requests_total():
+            return metrics.get("prestans_requests_total").value((
+                "%s._StreamHandler" % __name__, "GET", "200"
+            ))
+
+        app_iter = router(Request.blank("/users").environ, lambda status, headers, exc_info=None: None)
+        list(app_iter)
+
+        self.assertEqual(requests_total(), 0)
+
+        app_iter.close()
+
+        self.assertEqual(requests_total(), 1)
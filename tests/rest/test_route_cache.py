@@ -0,0 +1,61 @@
+import unittest
+
+from prestans.rest import RouteCache
+
+
+class _Handler(object):
+    pass
+
+
+class RouteCacheTest(unittest.TestCase):
+
+    def test_max_size_must_be_positive(self):
+        self.assertRaises(ValueError, RouteCache, 0)
+        self.assertRaises(ValueError, RouteCache, -1)
+
+    def test_get_and_put(self):
+        route_cache = RouteCache(2)
+        self.assertEqual(route_cache.max_size, 2)
+
+        self.assertIsNone(route_cache.get("/a"))
+        self.assertEqual(route_cache.misses, 1)
+        self.assertEqual(route_cache.hits, 0)
+
+        route_cache.put("/a", _Handler, ("1",), {})
+        self.assertEqual(route_cache.get("/a"), (_Handler, ("1",), {}))
+        self.assertEqual(route_cache.hits, 1)
+        self.assertEqual(route_cache.misses, 1)
+
+    def test_kwargs_are_copied(self):
+        route_cache = RouteCache(2)
+        route_cache.put("/a", _Handler, (), {"id": "1"})
+
+        handler_class, args, kwargs = route_cache.get("/a")
+        kwargs["id"] = "2"
+
+        handler_class, args, kwargs = route_cache.get("/a")
+        self.assertEqual(kwargs, {"id": "1"})
+
+    def test_least_recently_used_evicted(self):
+        route_cache = RouteCache(2)
+        route_cache.put("/a", _Handler, (), {})
+        route_cache.put("/b", _Handler, (), {})
+
+        # touch /a so that /b is the least recently used
+        route_cache.get("/a")
+        route_cache.put("/c", _Handler, (), {})
+
+        self.assertEqual(len(route_cache), 2)
+        self.assertIsNotNone(route_cache.get("/a"))
+        self.assertIsNone(route_cache.get("/b"))
+        self.assertIsNotNone(route_cache.get("/c"))
+
+    def test_clear(self):
+        route_cache = RouteCache(2)
+        route_cache.put("/a", _Handler, (), {})
+        route_cache.get("/a")
+        route_cache.clear()
+
+        self.assertEqual(len(route_cache), 0)
+        self.assertEqual(route_cache.hits, 0)
+        self.assertEqual(route_cache.misses, 0)
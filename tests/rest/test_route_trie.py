@@ -0,0 +1,126 @@
+import unittest
+
+from prestans.rest import RequestRouter
+from prestans.rest import RouteTrie
+
+
+class _HandlerA(object):
+    pass
+
+
+class _HandlerB(object):
+    pass
+
+
+class _HandlerC(object):
+    pass
+
+
+def _linear_match(route_map, path):
+    for regexp, handler_class in route_map:
+        match = regexp.match(path)
+        if match:
+            return regexp, handler_class, match
+    return None
+
+
+class RouteTrieLiteralPrefix(unittest.TestCase):
+
+    def test_static_route(self):
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/config$"), "/api/config")
+
+    def test_dynamic_segment(self):
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/user/([0-9]+)$"), "/api/user/")
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/user/(?P<id>[0-9]+)$"), "/api/user/")
+
+    def test_escaped_characters(self):
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/file\.json$"), "/api/file.json")
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/\d+$"), "/api/")
+
+    def test_quantifiers(self):
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/users?$"), "/api/user")
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/a*$"), "/api/")
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/a{2}$"), "/api/")
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/a+b$"), "/api/a")
+
+    def test_alternation(self):
+        self.assertEqual(RouteTrie.literal_prefix(r"^/a|/b$"), "")
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/(a|b)$"), "/api/")
+        self.assertEqual(RouteTrie.literal_prefix(r"^/api/[a|b]$"), "/api/")
+
+    def test_inline_flags(self):
+        self.assertEqual(RouteTrie.literal_prefix(r"(?i)^/api$"), "")
+
+
+class RouteTrieMatch(unittest.TestCase):
+
+    def setUp(self):
+        self.route_map = RequestRouter.generate_route_map([
+            (r"/api/user/me", _HandlerA),
+            (r"/api/user/([0-9]+)", _HandlerB),
+            (r"/api/user/(?P<name>[a-z]+)", _HandlerC),
+            (r"/api/users?", _HandlerA),
+            (r"/api/(.*)", _HandlerC),
+            (r"/", _HandlerB)
+        ])
+        self.route_trie = RouteTrie(self.route_map, min_routes=0)
+
+    def test_len(self):
+        self.assertEqual(len(self.route_trie), 6)
+
+    def test_registration_order_wins(self):
+        regexp, handler_class, match = self.route_trie.match("/api/user/me")
+        self.assertEqual(handler_class, _HandlerA)
+
+    def test_args_and_kwargs(self):
+        regexp, handler_class, match = self.route_trie.match("/api/user/123")
+        self.assertEqual(handler_class, _HandlerB)
+        self.assertEqual(match.groups(), ("123",))
+
+        regexp, handler_class, match = self.route_trie.match("/api/user/jane")
+        self.assertEqual(handler_class, _HandlerC)
+        self.assertEqual(match.groupdict(), {"name": "jane"})
+
+    def test_no_match(self):
+        self.assertIsNone(self.route_trie.match("/other"))
+        self.assertIsNone(self.route_trie.match(""))
+
+    def test_same_result_as_linear_scan(self):
+        paths = [
+            "", "/", "/api", "/api/", "/api/user", "/api/users", "/api/user/",
+            "/api/user/me", "/api/user/me/", "/api/user/42", "/api/user/abc",
+            "/api/anything/else", "/apix", "/other"
+        ]
+
+        for path in paths:
+            expected = _linear_match(self.route_map, path)
+            actual = self.route_trie.match(path)
+
+            if expected is None:
+                self.assertIsNone(actual, path)
+            else:
+                self.assertEqual(expected[0], actual[0], path)
+                self.assertEqual(expected[1], actual[1], path)
+                self.assertEqual(expected[2].groups(), actual[2].groups(), path)
+
+
+class RouteTrieLinearScan(unittest.TestCase):
+
+    def setUp(self):
+        self.route_map = RequestRouter.generate_route_map([
+            (r"/api/user/me", _HandlerA),
+            (r"/api/user/([0-9]+)", _HandlerB),
+            (r"/", _HandlerC)
+        ])
+
+    def test_small_route_map_scanned(self):
+        route_trie = RouteTrie(self.route_map)
+
+        self.assertEqual(route_trie.candidates("/other"), [0, 1, 2])
+        self.assertEqual(route_trie.match("/api/user/42")[1], _HandlerB)
+        self.assertEqual(route_trie.match("/")[1], _HandlerC)
+        self.assertIsNone(route_trie.match("/other"))
+
+    def test_indexed_at_min_routes(self):
+        route_trie = RouteTrie(self.route_map, min_routes=3)
+        self.assertEqual(route_trie.candidates("/other"), [2])
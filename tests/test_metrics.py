@@ -0,0 +1,132 @@
+import threading
+import unittest
+
+from prestans.metrics import Counter
+from prestans.metrics import Histogram
+from prestans.metrics import MetricsRegistry
+
+
+class CounterUnitTest(unittest.TestCase):
+
+    def test_inc(self):
+        counter = Counter("requests_total", "Requests", ("verb",))
+        counter.inc(("GET",))
+        counter.inc(("GET",), 2)
+        counter.inc(("POST",))
+
+        self.assertEqual(counter.value(("GET",)), 3)
+        self.assertEqual(counter.value(("PUT",)), 0)
+        self.assertEqual(counter.collect(), {("GET",): 3, ("POST",): 1})
+
+    def test_threads_are_merged(self):
+        counter = Counter("requests_total", "Requests", ("verb",))
+
+        def worker():
+            for _ in range(1000):
+                counter.inc(("GET",))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter.value(("GET",)), 8000)
+
+    def test_exited_threads_are_retired(self):
+        counter = Counter("requests_total", "Requests", ("verb",))
+
+        for _ in range(8):
+            thread = threading.Thread(target=counter.inc, args=(("GET",),))
+            thread.start()
+            thread.join()
+
+        counter.inc(("GET",))
+
+        self.assertEqual(len(counter._shards), 1)
+        self.assertEqual(counter.value(("GET",)), 9)
+        self.assertEqual(counter.collect(), {("GET",): 9})
+
+    def test_exposition(self):
+        counter = Counter("requests_total", "Requests", ("verb", "path"))
+        counter.inc(("GET", "/a\"b"))
+
+        self.assertEqual(counter.exposition(), "\n".join([
+            "# HELP requests_total Requests",
+            "# TYPE requests_total counter",
+            "requests_total{verb=\"GET\",path=\"/a\\\"b\"} 1.0",
+            ""
+        ]))
+
+
+class HistogramUnitTest(unittest.TestCase):
+
+    def test_observe(self):
+        histogram = Histogram("duration_seconds", "Duration", ("verb",), (1, 0.5))
+        self.assertEqual(histogram.buckets, (0.5, 1))
+
+        for value in (0.1, 0.5, 0.75, 2):
+            histogram.observe(value, ("GET",))
+
+        cumulative, count, total = histogram.collect()[("GET",)]
+        self.assertEqual(cumulative, [2, 3, 4])
+        self.assertEqual(count, 4)
+        self.assertAlmostEqual(total, 3.35)
+
+    def test_exited_threads_are_retired(self):
+        histogram = Histogram("duration_seconds", "Duration", (), (1,))
+
+        for value in (0.5, 2):
+            thread = threading.Thread(target=histogram.observe, args=(value,))
+            thread.start()
+            thread.join()
+
+        cumulative, count, total = histogram.collect()[()]
+        self.assertEqual(histogram._shards, [])
+        self.assertEqual(cumulative, [1, 2])
+        self.assertEqual(count, 2)
+        self.assertEqual(total, 2.5)
+
+    def test_exposition(self):
+        histogram = Histogram("size_bytes", "Size", (), (10,))
+        histogram.observe(5)
+        histogram.observe(50)
+
+        self.assertEqual(histogram.exposition(), "\n".join([
+            "# HELP size_bytes Size",
+            "# TYPE size_bytes histogram",
+            "size_bytes_bucket{le=\"10.0\"} 1",
+            "size_bytes_bucket{le=\"+Inf\"} 2",
+            "size_bytes_count 2",
+            "size_bytes_sum 55.0",
+            ""
+        ]))
+
+
+class MetricsRegistryUnitTest(unittest.TestCase):
+
+    def test_get_or_create(self):
+        registry = MetricsRegistry()
+
+        counter = registry.counter("requests_total", "Requests", ("verb",))
+        self.assertIs(registry.counter("requests_total", "Requests", ("verb",)), counter)
+        self.assertIs(registry.get("requests_total"), counter)
+        self.assertIsNone(registry.get("missing"))
+
+        histogram = registry.histogram("duration_seconds", "Duration")
+        self.assertEqual(histogram.buckets, MetricsRegistry.DURATION_BUCKETS)
+
+    def test_conflicting_registration(self):
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests", ("verb",))
+
+        self.assertRaises(ValueError, registry.histogram, "requests_total", "Requests", ("verb",))
+        self.assertRaises(ValueError, registry.counter, "requests_total", "Requests", ("status",))
+
+    def test_exposition_sorted_by_name(self):
+        registry = MetricsRegistry()
+        registry.counter("b_total", "B").inc()
+        registry.counter("a_total", "A").inc()
+
+        exposition = registry.exposition()
+        self.assertTrue(exposition.index("a_total") < exposition.index("b_total"))
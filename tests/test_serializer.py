@@ -34,6 +34,15 @@ class SerializerJSONUnitTest(unittest.TestCase):
 
         self.assertRaises(exception.SerializationFailedError, JSON().dumps, PythonObject)
 
+    def test_dumps_chunks(self):
+        self.assertEqual("".join(JSON().dumps_chunks([])), "[]")
+        self.assertEqual("".join(JSON().dumps_chunks([[1, {"b": 2, "a": 1}], [], [3]])), JSON().dumps([1, {"a": 1, "b": 2}, 3]))
+
+        class PythonObject(object):
+            pass
+
+        self.assertRaises(exception.SerializationFailedError, list, JSON().dumps_chunks([[PythonObject()]]))
+
     def test_handler_body_type(self):
         self.assertEqual(JSON().handler_body_type(), DataCollection)
 
@@ -67,6 +76,9 @@ class SerializerPListUnitTest(unittest.TestCase):
 
         self.assertRaises(exception.SerializationFailedError, XMLPlist().dumps, PythonObject)
 
+    def test_dumps_chunks(self):
+        self.assertEqual(list(XMLPlist().dumps_chunks([[1], [2, 3]])), [XMLPlist().dumps([1, 2, 3])])
+
     def test_handler_body_type(self):
         self.assertEqual(XMLPlist().handler_body_type(), DataCollection)
 
@@ -483,3 +483,170 @@ class ArrayGetAttributeFilter(unittest.TestCase):
         self.assertTrue("cat" in attribute_filter)
         self.assertFalse("dog" in attribute_filter)
         self.assertTrue(attribute_filter.cat)
+
+
+class ArrayTypedStorage(unittest.TestCase):
+
+    def test_scalar_storage(self):
+        import array
+
+        self.assertIsInstance(types.Array(element_template=types.Integer())._array_elements, array.array)
+        self.assertIsInstance(types.Array(element_template=types.Float())._array_elements, array.array)
+        self.assertIsInstance(types.Array(element_template=types.Boolean())._array_elements, array.array)
+        self.assertIsInstance(types.Array(element_template=types.String())._array_elements, list)
+
+    def test_validate(self):
+        integers = types.Array(element_template=types.Integer()).validate([1, "2", 3])
+        self.assertEqual(integers.as_serializable(), [1, 2, 3])
+        self.assertEqual(integers[1:], [2, 3])
+
+        floats = types.Array(element_template=types.Float()).validate([1, 2.5])
+        self.assertEqual(floats.as_serializable(), [1.0, 2.5])
+        self.assertIsInstance(floats[0], float)
+
+        booleans = types.Array(element_template=types.Boolean()).validate([True, False])
+        self.assertEqual(booleans.as_serializable(), [True, False])
+        self.assertEqual(list(booleans), [True, False])
+        self.assertIs(booleans[0], True)
+
+    def test_validate_constraints(self):
+        array = types.Array(element_template=types.Integer(minimum=1, maximum=5, choices=[1, 3, 5]))
+        self.assertEqual(array.validate([1, 3, 5]).as_serializable(), [1, 3, 5])
+        self.assertRaises(exception.LessThanMinimumError, array.validate, [1, 0])
+        self.assertRaises(exception.MoreThanMaximumError, array.validate, [6, 1])
+        self.assertRaises(exception.InvalidChoiceError, array.validate, [1, 2])
+
+        array = types.Array(element_template=types.Float(minimum=0.0, maximum=1.0))
+        self.assertRaises(exception.LessThanMinimumError, array.validate, [0.5, -0.5])
+        self.assertRaises(exception.ParseFailedError, array.validate, [0.5, "x"])
+
+        array = types.Array(element_template=types.Boolean())
+        self.assertRaises(exception.ParseFailedError, array.validate, [True, 1])
+        self.assertRaises(exception.RequiredAttributeError, array.validate, [True, None])
+
+    def test_append_honours_template(self):
+        array = types.Array(element_template=types.Integer(maximum=5))
+        array.append(5)
+        self.assertRaises(exception.MoreThanMaximumError, array.append, 6)
+        self.assertEqual(array.as_serializable(), [5])
+
+    def test_large_integers_fall_back_to_list(self):
+        array = types.Array(element_template=types.Integer())
+        array.append(1)
+        array.append(2 ** 70)
+        self.assertIsInstance(array._array_elements, list)
+        self.assertEqual(array.as_serializable(), [1, 2 ** 70])
+
+        validated = types.Array(element_template=types.Integer()).validate([2 ** 70])
+        self.assertEqual(validated.as_serializable(), [2 ** 70])
+
+    def test_copy_template(self):
+        array = types.Array(element_template=types.Boolean()).validate([True])
+        copied = array._copy_template()
+        copied.append(False)
+
+        self.assertEqual(array.as_serializable(), [True])
+        self.assertEqual(copied.as_serializable(), [True, False])
+
+
+class ArrayExtend(unittest.TestCase):
+
+    def test_extend_data_type(self):
+        array = types.Array(element_template=types.Integer(maximum=10))
+        array.append(1)
+        array.extend([2, "3"])
+        array.extend((4,))
+        self.assertEqual(array.as_serializable(), [1, 2, 3, 4])
+
+        self.assertRaises(exception.MoreThanMaximumError, array.extend, [5, 11])
+        self.assertRaises(TypeError, array.extend, 5)
+        self.assertEqual(len(array), 4)
+
+        strings = types.Array(element_template=types.String())
+        strings.extend(["cat", "dog"])
+        self.assertEqual(strings.as_serializable(), ["cat", "dog"])
+
+    def test_extend_model(self):
+        class MyModel(types.Model):
+            name = types.String()
+
+        array = types.Array(element_template=MyModel())
+        array.extend([MyModel(name="alice"), MyModel(name="bob")])
+        self.assertEqual(array.as_serializable(), [{"name": "alice"}, {"name": "bob"}])
+
+        self.assertRaises(TypeError, array.extend, [MyModel(name="carol"), {"name": "dave"}])
+        self.assertEqual(len(array), 2)
+
+    def test_extend_max_length_checked_first(self):
+        array = types.Array(element_template=types.Integer(), max_length=3)
+        array.append(1)
+
+        self.assertRaises(exception.MoreThanMaximumError, array.extend, ["x", "y", "z"])
+        self.assertEqual(array.as_serializable(), [1])
+
+    def test_extend_mixed_storage(self):
+        array = types.Array(element_template=types.Integer())
+        array.extend([1, 2])
+        array.extend([2 ** 70])
+        array.extend([3])
+        self.assertEqual(array.as_serializable(), [1, 2, 2 ** 70, 3])
+
+    def test_validate_length_checked_first(self):
+        array = types.Array(element_template=types.Integer(), min_length=2, max_length=3)
+        self.assertRaises(exception.LessThanMinimumError, array.validate, ["x"])
+        self.assertRaises(exception.MoreThanMaximumError, array.validate, ["w", "x", "y", "z"])
+        self.assertRaises(exception.ParseFailedError, array.validate, ["x", "y"])
+
+
+class ArrayViewUnitTest(unittest.TestCase):
+
+    def setUp(self):
+        self.array = types.Array(element_template=types.Integer())
+        self.array.extend(list(range(10)))
+
+    def test_window(self):
+        view = self.array.view(2, 6)
+        self.assertIsInstance(view, types.ArrayView)
+        self.assertEqual(len(view), 4)
+        self.assertEqual(list(view), [2, 3, 4, 5])
+        self.assertEqual(view[0], 2)
+        self.assertEqual(view[-1], 5)
+        self.assertEqual(view[1:3], [3, 4])
+        self.assertTrue(4 in view)
+        self.assertFalse(6 in view)
+        self.assertRaises(IndexError, view.__getitem__, 4)
+        self.assertEqual(view.as_serializable(), [2, 3, 4, 5])
+
+    def test_bounds(self):
+        self.assertEqual(list(self.array.view(8)), [8, 9])
+        self.assertEqual(list(self.array.view(-3, -1)), [7, 8])
+        self.assertEqual(list(self.array.view(20, 30)), [])
+        self.assertEqual(list(self.array.view(6, 2)), [])
+        self.assertEqual(list(self.array.view(2, 8).view(1, -1)), [3, 4, 5, 6])
+
+    def test_shares_storage(self):
+        view = self.array.view(8)
+        self.array.remove(9)
+        self.assertEqual(list(view), [8])
+
+        self.array.append(10)
+        self.assertEqual(list(view), [8, 10])
+
+    def test_read_only(self):
+        view = self.array.view()
+        self.assertRaises(TypeError, view.append, 1)
+        self.assertRaises(TypeError, view.extend, [1])
+        self.assertRaises(TypeError, view.remove, 1)
+        self.assertRaises(TypeError, view.validate, [1])
+
+    def test_models(self):
+        class MyModel(types.Model):
+            name = types.String()
+
+        array = types.Array(element_template=MyModel())
+        array.extend([MyModel(name="alice"), MyModel(name="bob"), MyModel(name="carol")])
+
+        view = array.view(1)
+        self.assertIs(view[0], array[1])
+        self.assertEqual(view.as_serializable(), [{"name": "bob"}, {"name": "carol"}])
+        self.assertEqual(view.as_serializable(minified=True), [{"a": "bob"}, {"a": "carol"}])
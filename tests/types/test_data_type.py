@@ -1,5 +1,9 @@
+import copy
+import pickle
 import unittest
 
+from prestans import exception
+from prestans import types
 from prestans.types import DataType
 
 
@@ -9,4 +13,39 @@ class DataTypeUnitTest(unittest.TestCase):
         self.assertRaises(NotImplementedError, DataType().blueprint)
 
     def test_validate(self):
-        self.assertRaises(NotImplementedError, DataType().validate, "data")
\ No newline at end of file
+        self.assertRaises(NotImplementedError, DataType().validate, "data")
+
+
+class CompiledDataTypeUnitTest(unittest.TestCase):
+
+    def test_validator_stored_on_instance(self):
+        integer = types.Integer(maximum=5)
+        self.assertEqual(integer.validate(3), 3)
+        self.assertIn("validate", integer.__dict__)
+        self.assertEqual(integer.validate("4"), 4)
+
+    def test_recompiled_when_attribute_changes(self):
+        integer = types.Integer(required=False)
+        self.assertIsNone(integer.validate(None))
+
+        types.Array(element_template=integer)
+        self.assertRaises(exception.RequiredAttributeError, integer.validate, None)
+
+    def test_subclass_validate_respected(self):
+        class Upper(types.String):
+
+            def validate(self, value):
+                return super(Upper, self).validate(value).upper()
+
+        upper = Upper()
+        self.assertEqual(upper.validate("abc"), "ABC")
+        self.assertEqual(upper.validate("def"), "DEF")
+        self.assertNotIn("validate", upper.__dict__)
+
+    def test_copy_and_pickle(self):
+        string = types.String(max_length=3)
+        string.validate("abc")
+
+        for copied in [copy.copy(string), copy.deepcopy(string), pickle.loads(pickle.dumps(string))]:
+            self.assertEqual(copied.validate("xyz"), "xyz")
+            self.assertRaises(exception.MaximumLengthError, copied.validate, "wxyz")
@@ -0,0 +1,66 @@
+import unittest
+
+from prestans import exception
+from prestans import types
+
+
+class Person(types.Model):
+    name = types.String(max_length=5)
+
+
+class LazyArrayConsume(unittest.TestCase):
+
+    def test_validates_as_consumed(self):
+        consumed = []
+
+        def people():
+            for name in ["alice", "bob", "carol"]:
+                consumed.append(name)
+                yield {"name": name}
+
+        lazy = types.LazyArray(people(), element_template=Person(), chunk_size=2)
+        self.assertEqual(consumed, [])
+
+        chunks = lazy.as_serializable_chunks()
+        self.assertEqual(next(chunks), [{"name": "alice"}, {"name": "bob"}])
+        self.assertEqual(consumed, ["alice", "bob"])
+        self.assertEqual(list(chunks), [[{"name": "carol"}]])
+
+    def test_models_used_as_is(self):
+        alice = Person(name="alice")
+        lazy = types.LazyArray(iter([alice]), element_template=Person())
+        self.assertIs(list(lazy)[0], alice)
+
+    def test_invalid_element(self):
+        lazy = types.LazyArray([{"name": "alice"}, {"name": "too long"}], element_template=Person())
+        self.assertRaises(exception.ValidationError, lazy.as_serializable)
+
+    def test_scalars(self):
+        lazy = types.LazyArray(range(5), element_template=types.Integer(maximum=10))
+        self.assertEqual(lazy.as_serializable(), [0, 1, 2, 3, 4])
+
+        lazy = types.LazyArray(range(20), element_template=types.Integer(maximum=10))
+        self.assertRaises(exception.MoreThanMaximumError, lazy.as_serializable)
+
+    def test_lengths(self):
+        lazy = types.LazyArray(range(5), element_template=types.Integer(), max_length=4, chunk_size=2)
+        self.assertRaises(exception.MoreThanMaximumError, lazy.as_serializable)
+
+        lazy = types.LazyArray(range(5), element_template=types.Integer(), min_length=6)
+        self.assertRaises(exception.LessThanMinimumError, lazy.as_serializable)
+
+    def test_attribute_filter_and_minified(self):
+        attribute_filter = Person().get_attribute_filter(False)
+
+        lazy = types.LazyArray([Person(name="alice")], element_template=Person())
+        self.assertEqual(lazy.as_serializable(attribute_filter.as_immutable()), [{}])
+
+        lazy = types.LazyArray([Person(name="alice")], element_template=Person())
+        self.assertEqual(lazy.as_serializable(minified=True), [{"a": "alice"}])
+
+    def test_unsupported(self):
+        lazy = types.LazyArray([], element_template=types.Integer())
+        self.assertRaises(TypeError, len, lazy)
+        self.assertRaises(TypeError, lazy.__getitem__, 0)
+        self.assertRaises(TypeError, lazy.append, 1)
+        self.assertRaises(TypeError, lazy.validate, [1])
@@ -1,3 +1,6 @@
+import copy
+import pickle
+import sys
 import unittest
 
 from prestans import exception
@@ -233,6 +236,32 @@ class ModelUnitTest(unittest.TestCase):
         self.assertTrue("another" in multi_base)
         self.assertFalse("missing" in multi_base)
 
+    def test_contains_only_fields(self):
+        class MyModel(types.Model):
+            name = types.String()
+            version = 1
+
+        self.assertFalse("validate" in MyModel())
+        self.assertFalse("version" in MyModel())
+        self.assertFalse("_attributes" in MyModel())
+
+        MyModel.age = types.Integer()
+        self.assertTrue("age" in MyModel())
+
+    def test_has_field(self):
+        class MyModel(types.Model):
+            name = types.String()
+
+        class Child(MyModel):
+            age = types.Integer()
+
+        self.assertTrue(MyModel.has_field("name"))
+        self.assertTrue(MyModel().has_field("name"))
+        self.assertTrue(Child.has_field("name"))
+        self.assertTrue(Child.has_field("age"))
+        self.assertFalse(MyModel.has_field("age"))
+        self.assertFalse(MyModel.has_field("validate"))
+
     def test_generate_attribute_token_rewrite_map(self):
         class MyModel(types.Model):
             boolean = types.Boolean()
@@ -731,3 +760,427 @@ class ModelValidate(unittest.TestCase):
 
         person = Person(first_name="john")
         self.assertRaises(exception.ValidationError, Person().validate, person.as_serializable())
+
+
+class ModelFieldTable(unittest.TestCase):
+
+    def test_fields_computed_per_class(self):
+        class Person(types.Model):
+            last_name = types.String()
+            first_name = types.String()
+            version = 1
+
+            def full_name(self):
+                return "%s %s" % (self.first_name, self.last_name)
+
+        self.assertEqual(
+            [name for name, member in Person.__model_fields__],
+            ["first_name", "last_name"]
+        )
+        self.assertEqual(
+            [name for name, member in Person().getmembers()],
+            ["first_name", "last_name", "version"]
+        )
+        self.assertEqual(Person().attribute_count(), 2)
+        self.assertEqual(types.Model.__model_fields__, ())
+
+    def test_fields_inherited(self):
+        class Person(types.Model):
+            name = types.String()
+
+        class Employee(Person):
+            employee_id = types.Integer()
+
+        self.assertEqual(Employee().get_attribute_keys(), ["employee_id", "name"])
+        self.assertEqual(Person().get_attribute_keys(), ["name"])
+
+    def test_fields_rebuilt_when_class_changes(self):
+        class Person(types.Model):
+            name = types.String()
+
+        class Employee(Person):
+            employee_id = types.Integer()
+
+        Person.age = types.Integer(required=False)
+        self.assertEqual(Person().get_attribute_keys(), ["age", "name"])
+        self.assertEqual(Employee().get_attribute_keys(), ["age", "employee_id", "name"])
+
+        del Person.age
+        self.assertEqual(Employee().get_attribute_keys(), ["employee_id", "name"])
+
+
+class ModelRewriteMaps(unittest.TestCase):
+
+    def test_maps_shared_per_class(self):
+        class Person(types.Model):
+            first_name = types.String()
+            last_name = types.String()
+
+        rewrite_map = Person().attribute_rewrite_map()
+        self.assertIs(Person().attribute_rewrite_map(), rewrite_map)
+        self.assertIs(Person().attribute_rewrite_reverse_map(), Person().attribute_rewrite_reverse_map())
+        self.assertIs(Person().generate_attribute_token_rewrite_map(), Person().generate_attribute_token_rewrite_map())
+        self.assertEqual(Person().attribute_rewrite_reverse_map(), {"a_c": "first_name", "b_c": "last_name"})
+
+    @unittest.skipIf(sys.version_info < (3, 3), "rewrite maps are plain dicts on python 2")
+    def test_maps_read_only(self):
+        class Person(types.Model):
+            name = types.String()
+
+        def rewrite():
+            Person().attribute_rewrite_map()["name"] = "x"
+
+        self.assertRaises(TypeError, rewrite)
+
+    def test_maps_rebuilt_when_class_changes(self):
+        class Person(types.Model):
+            name = types.String()
+
+        class Employee(Person):
+            employee_id = types.Integer()
+
+        self.assertEqual(Person().attribute_rewrite_map(), {"name": "a"})
+        self.assertEqual(Employee().attribute_rewrite_map(), {"employee_id": "a_b", "name": "c"})
+
+        Person.age = types.Integer(required=False)
+        self.assertEqual(Person().attribute_rewrite_map(), {"age": "a", "name": "b"})
+        self.assertEqual(Employee().attribute_rewrite_map(), {"age": "a", "employee_id": "b_c", "name": "d"})
+
+    def test_blueprint_publishes_rewrite_map(self):
+        class Person(types.Model):
+            first_name = types.String()
+            last_name = types.String()
+
+        blueprint = Person().blueprint()
+        self.assertEqual(blueprint["rewrite_map"], {"first_name": "a_c", "last_name": "b_c"})
+        self.assertIsInstance(blueprint["rewrite_map"], dict)
+
+
+class CompactPerson(types.Model):
+    __compact_storage__ = True
+
+    name = types.String()
+    age = types.Integer(required=False)
+    tags = types.Array(element_template=types.String(), required=False)
+
+
+class ModelCompactStorage(unittest.TestCase):
+
+    def test_templates_shared_by_class(self):
+        class Person(types.Model):
+            name = types.String()
+
+        self.assertIs(Person.__model_templates__["name"], Person.name)
+        self.assertFalse(hasattr(Person(), "_templates"))
+        self.assertEqual([name for name, member in Person().getmembers()], ["name"])
+
+    def test_compact_instances_have_no_dict(self):
+        person = CompactPerson(name="john")
+
+        self.assertFalse(hasattr(person, "__dict__"))
+        self.assertRaises(AttributeError, setattr, person, "_extra", 1)
+        self.assertTrue(hasattr(types.Model(), "_attributes"))
+
+    def test_compact_inherited(self):
+        class Employee(CompactPerson):
+            employee_id = types.Integer(required=False)
+
+        employee = Employee(name="jane", employee_id=3)
+        self.assertFalse(hasattr(employee, "__dict__"))
+        self.assertEqual(employee.employee_id, 3)
+
+    def test_compact_requires_slotted_bases(self):
+        class Person(types.Model):
+            name = types.String()
+
+        def define():
+            class Employee(Person):
+                __compact_storage__ = True
+
+        self.assertRaises(TypeError, define)
+
+    def test_compact_semantics_unchanged(self):
+        person = CompactPerson().validate({"name": "john", "age": 30, "tags": ["a"]})
+        self.assertEqual(person.name, "john")
+        self.assertEqual(person.age, 30)
+
+        person.tags.append("b")
+        self.assertEqual(person.as_serializable(), {"name": "john", "age": 30, "tags": ["a", "b"]})
+
+        person.age = 31
+        self.assertRaises(KeyError, setattr, person, "missing", 1)
+
+        copied = copy.deepcopy(person)
+        self.assertEqual(copied.as_serializable(), person.as_serializable())
+
+        unpickled = pickle.loads(pickle.dumps(person))
+        self.assertEqual(unpickled.as_serializable(), person.as_serializable())
+        self.assertEqual(CompactPerson(required=False).validate(None), None)
+
+
+class ModelTemplateCopies(unittest.TestCase):
+
+    def test_nested_values_share_templates(self):
+        class Tag(types.Model):
+            name = types.String()
+
+        class Address(types.Model):
+            city = types.String(default="Sydney")
+
+        class Person(types.Model):
+            address = Address()
+            tags = types.Array(element_template=Tag())
+
+        first = Person()
+        second = Person()
+
+        self.assertIsNot(first.address, Person.address)
+        self.assertIsNot(first.address, second.address)
+        self.assertIs(first.tags.element_template, Person.tags.element_template)
+        self.assertEqual(first.address.city, "Sydney")
+
+        first.address.city = "Melbourne"
+        first.tags.append(Tag(name="tag"))
+        self.assertEqual(second.address.city, "Sydney")
+        self.assertEqual(len(second.tags), 0)
+        self.assertEqual(len(Person.tags), 0)
+        self.assertEqual(Person.address.city, "Sydney")
+
+    def test_template_values_copied(self):
+        class Address(types.Model):
+            city = types.String(required=False)
+
+        class Location(types.Model):
+            address = Address()
+
+        class Person(types.Model):
+            location = Location()
+
+        Person.location.address.city = "Sydney"
+
+        person = Person()
+        self.assertEqual(person.location.address.city, "Sydney")
+        self.assertIsNot(person.location.address, Person.location.address)
+
+        person.location.address.city = "Melbourne"
+        self.assertEqual(Person.location.address.city, "Sydney")
+
+    def test_instance_state_copied(self):
+        class Address(types.Model):
+            city = types.String(required=False)
+
+            def __init__(self, *args, **kwargs):
+                super(Address, self).__init__(*args, **kwargs)
+                self._source = "template"
+
+        class Person(types.Model):
+            address = Address()
+
+        self.assertEqual(Person().address._source, "template")
+
+    def test_constant_defaults_computed_once(self):
+        class Person(types.Model):
+            name = types.String(default="john")
+            created = types.DateTime(default=types.DateTime.NOW)
+            address = types.Array(element_template=types.String(), required=False)
+
+        self.assertEqual(Person().name, "john")
+
+        constants, variables = Person.__model_defaults__
+        self.assertEqual(constants, {"name": "john", "address": None})
+        self.assertEqual([name for name, type_instance in variables], ["created"])
+        self.assertEqual(Person(name="jane").name, "jane")
+
+        Person.age = types.Integer(default=3)
+        self.assertIsNone(Person.__model_defaults__)
+        self.assertEqual(Person().age, 3)
+
+
+class TrustedAddress(types.Model):
+    street = types.String(max_length=5)
+
+
+class TrustedPerson(types.Model):
+    name = types.String(max_length=5)
+    age = types.Integer(required=False)
+    address = TrustedAddress(required=False)
+    addresses = types.Array(element_template=TrustedAddress(), required=False)
+    tags = types.Array(element_template=types.String(), required=False)
+
+
+class ModelFromTrusted(unittest.TestCase):
+
+    def tearDown(self):
+        types.Model.__validate_trusted__ = False
+
+    def test_values_not_validated(self):
+        person = TrustedPerson.from_trusted({"name": "a long name"}, age=30)
+
+        self.assertEqual(person.name, "a long name")
+        self.assertEqual(person.age, 30)
+        self.assertEqual(person.tags.as_serializable(), [])
+
+    def test_nested_python_data(self):
+        address = TrustedAddress.from_trusted(street="main")
+        person = TrustedPerson.from_trusted({
+            "address": {"street": "a long street"},
+            "tags": ["a", "b"],
+            "addresses": [address, {"street": "other"}]
+        })
+
+        self.assertIsInstance(person.address, TrustedAddress)
+        self.assertEqual(person.address.street, "a long street")
+        self.assertEqual(person.tags.as_serializable(), ["a", "b"])
+        self.assertIs(person.addresses[0], address)
+        self.assertEqual(person.addresses[1].street, "other")
+        self.assertIs(person.addresses.element_template, TrustedPerson.addresses.element_template)
+
+    def test_unknown_attribute(self):
+        self.assertRaises(KeyError, TrustedPerson.from_trusted, {"missing": 1})
+
+    def test_debug_mode_validates(self):
+        types.Model.__validate_trusted__ = True
+
+        self.assertRaises(exception.ValidationError, TrustedPerson.from_trusted, {"name": "a long name"})
+        self.assertEqual(TrustedPerson.from_trusted({"tags": ["a"]}).tags.as_serializable(), ["a"])
+
+
+class PartialAddress(types.Model):
+    street = types.String()
+    city = types.String(max_length=10)
+
+
+class PartialPerson(types.Model):
+    first_name = types.String()
+    last_name = types.String()
+    age = types.Integer(minimum=0, default=1)
+    address = PartialAddress()
+    tags = types.Array(element_template=types.String(), min_length=1)
+
+
+class ModelValidatePartial(unittest.TestCase):
+
+    def test_only_supplied_attributes_validated(self):
+        person = PartialPerson().validate_partial({"last_name": "Smith", "age": 30})
+
+        self.assertEqual(person.last_name, "Smith")
+        self.assertEqual(person.age, 30)
+        self.assertIsNone(person.first_name)
+        self.assertEqual(person.get_supplied_attribute_keys(), ["age", "last_name"])
+
+        self.assertRaises(exception.ValidationError, PartialPerson().validate, {"last_name": "Smith"})
+
+    def test_nested_models_partial(self):
+        person = PartialPerson().validate_partial({"address": {"city": "Sydney"}})
+
+        self.assertEqual(person.address.city, "Sydney")
+        self.assertEqual(person.get_supplied_attribute_keys(), ["address"])
+        self.assertEqual(person.address.get_supplied_attribute_keys(), ["city"])
+
+    def test_arrays_validated_in_full(self):
+        self.assertRaises(exception.ValidationError, PartialPerson().validate_partial, {"tags": []})
+        self.assertEqual(PartialPerson().validate_partial({"tags": ["a"]}).tags.as_serializable(), ["a"])
+
+    def test_supplied_values_validated(self):
+        self.assertRaises(exception.ValidationError, PartialPerson().validate_partial, {"age": -1})
+        self.assertRaises(exception.ValidationError, PartialPerson().validate_partial, {"first_name": None})
+        self.assertRaises(exception.ValidationError, PartialPerson().validate_partial,
+                          {"address": {"city": "a very long city"}})
+        self.assertRaises(exception.RequiredAttributeError, PartialPerson().validate_partial, None)
+
+    def test_unknown_and_filtered_attributes_ignored(self):
+        from prestans.parser import AttributeFilter
+
+        attribute_filter = AttributeFilter.from_model(PartialPerson(), default_value=True)
+        attribute_filter.age = False
+
+        person = PartialPerson().validate_partial({"age": 3, "missing": 1, "last_name": "Smith"}, attribute_filter)
+        self.assertEqual(person.get_supplied_attribute_keys(), ["last_name"])
+        self.assertEqual(person.age, 1)
+
+    def test_minified(self):
+        rewrite_map = PartialPerson().attribute_rewrite_map()
+
+        person = PartialPerson().validate_partial({rewrite_map["last_name"]: "Smith"}, minified=True)
+        self.assertEqual(person.last_name, "Smith")
+        self.assertEqual(person.get_supplied_attribute_keys(), ["last_name"])
+
+    def test_array_of_partial_models(self):
+        people = types.Array(element_template=PartialPerson()).validate_partial([{"age": 3}, {"last_name": "Smith"}])
+
+        self.assertEqual(people[0].get_supplied_attribute_keys(), ["age"])
+        self.assertEqual(people[1].get_supplied_attribute_keys(), ["last_name"])
+
+    def test_fully_validated_model_has_no_supplied_keys(self):
+        self.assertIsNone(PartialAddress().validate({"street": "a", "city": "b"}).get_supplied_attribute_keys())
+        self.assertIsNone(PartialAddress().get_supplied_attribute_keys())
+
+
+class LazyChild(types.Model):
+    name = types.String(max_length=5)
+
+
+class LazyParent(types.Model):
+    title = types.String()
+    child = LazyChild(required=False)
+    children = types.Array(element_template=LazyChild(), required=False, max_length=2)
+
+
+class ModelValidateLazy(unittest.TestCase):
+
+    def test_collections_validated_on_access(self):
+        parent = LazyParent().validate_lazy({
+            "title": "title",
+            "child": {"name": "a long name"},
+            "children": [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+        })
+
+        self.assertEqual(parent.title, "title")
+        self.assertRaises(exception.ValidationError, getattr, parent, "child")
+        self.assertRaises(exception.ValidationError, getattr, parent, "children")
+
+    def test_scalars_and_missing_collections_validated_eagerly(self):
+        self.assertRaises(exception.ValidationError, LazyParent().validate_lazy, {"child": {"name": "a"}})
+
+        class Required(types.Model):
+            child = LazyChild()
+
+        self.assertRaises(exception.ValidationError, Required().validate_lazy, {})
+
+    def test_validated_once(self):
+        parent = LazyParent().validate_lazy({"title": "title", "child": {"name": "a"}})
+
+        self.assertIs(parent.child, parent.child)
+        self.assertEqual(parent.child.name, "a")
+
+    def test_validate_all(self):
+        parent = LazyParent().validate_lazy({"title": "title", "children": [{"name": "a"}]})
+        self.assertIs(parent.validate_all(), parent)
+        self.assertEqual(parent.children[0].name, "a")
+
+        nested = LazyParent().validate_lazy({"title": "title", "children": [{"name": "a long name"}]})
+        self.assertRaises(exception.ValidationError, nested.validate_all)
+
+    def test_serializes_like_eager_validation(self):
+        value = {
+            "title": "title",
+            "child": {"name": "a"},
+            "children": [{"name": "b"}]
+        }
+
+        expected = LazyParent().validate(value).as_serializable()
+
+        for compiled in (True, False):
+            types.Model.__compiled_serialization__ = compiled
+            try:
+                self.assertEqual(LazyParent().validate_lazy(value).as_serializable(), expected)
+            finally:
+                types.Model.__compiled_serialization__ = True
+
+    def test_array_of_lazy_models(self):
+        children = types.Array(element_template=LazyParent()).validate_lazy([
+            {"title": "title", "child": {"name": "a long name"}}
+        ])
+
+        self.assertEqual(children[0].title, "title")
+        self.assertRaises(exception.ValidationError, getattr, children[0], "child")
@@ -0,0 +1,321 @@
+import datetime
+import re
+import unittest
+
+from prestans import exception
+from prestans.types import model_compiler
+from prestans import types
+
+
+class Child(types.Model):
+    name = types.String(min_length=2, max_length=5, required=False)
+    code = types.String(format=r"^[a-z]+$", default="abc")
+    kind = types.String(choices=["a", "b"], required=False, default="a")
+    count = types.Integer(minimum=1, maximum=10, required=False)
+    level = types.Integer(default=3, choices=[1, 2, 3])
+    ratio = types.Float(minimum=0.0, maximum=1.0, required=False)
+    score = types.Float(default=0.5)
+    flag = types.Boolean(required=False)
+    enabled = types.Boolean(default=True)
+    confirmed = types.Boolean()
+    created = types.DateTime(required=False)
+
+
+class Parent(types.Model):
+    title = types.String()
+    child = Child(required=False)
+    children = types.Array(element_template=Child(), required=False)
+
+
+def _validate(template, value, attribute_filter=None, minified=False):
+    try:
+        validated = template.validate(value, attribute_filter, minified)
+    except (exception.Base, TypeError) as exp:
+        return exp.__class__, str(exp), getattr(exp, "stack_trace", None)
+
+    if validated is None:
+        return None
+
+    return validated.as_serializable()
+
+
+class ModelCompilerEquivalence(unittest.TestCase):
+
+    def tearDown(self):
+        types.Model.__compiled_validation__ = True
+
+    def assertEquivalent(self, template, value, attribute_filter=None, minified=False):
+        types.Model.__compiled_validation__ = True
+        compiled = _validate(template, value, attribute_filter, minified)
+
+        types.Model.__compiled_validation__ = False
+        interpreted = _validate(template, value, attribute_filter, minified)
+
+        self.assertEqual(compiled, interpreted)
+        return compiled
+
+    def test_valid_input(self):
+        child = {"name": " ab ", "count": "4", "ratio": 1, "confirmed": False, "created": "2020-01-01 10:00:00"}
+
+        serialized = self.assertEquivalent(Parent(), {"title": "t", "child": child, "children": [child, child]})
+        self.assertEqual(serialized["child"]["name"], "ab")
+        self.assertEqual(serialized["child"]["code"], "abc")
+        self.assertEqual(serialized["child"]["level"], 3)
+        self.assertEqual(len(serialized["children"]), 2)
+
+    def test_invalid_input(self):
+        for child in [
+            {"confirmed": True, "name": "abcdef"},
+            {"confirmed": True, "name": "a"},
+            {"confirmed": True, "code": "ABC"},
+            {"confirmed": True, "kind": "c"},
+            {"confirmed": True, "count": 0},
+            {"confirmed": True, "count": "x"},
+            {"confirmed": True, "level": 4},
+            {"confirmed": True, "ratio": 2},
+            {"confirmed": True, "score": "x"},
+            {"confirmed": True, "flag": "true"},
+            {"confirmed": None},
+            {"name": "abc"}
+        ]:
+            result = self.assertEquivalent(Parent(), {"title": "t", "child": child})
+            self.assertEqual(result[0], exception.ValidationError)
+
+        result = self.assertEquivalent(Parent(), {"title": "  "})
+        self.assertEqual(result[0], exception.ValidationError)
+
+        result = self.assertEquivalent(Parent(), "not a dictionary")
+        self.assertEqual(result[0], exception.RequiredAttributeError)
+
+        self.assertIsNone(self.assertEquivalent(Child(required=False), {}))
+
+    def test_attribute_filter(self):
+        attribute_filter = Parent().get_attribute_filter(True)
+        attribute_filter.title = False
+        attribute_filter.child.name = False
+
+        serialized = self.assertEquivalent(
+            Parent(),
+            {"child": {"name": "abc", "confirmed": True}},
+            attribute_filter
+        )
+        self.assertIsNone(serialized["title"])
+        self.assertIsNone(serialized["child"]["name"])
+
+    def test_minified(self):
+        child = Child(name="abc", confirmed=True)
+        value = {"title": "t", "child": child.as_serializable(minified=True)}
+
+        value = dict((Parent().attribute_rewrite_map()[key], item) for key, item in value.items())
+
+        serialized = self.assertEquivalent(Parent(), value, minified=True)
+        self.assertEqual(serialized["child"]["name"], "abc")
+
+    def test_invalid_format_fails_only_when_present(self):
+        class Person(types.Model):
+            name = types.String()
+            code = types.String(format="(", required=False)
+
+        serialized = self.assertEquivalent(Person(), {"name": "a"})
+        self.assertIsNone(serialized["code"])
+
+        for compiled_validation in (True, False):
+            types.Model.__compiled_validation__ = compiled_validation
+            self.assertRaises(re.error, Person().validate, {"name": "a", "code": "b"})
+
+
+class ModelCompilerCache(unittest.TestCase):
+
+    def tearDown(self):
+        types.Model.__compiled_validation__ = True
+
+    def test_cached_per_class_and_minified(self):
+        template = Child()
+
+        validator = model_compiler.validator_for(template, False)
+        self.assertIs(model_compiler.validator_for(template, False), validator)
+        self.assertIsNot(model_compiler.validator_for(template, True), validator)
+
+    def test_switch_falls_back_to_interpreted(self):
+        Child().validate({"confirmed": True})
+        self.assertNotEqual(model_compiler._validators, {})
+
+        types.Model.__compiled_validation__ = False
+        self.assertEqual(model_compiler._validators, {})
+
+        Child().validate({"confirmed": True})
+        self.assertEqual(model_compiler._validators, {})
+
+    def test_discarded_when_class_changes(self):
+        class Person(types.Model):
+            name = types.String()
+
+        Person().validate({"name": "john"})
+
+        Person.age = types.Integer(required=False)
+        self.assertEqual(Person().validate({"name": "john", "age": 3}).age, 3)
+
+    def test_non_data_type_member_falls_back(self):
+        class Person(types.Model):
+            name = types.String()
+            version = 1
+
+        self.assertIsNone(model_compiler.validator_for(Person(), False))
+        self.assertRaises(TypeError, Person().validate, {"name": "john"})
+
+    def test_self_referencing_model(self):
+        class Node(types.Model):
+            name = types.String()
+
+        Node.parent = Node(required=False)
+
+        node = Node().validate({"name": "child", "parent": {"name": "parent"}})
+        self.assertEqual(node.parent.name, "parent")
+        self.assertIsNone(node.parent._attributes["parent"])
+
+    def test_custom_init_and_validate_respected(self):
+        class Person(types.Model):
+            name = types.String()
+
+            def __init__(self, *args, **kwargs):
+                super(Person, self).__init__(*args, **kwargs)
+                self._initialised = True
+
+        class Upper(types.Model):
+            name = types.String()
+
+            def validate(self, value, attribute_filter=None, minified=False):
+                validated = super(Upper, self).validate(value, attribute_filter, minified)
+                validated.name = validated.name.upper()
+                return validated
+
+        class Team(types.Model):
+            leader = Person()
+            member = Upper()
+
+        team = Team().validate({"leader": {"name": "john"}, "member": {"name": "jane"}})
+        self.assertTrue(team.leader._initialised)
+        self.assertEqual(team.member.name, "JANE")
+
+
+def _serialize(model, attribute_filter=None, minified=False):
+    types.Model.__compiled_serialization__ = False
+    interpreted = model.as_serializable(attribute_filter, minified)
+
+    types.Model.__compiled_serialization__ = True
+    compiled = model.as_serializable(attribute_filter, minified)
+
+    return interpreted, compiled
+
+
+def _parent():
+    return Parent().validate({
+        "title": "parent",
+        "child": {"name": "abc", "count": 4, "confirmed": False},
+        "children": [{"confirmed": True}, {"name": "xy", "ratio": 0.5, "confirmed": False}]
+    })
+
+
+class ModelSerializerEquivalence(unittest.TestCase):
+
+    def tearDown(self):
+        types.Model.__compiled_serialization__ = True
+
+    def assertEquivalent(self, model, attribute_filter=None, minified=False):
+        interpreted, compiled = _serialize(model, attribute_filter, minified)
+        self.assertEqual(compiled, interpreted)
+        return compiled
+
+    def test_nested_models_and_arrays(self):
+        serialized = self.assertEquivalent(_parent())
+        self.assertEqual(serialized["children"][1]["name"], "xy")
+
+        self.assertEquivalent(Parent(title="empty"))
+        self.assertEquivalent(types.Array(element_template=Child(), required=False))
+
+    def test_minified(self):
+        serialized = self.assertEquivalent(_parent(), minified=True)
+        self.assertNotIn("title", serialized)
+
+    def test_attribute_filter(self):
+        attribute_filter = Parent().get_attribute_filter(True)
+        attribute_filter.title = False
+        attribute_filter.child.name = False
+        attribute_filter.children.count = False
+
+        immutable = attribute_filter.as_immutable()
+
+        serialized = self.assertEquivalent(_parent(), immutable)
+        self.assertNotIn("title", serialized)
+        self.assertNotIn("name", serialized["child"])
+        self.assertNotIn("count", serialized["children"][0])
+
+        self.assertEquivalent(_parent(), attribute_filter)
+        self.assertEquivalent(_parent(), immutable, minified=True)
+
+    def test_data_structure(self):
+        child = Child(confirmed=True, created=datetime.datetime(2020, 1, 1, 10))
+        serialized = self.assertEquivalent(child)
+        self.assertEqual(serialized["created"], "2020-01-01 10:00:00")
+
+
+class ModelSerializerCache(unittest.TestCase):
+
+    def tearDown(self):
+        types.Model.__compiled_serialization__ = True
+
+    def test_cached_per_filter_shape(self):
+        first = Parent().get_attribute_filter(True)
+        first.title = False
+
+        second = Parent().get_attribute_filter(True)
+        second.title = False
+
+        serializer = model_compiler.serializer_for(Parent(), False, first.as_immutable())
+        self.assertIs(model_compiler.serializer_for(Parent(), False, second.as_immutable()), serializer)
+        self.assertIsNot(model_compiler.serializer_for(Parent(), False, None), serializer)
+        self.assertIsNot(model_compiler.serializer_for(Parent(), True, first.as_immutable()), serializer)
+
+    def test_switch_falls_back_to_interpreted(self):
+        _parent().as_serializable()
+        self.assertNotEqual(model_compiler._serializers, {})
+
+        types.Model.__compiled_serialization__ = False
+        self.assertEqual(model_compiler._serializers, {})
+
+        _parent().as_serializable()
+        self.assertEqual(model_compiler._serializers, {})
+
+    def test_limit_falls_back_to_interpreted(self):
+        limit = model_compiler.MAX_SERIALIZERS
+        model_compiler.clear()
+
+        try:
+            model_compiler.MAX_SERIALIZERS = 0
+            self.assertIsNone(model_compiler.serializer_for(Child(), False, None))
+            self.assertEqual(Child(confirmed=True).as_serializable()["confirmed"], True)
+        finally:
+            model_compiler.MAX_SERIALIZERS = limit
+
+    def test_custom_as_serializable_respected(self):
+        class Upper(types.Model):
+            name = types.String()
+
+            def as_serializable(self, attribute_filter=None, minified=False):
+                serialized = super(Upper, self).as_serializable(attribute_filter, minified)
+                serialized["name"] = serialized["name"].upper()
+                return serialized
+
+        class Team(types.Model):
+            leader = Upper()
+            members = types.Array(element_template=Upper())
+
+        self.assertFalse(model_compiler.uses_model_serializer(Upper))
+
+        team = Team()
+        team.leader = Upper(name="john")
+        team.members.append(Upper(name="jane"))
+
+        serialized = team.as_serializable()
+        self.assertEqual(serialized["leader"]["name"], "JOHN")
+        self.assertEqual(serialized["members"][0]["name"], "JANE")
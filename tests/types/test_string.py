@@ -1,3 +1,4 @@
+import re
 import unittest
 
 from prestans import exception
@@ -53,6 +54,12 @@ class StringUnitTest(unittest.TestCase):
         self.assertEqual(string.validate("12abcde123"), "12abcde123")
         self.assertEqual(string.validate("89uwxyz789"), "89uwxyz789")
 
+    def test_invalid_format(self):
+        string = String(format="[a-z", required=False)
+        self.assertIsNone(string.validate(None))
+        self.assertEqual(string.validate(""), "")
+        self.assertRaises(re.error, string.validate, "abc")
+
     def test_choices(self):
         choices = ["apple", "banana"]
         string = String(choices=choices)